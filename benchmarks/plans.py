@@ -0,0 +1,96 @@
+"""
+Compare the generated decode/encode/validate plans with booby's generic implementation.
+
+Usage::
+
+    python benchmarks/plans.py [--items 10000] [--fields 30]
+
+The ``validate`` case is skipped if booby's validators cannot run on the
+current interpreter (booby 0.7.0 from PyPI refers to ``basestring``, so
+fails on Python 3).
+"""
+import argparse
+import os
+import sys
+import timeit
+
+# Allow running from a checkout without installing repose
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from booby.mixins import Encoder
+from booby.models import Model
+
+from repose import Resource, fields
+
+
+def make_resource(num_fields):
+    """Create a wide resource class with a mix of field types
+    """
+    attrs = {'id': fields.Integer()}
+    for i in range(num_fields):
+        kind = i % 3
+        if kind == 0:
+            attrs['name_{}'.format(i)] = fields.String()
+        elif kind == 1:
+            attrs['count_{}'.format(i)] = fields.Integer()
+        else:
+            attrs['tags_{}'.format(i)] = fields.List()
+    return type('Wide', (Resource,), attrs)
+
+
+def make_data(resource, num_items):
+    item = {}
+    for name in resource._fields:
+        if name.startswith('name'):
+            item[name] = 'value'
+        elif name.startswith('tags'):
+            item[name] = ['a', 'b']
+        else:
+            item[name] = 42
+    return [dict(item, id=i) for i in range(num_items)]
+
+
+def run(num_items, num_fields, repeat=3):
+    resource = make_resource(num_fields)
+    data = make_data(resource, num_items)
+    instances = [resource(**resource.decode(d)) for d in data]
+
+    cases = [
+        ('decode', lambda: [Model.decode.__func__(resource, d) for d in data],
+                   lambda: [resource.decode(d) for d in data]),
+        ('encode', lambda: [Encoder.encode(r) for r in instances],
+                   lambda: [r.encode() for r in instances]),
+        ('validate', lambda: [Model.validate(r) for r in instances],
+                     lambda: [r.validate() for r in instances]),
+    ]
+    try:
+        Model.validate(instances[0])
+    except NameError:
+        cases = [case for case in cases if case[0] != 'validate']
+
+    results = {}
+    for name, generic, planned in cases:
+        generic_time = min(timeit.repeat(generic, number=1, repeat=repeat))
+        planned_time = min(timeit.repeat(planned, number=1, repeat=repeat))
+        results[name] = dict(generic=generic_time, plan=planned_time,
+                             speedup=generic_time / planned_time)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--items', type=int, default=10000)
+    parser.add_argument('--fields', type=int, default=30)
+    args = parser.parse_args()
+
+    results = run(args.items, args.fields)
+    print('{} items, {} fields'.format(args.items, args.fields + 1))
+    for name, result in sorted(results.items()):
+        print('{:<10} generic {generic:.3f}s  plan {plan:.3f}s  ({speedup:.1f}x)'.format(
+            name, **result))
+    if 'validate' not in results:
+        print('validate   skipped, as booby\'s validators fail on this interpreter')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,208 @@
+"""
+An in-process stand-in API server serving synthetic resources.
+
+Used by ``benchmarks/suite.py``, but can also be run on its own::
+
+    python benchmarks/server.py [--items 1000] [--fields 10] [--depth 1]
+                                [--latency 0] [--pages 1] [--port 8000]
+
+The server provides the following endpoints:
+
+* ``GET /item`` - All items, or a single page if the ``page`` and ``per_page``
+  params are given, or specific items if the ``ids`` param is given
+  (Eg: ``/item?ids=1,2,3``)
+* ``GET /item/{item_id}`` - A single item
+* ``PUT /item/{item_id}`` - Update an item, returning the updated item
+* ``GET /group/{group_id}`` - A group listing the ID of every item
+  in its ``members`` field
+
+Each item has ``fields`` additional fields and contains a ``child`` object,
+which itself contains a ``child``, and so on, ``depth`` levels deep.
+"""
+import argparse
+import json
+import math
+import threading
+import time
+
+from six.moves import BaseHTTPServer, socketserver
+from six.moves.urllib.parse import parse_qs, urlparse
+
+
+def make_item(item_id, num_fields, depth):
+    """Create the data for a single item
+    """
+    item = {'id': item_id}
+    for i in range(num_fields):
+        kind = i % 3
+        if kind == 0:
+            item['name_{}'.format(i)] = 'value {}'.format(item_id)
+        elif kind == 1:
+            item['count_{}'.format(i)] = item_id * i
+        else:
+            item['tags_{}'.format(i)] = ['a', 'b']
+    if depth > 0:
+        item['child'] = make_item(item_id, num_fields, depth - 1)
+    return item
+
+
+class _Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # The headers and body are written separately, so avoid delaying the body
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_PUT(self):
+        self._handle('PUT')
+
+    def _handle(self, method):
+        stand_in = self.server.stand_in
+        url = urlparse(self.path)
+        params = dict((k, v[-1]) for k, v in parse_qs(url.query).items())
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+
+        if stand_in.latency:
+            time.sleep(stand_in.latency)
+        status, data = stand_in.route(method, url.path.strip('/').split('/'), params, body)
+
+        content = json.dumps(data).encode('utf8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandInServer(object):
+    """ Serve synthetic resources over HTTP from a background thread
+
+    For example::
+
+        with StandInServer(items=5000, pages=10) as server:
+            my_api = Api(base_url=server.url)
+            ...
+
+    Attributes:
+
+        url (str): The server's base URL, once started
+        per_page (int): The number of items on each page
+        requests (int): The number of requests served so far
+    """
+
+    def __init__(self, items=1000, fields=10, depth=1, latency=0.0, pages=1,
+                 host='127.0.0.1', port=0):
+        """ Initialise the server
+
+        Args:
+
+            items (int): The number of items to serve
+            fields (int): The number of additional fields on each item
+            depth (int): How deeply each item's ``child`` objects are nested
+            latency (float): Seconds to wait before responding to each request
+            pages (int): The number of pages the items are split into when
+                requested with the ``page`` and ``per_page`` params
+            host (str): The host to listen on
+            port (int): The port to listen on. ``0`` to pick any free port.
+        """
+        self.latency = latency
+        self.pages = pages
+        self.per_page = int(math.ceil(items / float(max(pages, 1)))) or 1
+        self.items = [make_item(i, fields, depth) for i in range(1, items + 1)]
+        self.by_id = dict((item['id'], item) for item in self.items)
+        self.requests = 0
+        self.url = None
+        self._address = (host, port)
+        self._server = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        self._server = _Server(self._address, _Handler)
+        self._server.stand_in = self
+        self.url = 'http://{}:{}'.format(*self._server.server_address[:2])
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def route(self, method, path, params, body):
+        """ Handle a single request
+
+        Returns:
+
+            tuple: The ``(status, data)`` of the response
+        """
+        with self._lock:
+            self.requests += 1
+
+        if path == ['item'] and method == 'GET':
+            if 'ids' in params:
+                ids = [int(id) for id in params['ids'].split(',') if id]
+                return 200, [self.by_id[id] for id in ids if id in self.by_id]
+            if 'page' in params:
+                per_page = int(params.get('per_page', self.per_page))
+                start = (int(params['page']) - 1) * per_page
+                return 200, self.items[start:start + per_page]
+            return 200, self.items
+
+        if len(path) == 2 and path[0] == 'item' and path[1].isdigit():
+            item = self.by_id.get(int(path[1]))
+            if item is None:
+                return 404, {'error': 'Not found'}
+            if method == 'PUT':
+                item.update(json.loads(body.decode('utf8')) if body else {})
+            return 200, item
+
+        if len(path) == 2 and path[0] == 'group' and method == 'GET':
+            return 200, {'id': int(path[1]), 'members': [item['id'] for item in self.items]}
+
+        return 404, {'error': 'Not found'}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--items', type=int, default=1000)
+    parser.add_argument('--fields', type=int, default=10)
+    parser.add_argument('--depth', type=int, default=1)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--pages', type=int, default=1)
+    parser.add_argument('--port', type=int, default=8000)
+    args = parser.parse_args()
+
+    server = StandInServer(items=args.items, fields=args.fields, depth=args.depth,
+                           latency=args.latency, pages=args.pages, port=args.port)
+    with server:
+        print('Serving {} items at {}'.format(args.items, server.url))
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
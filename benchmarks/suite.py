@@ -0,0 +1,249 @@
+"""
+Measure the throughput and latency of common operations against a stand-in API server.
+
+A local server serving synthetic resources is started in-process (see
+``benchmarks/server.py``), and each operation is timed against it.
+
+Usage::
+
+    python benchmarks/suite.py [--items 1000] [--fields 10] [--depth 1]
+                               [--latency 0] [--pages 1] [--requests 100]
+                               [--repeat 3] [--output results.json]
+                               [--compare previous.json]
+
+The operations measured are:
+
+* ``get`` - ``Item.objects.get()`` for ``--requests`` items in turn
+* ``all`` - ``Item.objects.all()``, fetching every page
+* ``iterate`` - Iterating over ``Item.objects`` (streamed if ``--pages`` is more than 1)
+* ``save`` - Changing and saving ``--requests`` items in turn
+* ``lazylist`` - Fetching a group and resolving the ``LazyList`` of its members
+* ``decode`` - Creating every item from its data (no requests are made)
+* ``endpoint`` - Making the endpoint of every item (no requests are made)
+
+Use ``--output`` to write the results as JSON, and ``--compare`` to compare
+the results with those written by a previous run.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+
+# Allow running from a checkout without installing repose
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from server import StandInServer
+
+from repose import Api, Resource, fields
+from repose.metrics import MetricsAggregator, percentile
+from repose.pagination import PagePaginator
+from repose.utilities import make_endpoint
+
+
+def make_resources(num_fields, depth, per_page=None):
+    """Create the ``Item`` and ``Group`` resource classes served by the stand-in server
+    """
+    child = None
+    for level in range(depth, -1, -1):
+        attrs = {'id': fields.Integer()}
+        for i in range(num_fields):
+            kind = i % 3
+            if kind == 0:
+                attrs['name_{}'.format(i)] = fields.String()
+            elif kind == 1:
+                attrs['count_{}'.format(i)] = fields.Integer()
+            else:
+                attrs['tags_{}'.format(i)] = fields.List()
+        if child is not None:
+            attrs['child'] = fields.Embedded(child)
+        if level:
+            child = type('Child{}'.format(level), (Resource,), attrs)
+
+    meta = {
+        'endpoint': '/item/{item_id}',
+        'endpoint_list': '/item',
+        'endpoint_bulk': '/item',
+    }
+    if per_page:
+        meta['paginator'] = PagePaginator(per_page=per_page)
+    attrs['Meta'] = type('Meta', (object,), meta)
+    item = type('Item', (Resource,), attrs)
+
+    group = type('Group', (Resource,), {
+        'id': fields.Integer(),
+        'members': fields.ManagedIdListCollection(item),
+        'Meta': type('Meta', (object,), {'endpoint': '/group/{group_id}'}),
+    })
+    return item, group
+
+
+def summarise(durations, ops):
+    """Summarise the durations of each run of a case
+
+    Returns:
+
+        dict: The ``ops`` per run, and the ``min``, ``median`` and ``max`` duration
+            in seconds. ``throughput`` is the number of operations per second in the
+            median run, and ``latency`` the median time per operation.
+    """
+    durations = sorted(durations)
+    median = percentile(durations, 50)
+    return dict(
+        ops=ops,
+        runs=len(durations),
+        min=durations[0],
+        median=median,
+        max=durations[-1],
+        throughput=ops / median if median else None,
+        latency=median / ops if ops else None,
+    )
+
+
+def run(items=1000, num_fields=10, depth=1, latency=0.0, pages=1, requests=100, repeat=3):
+    server = StandInServer(items=items, fields=num_fields, depth=depth,
+                           latency=latency, pages=pages)
+    item, group = make_resources(num_fields, depth, server.per_page if pages > 1 else None)
+    metrics = MetricsAggregator()
+    requests = min(requests, items)
+
+    def get():
+        for i in range(1, requests + 1):
+            item.objects.get(item_id=i)
+        return requests
+
+    def get_all():
+        item.objects.invalidate()
+        return len(item.objects.all())
+
+    def iterate():
+        item.objects.invalidate()
+        return sum(1 for _ in item.objects)
+
+    def save():
+        for i, resource in enumerate(to_save):
+            resource.name_0 = 'saved {} {}'.format(i, timeit.default_timer())
+            resource.save()
+        return len(to_save)
+
+    def lazylist():
+        members = group.objects.get(group_id=1).members.all()
+        return sum(1 for _ in members)
+
+    def decode():
+        return len([item.from_data(raw) for raw in server.items])
+
+    def endpoint():
+        return len([make_endpoint(resource) for resource in decoded])
+
+    cases = [
+        ('get', get),
+        ('all', get_all),
+        ('iterate', iterate),
+        ('save', save),
+        ('lazylist', lazylist),
+        ('decode', decode),
+        ('endpoint', endpoint),
+    ]
+
+    results = {}
+    with server:
+        api = Api(base_url=server.url, resources=[item, group],
+                  backend_options={'request_hooks': [metrics]})
+        try:
+            to_save = [item.objects.get(item_id=i) for i in range(1, requests + 1)]
+            decoded = [item.from_data(raw) for raw in server.items]
+            for name, case in cases:
+                metrics.reset()
+                durations = []
+                for _ in range(repeat):
+                    start = timeit.default_timer()
+                    ops = case()
+                    durations.append(timeit.default_timer() - start)
+                result = summarise(durations, ops)
+                rows = metrics.export()
+                result['requests'] = sum(row['count'] for row in rows) // repeat
+                result['request_latency'] = dict(
+                    ('{method} {template}'.format(**row), row['latency']) for row in rows
+                )
+                results[name] = result
+        finally:
+            api.close()
+    return results
+
+
+def get_version():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'VERSION')
+    with open(path) as f:
+        return f.read().strip()
+
+
+def compare(results, previous):
+    """Compare the throughput of each case with that of a previous run
+
+    Returns:
+
+        dict: The change in throughput of each case found in both runs,
+            as a fraction (Eg: ``0.1`` for 10% faster, ``-0.1`` for 10% slower)
+    """
+    changes = {}
+    for name, result in results.items():
+        before = previous.get(name, {}).get('throughput')
+        if before and result['throughput']:
+            changes[name] = result['throughput'] / before - 1
+    return changes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--items', type=int, default=1000)
+    parser.add_argument('--fields', type=int, default=10)
+    parser.add_argument('--depth', type=int, default=1)
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='Seconds the server waits before each response')
+    parser.add_argument('--pages', type=int, default=1)
+    parser.add_argument('--requests', type=int, default=100,
+                        help='The number of items to get and save')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='Write the results to this JSON file')
+    parser.add_argument('--compare', help='Compare with the results of a previous run')
+    args = parser.parse_args()
+
+    params = dict(items=args.items, num_fields=args.fields, depth=args.depth,
+                  latency=args.latency, pages=args.pages, requests=args.requests,
+                  repeat=args.repeat)
+    results = run(**params)
+
+    print('{items} items, {num_fields} fields, depth {depth}, {pages} pages, '
+          '{latency}s latency'.format(**params))
+    for name, result in sorted(results.items()):
+        print('{:<10} {throughput:>12.1f} ops/s  {latency:.6f}s/op  '
+              '{requests} requests'.format(name, **result))
+
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)
+        if previous.get('params') != params:
+            print('Warning: {} was run with different parameters'.format(args.compare))
+        print('Compared with {}'.format(args.compare))
+        for name, change in sorted(compare(results, previous['results']).items()):
+            print('{:<10} {:+.1%}'.format(name, change))
+
+    if args.output:
+        output = dict(
+            params=params,
+            environment=dict(
+                repose=get_version(),
+                python=platform.python_version(),
+                implementation=platform.python_implementation(),
+                platform=platform.platform(),
+            ),
+            results=results,
+        )
+        with open(args.output, 'w') as f:
+            json.dump(output, f, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()
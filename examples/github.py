@@ -1,5 +1,6 @@
 from repose import fields
 from repose.api import Api
+from repose.ratelimit import RequestScheduler
 from repose.resources import Resource
 
 class User(Resource):
@@ -31,7 +32,9 @@ class Repository(Resource):
 
 if __name__ == '__main__':
     # Create the api and register our resources
-    github_api = Api(base_url='https://api.github.com/')
+    # Stay within GitHub's rate limits, and retry if throttled
+    github_api = Api(base_url='https://api.github.com/',
+                     backend_options={'scheduler': RequestScheduler()})
     github_api.register_resource(User)
     github_api.register_resource(Repository)
 
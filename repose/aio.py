@@ -0,0 +1,421 @@
+"""
+Asyncio support for Repose.
+
+.. note:: Requires Python 3.5+ and `aiohttp <https://aiohttp.readthedocs.io/>`_
+    (``pip install repose[async]``).
+
+Tell your :class:`~repose.api.Api` to use the :class:`AsyncApiBackend`
+and the awaitable counterparts of the usual manager and resource
+methods become available::
+
+    my_api = Api(base_url='http://example.com/api/v1',
+                 backend_class=AsyncApiBackend)
+
+    user = await User.objects.aget(user_id=1)
+    users = await User.objects.aall()
+    async for user in User.objects:
+        user.name = user.name.title()
+        await user.asave()
+    await user.arefresh()
+
+    await my_api.close()
+
+The ``Api`` can also be used as an asynchronous context manager, in
+which case it is closed upon exit::
+
+    async with Api(base_url='http://example.com/api/v1',
+                   backend_class=AsyncApiBackend) as my_api:
+        users = await User.objects.aall()
+
+Decoding of the returned data is shared with the synchronous API, so
+resources behave identically once loaded. As with the synchronous API,
+``async for`` fetches paginated results one page at a time.
+
+.. note:: Streamed results (``Meta.stream``) are received in a single
+    response and parsed once the response is complete. The backend's
+    response cache and request scheduler are not supported.
+"""
+import asyncio
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+from repose.apibackend import ApiBackend, timer
+from repose.singleflight import SingleFlight
+from repose.utilities import make_endpoint, make_params_key
+
+
+class AsyncApiBackend(ApiBackend):
+    """Backend implementation providing non-blocking HTTP access to the remote API
+
+    The request methods (:meth:`get`, :meth:`put`, :meth:`post`,
+    :meth:`delete`, :meth:`request`, :meth:`fetch`) are coroutines. All requests share a
+    single :class:`aiohttp.ClientSession`, which is created on first use
+    and must be released using ``await backend.close()``
+    (or ``async with backend:``).
+
+    Attributes:
+
+        pool_limit (int): The maximum number of simultaneous connections
+            across all hosts (``0`` for no limit)
+        pool_maxsize (int): The maximum number of simultaneous
+            connections to any single host (``0`` for no limit)
+        headers (dict): Default headers to send with every request
+        timeout (float|tuple): The total timeout for a request, or
+            a ``(connect, read)`` tuple. ``None`` disables timeouts.
+        single_flight (:class:`AsyncSingleFlight`): Used to coalesce
+            concurrent identical GET requests. ``None`` disables
+            coalescing.
+
+    The ``cache`` (:class:`~repose.cache.ResponseCache`) and ``scheduler``
+    (:class:`~repose.ratelimit.RequestScheduler`) options of the
+    :class:`~repose.apibackend.ApiBackend` are not supported, and raise a
+    ``ValueError`` if given. Both block the calling thread, so cannot be
+    used from within the event loop.
+    """
+
+    pool_limit = 100
+    is_async = True
+
+    def __init__(self, base_url, **options):
+        super(AsyncApiBackend, self).__init__(base_url, **options)
+        for name in ('cache', 'scheduler'):
+            if getattr(self, name) is not None:
+                raise ValueError(
+                    "The {} option is not supported by the {}".format(
+                        name, self.__class__.__name__))
+
+    @property
+    def session(self):
+        """ The :class:`aiohttp.ClientSession` used for all requests
+
+        Created on first access, which must happen while the event
+        loop is running.
+        """
+        if self._session is None:
+            self._session = self.make_session()
+        return self._session
+
+    def make_session(self):
+        """ Create the :class:`aiohttp.ClientSession` to be used by this backend
+
+        Returns:
+
+            :class:`aiohttp.ClientSession`
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp is required in order to use the AsyncApiBackend. "
+                "Install it using: pip install aiohttp")
+
+        connector = aiohttp.TCPConnector(limit=self.pool_limit,
+                                         limit_per_host=self.pool_maxsize)
+        return aiohttp.ClientSession(connector=connector,
+                                     headers=self.headers,
+                                     timeout=self.make_timeout())
+
+    def make_timeout(self):
+        if self.timeout is None:
+            return aiohttp.ClientTimeout(total=None)
+        elif isinstance(self.timeout, tuple):
+            connect, read = self.timeout
+            return aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+        else:
+            return aiohttp.ClientTimeout(total=self.timeout)
+
+    async def close(self):
+        """ Close the session and release all pooled connections
+        """
+        if self._session is not None:
+            session, self._session = self._session, None
+            await session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def parse_response(self, response):
+        """ Parse a response into a Python structure
+
+        Args:
+
+            response (:class:`aiohttp.ClientResponse`): The response object
+
+        Returns:
+
+            object: Typically a python list or dictionary
+        """
+        response.raise_for_status()
+        content = await response.read()
+        if not content:
+            return None
+        return self.serializers.loads(content, response.headers.get('Content-Type'))
+
+    def send(self, method, endpoint, params=None, json=None):
+        """ Send a HTTP request using the pooled session
+
+        Returns:
+
+            An :mod:`aiohttp` request context manager, to be used as
+            ``async with backend.send(...) as response``
+        """
+        headers = {'Accept': self.serializers.get_accept_header()}
+        data = None
+        if json is not None:
+            serializer = self.serializers.default
+            data = serializer.dumps(json)
+            headers['Content-Type'] = serializer.content_type
+        return self.session.request(method, self.make_url(endpoint),
+                                    params=params, data=data, headers=headers)
+
+    async def request(self, method, endpoint, params=None, json=None):
+        """ Perform a HTTP request and parse the response
+
+        Returns:
+
+            object: Typically a python list, dictionary, or None
+        """
+        return (await self.fetch(method, endpoint, params=params, json=json))[1]
+
+    async def fetch(self, method, endpoint, params=None, json=None):
+        """ Perform a HTTP request, returning the response along with its parsed data
+
+        Returns:
+
+            tuple: The ``(response, data)``. The response has already been
+                released, but its headers may still be read.
+        """
+        if method.upper() == 'GET' and self.single_flight is not None:
+            key = (self.make_url(endpoint), make_params_key(params))
+            return await self.single_flight.do(
+                key, lambda: self._request(method, endpoint, params, json))
+        return await self._request(method, endpoint, params, json)
+
+    async def _request(self, method, endpoint, params, json):
+        if not self.request_hooks:
+            async with self.send(method, endpoint, params=params, json=json) as response:
+                return response, await self.parse_response(response)
+
+        started = timer()
+        response = received = read = None
+        try:
+            async with self.send(method, endpoint, params=params, json=json) as response:
+                received = timer()
+                # Read the body before parsing, in order to time each
+                await response.read()
+                read = timer()
+                data = await self.parse_response(response)
+        except Exception as e:
+            self._report(method, endpoint, response, e, *_split_time(started, received, read))
+            raise
+        self._report(method, endpoint, response, None, *_split_time(started, received, read))
+        return response, data
+
+    def _describe_response(self, response):
+        body = getattr(response, '_body', None)
+        return response.status, 0, None if body is None else len(body)
+
+
+def _split_time(started, received, read):
+    """ Split the time taken by a request into connect, transfer and parse time
+    """
+    finished = timer()
+    if received is None:
+        return finished - started, 0.0, 0.0
+    if read is None:
+        return received - started, finished - received, 0.0
+    return received - started, read - received, finished - read
+
+
+class AsyncSingleFlight(SingleFlight):
+    """ Asyncio version of :class:`~repose.singleflight.SingleFlight`
+
+    For use with the :class:`AsyncApiBackend`::
+
+        my_api = Api(base_url='http://example.com/api/v1',
+                     backend_class=AsyncApiBackend,
+                     backend_options={'single_flight': AsyncSingleFlight()})
+    """
+
+    async def do(self, key, fn):
+        """ Await ``fn()``, unless a call for ``key`` is already in flight
+
+        If a call is already in flight then wait for it to complete
+        and return its result instead.
+
+        Args:
+
+            key (hashable): Identifies the call (Eg: the URL and params)
+            fn (callable): Returns the awaitable to be awaited
+
+        Returns:
+
+            object: The result of awaiting ``fn()``
+        """
+        future = self._calls.get(key)
+        if future is not None:
+            self.saved += 1
+            # Shield the shared call from cancellation of any single waiter
+            return await asyncio.shield(future)
+
+        future = self._calls[key] = asyncio.get_event_loop().create_future()
+        try:
+            result = await fn()
+        except Exception as e:
+            future.set_exception(e)
+            # Avoid warnings about the exception never being retrieved
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+            if not future.done():
+                # The call was cancelled, so cancel the waiters too
+                future.cancel()
+
+
+class PageLoader(object):
+    """ Fetch a manager's results from the API one page at a time
+
+    Asynchronous counterpart to ``Manager._fetch_results()``. Results
+    which are not paginated are fetched as a single page.
+    """
+
+    def __init__(self, manager):
+        self.manager = manager
+        endpoint = manager.get_results_endpoint()
+        params = manager.get_params()
+        self.paginator = manager.get_paginator()
+        if self.paginator is not None and not manager._slice_on_server():
+            self.request = self.paginator.first_request(endpoint, params)
+        else:
+            self.paginator = None
+            self.request = (endpoint, params)
+
+    async def next_page(self):
+        """ Fetch the next page
+
+        Returns:
+
+            list[Resource]: The page's results, or ``None`` if there are no more pages
+        """
+        if self.request is None:
+            return None
+        endpoint, params = self.request
+        response, data = await self.manager.api.fetch('GET', endpoint, params=params)
+        if self.paginator is None:
+            self.request = None
+        else:
+            self.request = self.paginator.next_request(self.request, response, data)
+            data = self.paginator.get_items(data)
+        return self.manager._decode_results(data)
+
+
+class ManagerIterator(object):
+    """ Asynchronous iterator over a manager's results
+
+    Returned by ``Manager.__aiter__()``, so you will rarely
+    need to use this directly.
+    """
+
+    def __init__(self, manager):
+        self.manager = manager
+        self._results = None
+        self._pages = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        manager = self.manager
+        if self._results is None:
+            if manager.results is None and manager._can_stream():
+                # Fetch a page at a time rather than loading all the results
+                self._pages = PageLoader(manager)
+                self._results = iter(())
+            else:
+                self._results = iter(await manager_all(manager))
+        while True:
+            for resource in self._results:
+                if self._pages is None or manager._matches(resource):
+                    return resource
+            page = None if self._pages is None else await self._pages.next_page()
+            if page is None:
+                raise StopAsyncIteration()
+            self._results = iter(page)
+
+
+async def api_enter(api):
+    """ Implementation of ``Api.__aenter__()``
+    """
+    return api
+
+
+async def api_exit(api):
+    """ Implementation of ``Api.__aexit__()``
+    """
+    result = api.close()
+    if getattr(api.backend, 'is_async', False):
+        await result
+
+
+async def manager_get(manager, endpoint_params):
+    """ Implementation of :meth:`Manager.aget() <repose.managers.Manager.aget>`
+    """
+    endpoint = manager.get_endpoint(**endpoint_params)
+    resource = manager._get_identity(endpoint)
+    if resource is None:
+        data = await manager.api.get(endpoint)
+        resource = manager._build_resource(data, endpoint_params)
+        manager._set_identity(endpoint, resource)
+    return resource
+
+
+async def manager_load_results(manager):
+    """ Asynchronous counterpart to ``Manager._load_results()``
+    """
+    if manager.results is not None:
+        return
+    key = manager.get_cache_key()
+    cache = manager._get_result_cache()
+    results = None if cache is None else cache.get(key)
+    if results is None:
+        generation = None if cache is None else cache.generation(manager.model)
+        results = []
+        pages = PageLoader(manager)
+        page = await pages.next_page()
+        while page is not None:
+            results.extend(page)
+            page = await pages.next_page()
+        if cache is not None:
+            cache.set(key, results, generation)
+    manager._store_results(key, results)
+
+
+async def manager_all(manager):
+    """ Implementation of :meth:`Manager.aall() <repose.managers.Manager.aall>`
+    """
+    await manager_load_results(manager)
+    return manager.filter_results(manager.results)
+
+
+async def resource_save(resource):
+    """ Implementation of :meth:`Resource.asave() <repose.resources.Resource.asave>`
+    """
+    endpoint, prepared_data = resource._prepare_request()
+    await resource.api.put(endpoint, prepared_data)
+    resource._mark_saved()
+    resource.invalidate_results()
+
+
+async def resource_refresh(resource):
+    """ Implementation of :meth:`Resource.arefresh() <repose.resources.Resource.arefresh>`
+    """
+    data = await resource.api.get(make_endpoint(resource))
+    resource._update_saved(resource.__class__.decode(data))
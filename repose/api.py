@@ -44,13 +44,27 @@ class Api(object):
         backend_class (:class:`~repose.apibackend.ApiBackend`): The class
             to instantiate for use as the Api Backend
             (default: :class:`~repose.apibackend.ApiBackend`).
+        backend_options (dict): Options passed to the backend
+            upon instantiation. For example, to configure the
+            connection pool: ``{'pool_maxsize': 20, 'timeout': 5}``.
+            See :class:`~repose.apibackend.ApiBackend`.
         resources (list[Resource]): :class:`~repose.resources.Resource`
             classes to register with the API. Can also be registered
             using :meth:`register_resource`.
 
+    The backend holds open connections to the remote API. Use
+    :meth:`close` to release them, or use the ``Api`` as a
+    context manager::
+
+        with MyApi(host='myhost.com', account='my-account') as my_api:
+            users = User.objects.all()
+
+    When using the :class:`~repose.aio.AsyncApiBackend` use
+    ``async with`` instead.
     """
 
     backend_class = ApiBackend
+    backend_options = {}
     base_url = None
     resources = []
 
@@ -67,6 +81,8 @@ class Api(object):
             backend_class (:class:`~repose.apibackend.ApiBackend`): The class
                 to instantiate for use as the Api Backend
                 (default: :class:`~repose.apibackend.ApiBackend`).
+            backend_options (dict): Options passed to the backend
+                upon instantiation.
             resources (list[Resource]): :class:`~repose.resources.Resource`
                 classes to register with the API. Can also be registered
                 using :meth:`register_resource`.
@@ -100,9 +116,44 @@ class Api(object):
     def get_backend_class(self):
         return self.backend_class
 
+    def get_backend_options(self):
+        return dict(self.backend_options)
+
     def get_backend(self):
         backend_class = self.get_backend_class()
-        return backend_class(self.get_base_url())
+        return backend_class(self.get_base_url(), **self.get_backend_options())
+
+    def close(self):
+        """ Close the backend, releasing any pooled connections
+
+        When using the :class:`~repose.aio.AsyncApiBackend` the
+        returned value must be awaited::
+
+            await my_api.close()
+        """
+        return self.backend.close()
+
+    def __enter__(self):
+        self._check_sync()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._check_sync()
+        self.close()
+
+    def __aenter__(self):
+        from repose import aio
+        return aio.api_enter(self)
+
+    def __aexit__(self, exc_type, exc_val, exc_tb):
+        from repose import aio
+        return aio.api_exit(self)
+
+    def _check_sync(self):
+        if getattr(self.backend, 'is_async', False):
+            raise TypeError(
+                "{} uses an asynchronous backend, so must be used with "
+                "'async with' rather than 'with'".format(self.__class__.__name__))
 
     def get_base_url(self):
         return self.base_url
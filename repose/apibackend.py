@@ -1,6 +1,18 @@
+import threading
+import time
+
 import requests
+from requests.adapters import HTTPAdapter
 
 from repose import utilities
+from repose.metrics import RequestEvent, get_template
+from repose.serializers import JsonSerializer, SerializerRegistry, parse_content_type
+from repose.streaming import iter_json_array, iter_text
+
+timer = getattr(time, 'perf_counter', time.time)
+
+# Used to recognise JSON responses to streamed requests
+_json_serializer = JsonSerializer()
 
 
 class ApiBackend(object):
@@ -9,18 +21,135 @@ class ApiBackend(object):
     This can be extended and passed into your :class:`Api <repose.api.Api>`
     instance at instantiation time. This can be useful if you need to
     customise how requests are made, or how responses are parsed.
+
+    All requests are made through a single :class:`requests.Session`
+    which is created on first use and shared by every
+    :class:`~repose.managers.Manager` and :class:`~repose.resources.Resource`
+    bound to the :class:`Api <repose.api.Api>`. Connections are therefore
+    kept alive and pooled between requests. The session is safe to use
+    from multiple threads.
+
+    Call :meth:`close` (or use the backend as a context manager) to
+    release the pooled connections once you are done with the API.
+
+    Attributes:
+
+        pool_connections (int): The number of per-host connection pools to cache
+        pool_maxsize (int): The maximum number of connections to keep open
+            to any single host
+        pool_block (bool): Should requests block when the pool for
+            a host is exhausted, rather than opening an additional
+            (non-pooled) connection
+        headers (dict): Default headers to send with every request
+        timeout (float|tuple): Timeout passed to :mod:`requests`. May be
+            a ``(connect, read)`` tuple. ``None`` disables timeouts.
+        cache (:class:`~repose.cache.ResponseCache`): Cache to use for GET
+            requests. ``None`` disables caching.
+        identity_map (:class:`~repose.cache.IdentityMap`): Map used to share
+            a single instance of each resource. ``None`` disables the map.
+        result_cache (:class:`~repose.cache.ResultCache`): Cache for the results
+            of list queries. ``None`` to have each manager keep its results
+            until invalidated.
+        single_flight (:class:`~repose.singleflight.SingleFlight`): Used to
+            coalesce concurrent identical GET requests. ``None`` disables
+            coalescing.
+        scheduler (:class:`~repose.ratelimit.RequestScheduler`): Used to
+            pace requests according to rate limits, and to retry failed
+            requests. ``None`` sends every request immediately, once.
+        stream_chunk_size (int): The number of bytes to read at a time
+            when streaming responses (see :meth:`stream`)
+        serializers (list[Serializer]): The :mod:`~repose.serializers` to use,
+            in order of preference. The first is used for request bodies.
+            Defaults to JSON.
+        request_hooks (list[callable]): Called with a
+            :class:`~repose.metrics.RequestEvent` once each request has
+            completed. See :mod:`repose.metrics`.
+        is_async (bool): Are the request methods coroutines?
+            (See :class:`~repose.aio.AsyncApiBackend`)
     """
 
-    def __init__(self, base_url):
+    pool_connections = 10
+    pool_maxsize = 10
+    pool_block = False
+    headers = None
+    timeout = None
+    cache = None
+    identity_map = None
+    result_cache = None
+    single_flight = None
+    scheduler = None
+    stream_chunk_size = 65536
+    serializers = None
+    request_hooks = None
+    is_async = False
+
+    def __init__(self, base_url, **options):
         """ Instantiate this class
 
         Args:
 
             base_url (str): The fully-qualified base URL to the the API.
                 (Eg: ``"http://example.com"``).
+            **options: Override any of the attributes listed above
+                (Eg: ``pool_maxsize=20, timeout=5``).
 
         """
         self.base_url = base_url
+        for k, v in options.items():
+            setattr(self, k, v)
+        if not isinstance(self.serializers, SerializerRegistry):
+            self.serializers = SerializerRegistry(self.serializers)
+        self.request_hooks = list(self.request_hooks or [])
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self):
+        """ The :class:`requests.Session` used for all requests
+
+        Created on first access, and recreated if accessed after
+        :meth:`close` has been called.
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self.make_session()
+        return self._session
+
+    def make_session(self):
+        """ Create the :class:`requests.Session` to be used by this backend
+
+        Override this if you need to configure the session further
+        (authentication, proxies, certificates etc).
+
+        Returns:
+
+            :class:`requests.Session`
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update(self.headers or {})
+        return session
+
+    def close(self):
+        """ Close the session and release all pooled connections
+        """
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
     def make_url(self, endpoint):
         """ Construct the fully qualified URL for the given endpoint.
@@ -31,6 +160,9 @@ class ApiBackend(object):
             >>> my_backend.make_url("/user/1")
             "http://example.com/api/user/1"
 
+        Fully qualified URLs (such as those provided in a ``Link``
+        header) will be returned unchanged.
+
         Args:
 
             endpoint (str): The API endpoint (Eg: ``"/user/1"``).
@@ -40,6 +172,8 @@ class ApiBackend(object):
             str: The fully qualified URL
 
         """
+        if endpoint.startswith(('http://', 'https://')):
+            return endpoint
         return '{}/{}'.format(self.base_url.rstrip('/'), endpoint.lstrip('/'))
 
     def parse_response(self, response):
@@ -55,7 +189,222 @@ class ApiBackend(object):
             object: Typically a python list or dictionary
         """
         response.raise_for_status()
-        return response.json()
+        if not response.content:
+            return None
+        return self.serializers.loads(response.content, response.headers.get('Content-Type'))
+
+    def send(self, method, endpoint, params=None, json=None, headers=None, stream=False):
+        """ Send a HTTP request using the pooled session
+
+        Args:
+
+            method (str): The HTTP method (Eg: ``"GET"``)
+            endpoint (str): The API endpoint (Eg: ``"/user/1"``)
+            params (dict): Dictionary of URL params
+            json (dict): The body to send with the request. Serialized using
+                the preferred serializer (JSON by default)
+            headers (dict): Additional headers to send with the request
+            stream (bool): Return before the response body has been downloaded
+
+        Returns:
+
+            :class:`requests.Response`: The unparsed response
+        """
+        url = self.make_url(endpoint)
+        headers = dict(headers or {})
+        headers.setdefault('Accept', self.serializers.get_accept_header())
+        data = None
+        if json is not None:
+            serializer = self.serializers.default
+            data = serializer.dumps(json)
+            headers['Content-Type'] = serializer.content_type
+
+        def send():
+            if not self.request_hooks:
+                return self.session.request(
+                    method, url,
+                    params=params, data=data, headers=headers, timeout=self.timeout,
+                    stream=stream,
+                )
+            # Receive the headers and body separately in order to time each
+            started = timer()
+            response = self.session.request(
+                method, url,
+                params=params, data=data, headers=headers, timeout=self.timeout,
+                stream=True,
+            )
+            received = timer()
+            if not stream:
+                response.content
+            response.timings = (received - started, timer() - received)
+            return response
+
+        if self.scheduler is not None:
+            return self.scheduler.call(method, url, send)
+        return send()
+
+    def request(self, method, endpoint, params=None, json=None):
+        """ Perform a HTTP request and parse the response
+
+        Args:
+
+            method (str): The HTTP method (Eg: ``"GET"``)
+            endpoint (str): The API endpoint (Eg: ``"/user/1"``)
+            params (dict): Dictionary of URL params
+            json (dict): The JSON body to send with the request
+
+        Returns:
+
+            object: Typically a python list, dictionary, or None
+        """
+        return self.fetch(method, endpoint, params=params, json=json)[1]
+
+    def fetch(self, method, endpoint, params=None, json=None):
+        """ Perform a HTTP request, returning the response along with its parsed data
+
+        Use this rather than :meth:`send` when the response itself is
+        needed (Eg: to read its headers), so that the request is still
+        reported to the :attr:`request_hooks`, and GET requests still make
+        use of the :attr:`cache` and :attr:`single_flight`.
+
+        Args:
+
+            method (str): The HTTP method (Eg: ``"GET"``)
+            endpoint (str): The API endpoint (Eg: ``"/user/1"``)
+            params (dict): Dictionary of URL params
+            json (dict): The JSON body to send with the request
+
+        Returns:
+
+            tuple: The ``(response, data)``. The response may be shared with
+                other callers, so should not be modified.
+        """
+        if method.upper() == 'GET':
+            if self.single_flight is not None:
+                key = (self.make_url(endpoint), utilities.make_params_key(params))
+                return self.single_flight.do(key, lambda: self._get(endpoint, params))
+            return self._get(endpoint, params)
+
+        if self.cache is not None and method.upper() not in ('HEAD', 'OPTIONS'):
+            # Any cached responses for this URL are likely to now be stale
+            self.cache.invalidate(self.make_url(endpoint))
+
+        return self._send_and_parse(method, endpoint, params=params, json=json)
+
+    def _send_and_parse(self, method, endpoint, params=None, json=None, headers=None):
+        """ Send a request and parse the response, reporting it to the :attr:`request_hooks`
+
+        Returns:
+
+            tuple: The ``(response, data)``
+        """
+        if not self.request_hooks:
+            response = self.send(method, endpoint, params=params, json=json, headers=headers)
+            return response, self.parse_response(response)
+
+        started = timer()
+        response = sent = None
+        try:
+            response = self.send(method, endpoint, params=params, json=json, headers=headers)
+            sent = timer()
+            data = self.parse_response(response)
+        except Exception as e:
+            self._report(method, endpoint, response, e, *self._split_time(response, started, sent))
+            raise
+        self._report(method, endpoint, response, None, *self._split_time(response, started, sent))
+        return response, data
+
+    def _split_time(self, response, started, sent):
+        """ Split the time taken by a request into connect, transfer and parse time
+
+        Returns:
+
+            tuple: ``(connect, transfer, parse)``, in seconds
+        """
+        finished = timer()
+        if sent is None:
+            return finished - started, 0.0, 0.0
+        timings = getattr(response, 'timings', None)
+        if timings is None:
+            # Sent by an overridden send(), so only the total is known
+            return sent - started, 0.0, finished - sent
+        return timings[0], timings[1], finished - sent
+
+    def _report(self, method, endpoint, response, error, connect, transfer, parse):
+        """ Call each of the :attr:`request_hooks` with the outcome of a request
+        """
+        if response is None:
+            status, request_bytes, response_bytes = None, 0, None
+        else:
+            status, request_bytes, response_bytes = self._describe_response(response)
+        template, resource = get_template(endpoint)
+        event = RequestEvent(
+            method=method.upper(),
+            endpoint=endpoint,
+            template=template,
+            resource=resource,
+            status=status,
+            error=error,
+            connect=connect,
+            transfer=transfer,
+            parse=parse,
+            request_bytes=request_bytes,
+            response_bytes=response_bytes,
+            retries=getattr(response, 'retries', 0),
+        )
+        for hook in self.request_hooks:
+            hook(event)
+
+    def _describe_response(self, response):
+        """ Get the ``(status, request_bytes, response_bytes)`` of a response
+        """
+        body = getattr(getattr(response, 'request', None), 'body', None)
+        content = getattr(response, '_content', None)
+        return (response.status_code, len(body) if body else 0,
+                len(content) if isinstance(content, bytes) else None)
+
+    def _get(self, endpoint, params):
+        """ Perform a GET request, making use of :attr:`cache` if available
+
+        Returns:
+
+            tuple: The ``(response, data)``
+        """
+        if self.cache is not None:
+            return self._cached_get(endpoint, params)
+        return self._send_and_parse('GET', endpoint, params=params)
+
+    def _cached_get(self, endpoint, params):
+        """ Perform a GET request, making use of :attr:`cache`
+
+        Returns:
+
+            tuple: The ``(response, data)``. The cached response if
+                the data came from the cache.
+        """
+        key = self.cache.make_key(self.make_url(endpoint), params)
+        entry = self.cache.lookup(key)
+        if entry is not None and entry.is_fresh():
+            if entry.is_negative():
+                self.cache.stats.increment('negative_hits')
+                entry.response.raise_for_status()
+            self.cache.stats.increment('hits')
+            return entry.response, entry.data
+
+        headers = entry.get_validators() if entry is not None else None
+        try:
+            r, data = self._send_and_parse('GET', endpoint, params=params, headers=headers)
+        except requests.HTTPError as e:
+            self.cache.stats.increment('misses')
+            self.cache.store(key, e.response, None)
+            raise
+        if r.status_code == 304 and entry is not None and not entry.is_negative():
+            self.cache.revalidated(entry, r)
+            return entry.response, entry.data
+
+        self.cache.stats.increment('misses')
+        self.cache.store(key, r, data)
+        return r, data
 
     def get(self, endpoint, params=None):
         """ Perform a HTTP GET request for the specified endpoint
@@ -68,8 +417,50 @@ class ApiBackend(object):
 
             object: Typically a python list or dictionary
         """
-        r = requests.get(self.make_url(endpoint), params=params)
-        return self.parse_response(r)
+        return self.request('GET', endpoint, params=params)
+
+    def stream(self, endpoint, params=None):
+        """ Perform a HTTP GET request, parsing the response incrementally
+
+        The endpoint must return a JSON array. Each item is yielded as soon
+        as it has been received, rather than once the entire response has
+        been downloaded and parsed.
+
+        JSON is requested regardless of the preferred :attr:`serializers`.
+        Should the API respond with some other ``Content-Type`` anyway, the
+        response is instead parsed in full using :meth:`parse_response`.
+
+        Args:
+
+            params (dict): Dictionary of URL params
+
+        Returns:
+
+            generator: Yielding each item of the returned list in turn
+        """
+        started = timer()
+        r = self.send('GET', endpoint, params=params, headers={'Accept': 'application/json'},
+                      stream=True)
+        received = timer()
+        error = None
+        try:
+            r.raise_for_status()
+            media_type = parse_content_type(r.headers.get('Content-Type'))[0]
+            if media_type and not _json_serializer.handles(media_type):
+                items = self.parse_response(r)
+            else:
+                items = iter_json_array(iter_text(r, self.stream_chunk_size))
+            for item in items:
+                yield item
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            r.close()
+            if self.request_hooks:
+                # The body is parsed as it is received, so transfer includes parsing
+                connect = getattr(r, 'timings', (received - started,))[0]
+                self._report('GET', endpoint, r, error, connect, timer() - received, 0.0)
 
     def put(self, endpoint, json):
         """ Perform a HTTP PUT request for the specified endpoint
@@ -82,8 +473,7 @@ class ApiBackend(object):
 
             object: Typically a python list, dictionary, or None
         """
-        r = requests.put(self.make_url(endpoint), json=json)
-        return self.parse_response(r)
+        return self.request('PUT', endpoint, json=json)
 
     def post(self, endpoint, json):
         """ Perform a HTTP POST request for the specified endpoint
@@ -96,8 +486,7 @@ class ApiBackend(object):
 
             object: Typically a python list, dictionary, or None
         """
-        r = requests.post(self.make_url(endpoint), json=json)
-        return self.parse_response(r)
+        return self.request('POST', endpoint, json=json)
 
     def delete(self, endpoint, json):
         """ Perform a HTTP DELETE request for the specified endpoint
@@ -110,5 +499,4 @@ class ApiBackend(object):
 
             object: Typically a python list, dictionary, or None
         """
-        r = requests.delete(self.make_url(endpoint), json=json)
-        return self.parse_response(r)
+        return self.request('DELETE', endpoint, json=json)
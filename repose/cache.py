@@ -0,0 +1,445 @@
+"""
+Caching of API responses.
+
+To enable HTTP caching, pass a :class:`ResponseCache` to your
+:class:`~repose.api.Api`'s backend::
+
+    my_api = Api(base_url='http://example.com/api/v1',
+                 backend_options={'cache': ResponseCache(maxsize=500)})
+
+GET responses will then be cached according to their ``Cache-Control``
+and ``Expires`` headers. Once a cached response becomes stale it will be
+revalidated using its ``ETag`` / ``Last-Modified`` header, in which case
+a ``304 Not Modified`` response allows the previously parsed body to be
+reused. The effectiveness of the cache can be monitored using
+:attr:`ResponseCache.stats`.
+"""
+import threading
+import time
+from collections import OrderedDict
+from email.utils import parsedate_tz, mktime_tz
+
+from repose.utilities import make_params_key
+
+
+class LRUCache(object):
+    """ A bounded, thread-safe, least-recently-used mapping
+
+    Values may optionally expire after a given time-to-live.
+    """
+
+    def __init__(self, maxsize=1000, ttl=None):
+        """ Initialise the cache
+
+        Args:
+
+            maxsize (int): The maximum number of values to hold
+            ttl (float): The default number of seconds after which values
+                expire. ``None`` for no expiry.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value, expires = self._data.pop(key)
+            except KeyError:
+                return default
+            if expires is not None and expires <= time.time():
+                return default
+            # Re-insert to mark as most recently used
+            self._data[key] = (value, expires)
+            return value
+
+    def set(self, key, value, ttl=None):
+        ttl = self.ttl if ttl is None else ttl
+        expires = None if ttl is None else time.time() + ttl
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (value, expires)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            value, _ = self._data.pop(key, (default, None))
+            return value
+
+    def discard_where(self, predicate):
+        """ Remove all entries for which ``predicate(key)`` is true
+        """
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key):
+        return self.get(key, self) is not self
+
+    def __len__(self):
+        return len(self._data)
+
+
+class IdentityMap(LRUCache):
+    """ Holds a single shared instance of each remote resource
+
+    Resources are keyed by their class and endpoint
+    (Eg: ``(User, '/user/1')``). When an identity map is provided
+    to the backend, :meth:`Manager.get() <repose.managers.Manager.get>`
+    and :meth:`Manager.get_many() <repose.managers.Manager.get_many>`
+    return the existing instance rather than fetching and decoding the
+    resource again::
+
+        my_api = Api(base_url='http://example.com/api/v1',
+                     backend_options={'identity_map': IdentityMap(ttl=300)})
+
+        User.objects.get(user_id=1) is User.objects.get(user_id=1)  # True
+
+    As the instance is shared, calling
+    :meth:`~repose.resources.Resource.refresh` upon it updates the
+    resource for every holder.
+    """
+
+    def get_resource(self, resource_class, endpoint):
+        """ Get the instance of ``resource_class`` for the endpoint, or ``None``
+        """
+        return self.get((resource_class, endpoint))
+
+    def add(self, resource_class, endpoint, resource):
+        """ Add a resource instance to the map
+        """
+        self.set((resource_class, endpoint), resource)
+
+    def invalidate(self, resource_class, endpoint=None):
+        """ Remove the given resource (or all resources of ``resource_class``)
+        """
+        if endpoint is None:
+            self.discard_where(lambda key: key[0] is resource_class)
+        else:
+            self.pop((resource_class, endpoint))
+
+
+class ResultCache(object):
+    """ Caches the results of list queries across all managers
+
+    Without a result cache, each manager holds on to its results
+    indefinitely once they have been loaded. Pass a :class:`ResultCache`
+    to the backend in order for results to instead expire::
+
+        my_api = Api(base_url='http://example.com/api/v1',
+                     backend_options={'result_cache': ResultCache(ttl=60)})
+
+    Results are cached per query (the endpoint and URL parameters). The
+    cache's size is limited to ``max_results``, with the least recently
+    used results being discarded first. Each list of results counts as
+    its length, and each count as one. Rather than measuring the memory
+    used, the number of resources is taken as an estimate of it. Override
+    :meth:`get_size` to weigh values differently.
+
+    All cached results for a resource class are invalidated by
+    :meth:`Manager.invalidate() <repose.managers.Manager.invalidate>`, and
+    when a resource of that class is saved.
+    """
+
+    def __init__(self, ttl=60, max_results=10000):
+        """ Initialise the cache
+
+        Args:
+
+            ttl (float): The number of seconds for which results are kept.
+                ``None`` for no expiry.
+            max_results (int): The maximum total size of the cached
+                values, as given by :meth:`get_size`
+        """
+        self.ttl = ttl
+        self.max_results = max_results
+        self.size = 0
+        self._data = OrderedDict()
+        self._generations = {}
+        self._lock = threading.RLock()
+
+    def generation(self, resource_class):
+        """ Get the current generation for a resource class
+
+        Fetch this before loading results, and pass it to :meth:`set`. Results
+        loaded while the class was being invalidated will then not be kept.
+        """
+        return self._generations.get(resource_class, 0)
+
+    def get(self, key):
+        """ Get the cached value, or ``None`` if missing, expired or invalidated
+
+        Args:
+
+            key (tuple): The query key, the first item of which must be the
+                resource class
+        """
+        with self._lock:
+            try:
+                value, size, generation, expires = self._data.pop(key)
+            except KeyError:
+                return None
+            self.size -= size
+            if generation != self.generation(key[0]) or (expires is not None
+                                                         and expires <= time.time()):
+                return None
+            # Re-insert to mark as most recently used
+            self._data[key] = (value, size, generation, expires)
+            self.size += size
+            return value
+
+    def set(self, key, value, generation=None, size=None):
+        """ Cache a value
+
+        Args:
+
+            key (tuple): The query key, the first item of which must be the
+                resource class
+            value: The value to cache (Eg: a list of resources)
+            generation (int): The generation at the time the value was loaded.
+                Defaults to the current generation.
+            size (int): The size of the value. Defaults to :meth:`get_size`.
+        """
+        size = self.get_size(value) if size is None else size
+        with self._lock:
+            if generation is None:
+                generation = self.generation(key[0])
+            elif generation != self.generation(key[0]):
+                return
+            self.discard(key)
+            if size > self.max_results:
+                return
+            expires = None if self.ttl is None else time.time() + self.ttl
+            self._data[key] = (value, size, generation, expires)
+            self.size += size
+            while self.size > self.max_results:
+                _, (_, evicted, _, _) = self._data.popitem(last=False)
+                self.size -= evicted
+
+    def get_size(self, value):
+        """ Get the size of a value, counted towards ``max_results``
+
+        Returns:
+
+            int: The number of results for a list of results,
+                otherwise ``1``
+        """
+        try:
+            return len(value)
+        except TypeError:
+            return 1
+
+    def discard(self, key):
+        with self._lock:
+            entry = self._data.pop(key, None)
+            if entry is not None:
+                self.size -= entry[1]
+
+    def invalidate(self, resource_class=None):
+        """ Discard the cached results for a resource class (or for all classes)
+        """
+        with self._lock:
+            if resource_class is None:
+                for cls in list(self._generations):
+                    self._generations[cls] += 1
+                self._data.clear()
+                self.size = 0
+                return
+            self._generations[resource_class] = self.generation(resource_class) + 1
+            for key in [k for k in self._data if k[0] is resource_class]:
+                self.discard(key)
+
+    def clear(self):
+        self.invalidate()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class CacheStats(object):
+    """ Counters describing the effectiveness of a :class:`ResponseCache`
+
+    Attributes:
+
+        hits (int): Requests served from the cache without contacting the API
+        misses (int): Requests for which the full response had to be fetched
+        revalidations (int): Stale responses confirmed as unchanged by
+            a ``304 Not Modified`` response
+        negative_hits (int): Requests answered by a cached ``404`` response
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.negative_hits = 0
+
+    def increment(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def as_dict(self):
+        return dict(
+            hits=self.hits,
+            misses=self.misses,
+            revalidations=self.revalidations,
+            negative_hits=self.negative_hits,
+        )
+
+
+class CacheEntry(object):
+    """ A single cached response
+    """
+
+    def __init__(self, response, data, ttl):
+        self.response = response
+        self.data = data
+        self.etag = response.headers.get('ETag')
+        self.last_modified = response.headers.get('Last-Modified')
+        self.refresh(ttl)
+
+    def refresh(self, ttl):
+        self.expires = time.time() + (ttl or 0)
+
+    def is_fresh(self):
+        return self.expires > time.time()
+
+    def is_negative(self):
+        return self.response.status_code == 404
+
+    def get_validators(self):
+        """ Get the headers needed to revalidate this entry
+
+        Returns:
+
+            dict: Containing ``If-None-Match`` and/or ``If-Modified-Since``
+        """
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ResponseCache(object):
+    """ HTTP cache for GET responses, used by :class:`~repose.apibackend.ApiBackend`
+
+    .. note:: Cached response bodies are shared between callers, so
+              decoders should not modify the data they are given.
+
+    Attributes:
+
+        stats (CacheStats): Hit, miss & revalidation counters
+    """
+
+    def __init__(self, maxsize=1000, default_ttl=0, negative_ttl=0):
+        """ Initialise the cache
+
+        Args:
+
+            maxsize (int): The maximum number of responses to hold
+            default_ttl (float): Seconds for which to consider a response fresh
+                if it specifies neither ``Cache-Control: max-age`` nor ``Expires``
+            negative_ttl (float): Seconds for which to cache ``404 Not Found``
+                responses. ``0`` disables negative caching.
+        """
+        self.default_ttl = default_ttl
+        self.negative_ttl = negative_ttl
+        self.entries = LRUCache(maxsize=maxsize)
+        self.stats = CacheStats()
+
+    def make_key(self, url, params=None):
+        return url, make_params_key(params)
+
+    def lookup(self, key):
+        """ Get the cached entry for a key, fresh or not
+
+        Returns:
+
+            CacheEntry: The entry, or ``None``
+        """
+        return self.entries.get(key)
+
+    def store(self, key, response, data):
+        """ Store a response, if it is cacheable
+        """
+        if response.status_code == 404:
+            ttl = self.negative_ttl
+            if not ttl:
+                return
+        elif response.status_code != 200:
+            return
+        else:
+            ttl = self.get_ttl(response)
+            if ttl is None:
+                return
+        entry = CacheEntry(response, data, ttl)
+        if ttl or entry.get_validators():
+            self.entries.set(key, entry)
+
+    def revalidated(self, entry, response):
+        """ Mark an entry as fresh following a ``304 Not Modified`` response
+        """
+        entry.refresh(self.get_ttl(response) or 0)
+        self.stats.increment('revalidations')
+
+    def invalidate(self, url):
+        """ Remove all cached responses for the given URL (regardless of params)
+        """
+        self.entries.discard_where(lambda key: key[0] == url)
+
+    def clear(self):
+        self.entries.clear()
+
+    def get_ttl(self, response):
+        """ Determine how long the response may be considered fresh for
+
+        Returns:
+
+            float: Seconds, or ``None`` if the response must not be stored
+        """
+        directives = parse_cache_control(response.headers.get('Cache-Control', ''))
+        if 'no-store' in directives:
+            return None
+        if 'no-cache' in directives:
+            return 0
+        if 'max-age' in directives:
+            try:
+                return max(0, int(directives['max-age']))
+            except ValueError:
+                return 0
+
+        expires = response.headers.get('Expires')
+        if expires:
+            parsed = parsedate_tz(expires)
+            # Invalid dates (such as "0") mean already expired
+            return max(0, mktime_tz(parsed) - time.time()) if parsed else 0
+
+        return self.default_ttl
+
+
+def parse_cache_control(value):
+    """ Parse a ``Cache-Control`` header into a dictionary of directives
+
+    For example::
+
+        >>> parse_cache_control('private, max-age=60')
+        {'private': None, 'max-age': '60'}
+    """
+    directives = {}
+    for part in value.split(','):
+        name, _, arg = part.strip().partition('=')
+        if name:
+            directives[name.lower()] = arg.strip('"') if arg else None
+    return directives
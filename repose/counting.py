@@ -0,0 +1,90 @@
+"""
+Count sources allow :meth:`Manager.count() <repose.managers.Manager.count>`
+to ask the API for the number of results, rather than fetching them all.
+
+A count source can be declared either on the resource's ``Meta``, or
+upon a specific manager::
+
+    class User(Resource):
+        ... define fields...
+
+        class Meta:
+            endpoint = '/user/{user_id}'
+            endpoint_list = '/user'
+            count_source = HeaderCount('X-Total-Count')
+
+    class Repository(Resource):
+        ... define fields...
+
+        objects = Manager(count_source=EnvelopeCount('total'))
+
+The count is requested with the manager's filters applied. If
+``Meta.limit_param`` is set then only a single result is requested
+along with it.
+"""
+
+
+class CountSource(object):
+    """ Base class for all count sources
+    """
+
+    def count(self, api, endpoint, params=None):
+        """ Get the total number of results from the API
+
+        Args:
+
+            api (Api): The Api (or Api backend) to query
+            endpoint (str): The list endpoint (Eg: ``"/user"``)
+            params (dict): The URL params to send
+
+        Returns:
+
+            int: The total, or ``None`` if the API did not provide one
+        """
+        raise NotImplementedError()
+
+
+class HeaderCount(CountSource):
+    """ Read the count from a response header
+
+    By default a ``HEAD`` request is sent, so that no results are returned.
+    """
+
+    def __init__(self, header='X-Total-Count', method='HEAD'):
+        """ Initialise the count source
+
+        Args:
+
+            header (str): The header containing the total number of results
+            method (str): The HTTP method to use. Use ``GET`` if the
+                API does not support ``HEAD`` requests.
+        """
+        self.header = header
+        self.method = method
+
+    def count(self, api, endpoint, params=None):
+        response = api.fetch(self.method, endpoint, params=params)[0]
+        value = response.headers.get(self.header)
+        return None if value is None else int(value)
+
+
+class EnvelopeCount(CountSource):
+    """ Read the count from a key in the response body
+
+    For APIs which wrap each page of results in an envelope,
+    Eg: ``{"count": 1234, "results": [...]}``
+    """
+
+    def __init__(self, key='count'):
+        """ Initialise the count source
+
+        Args:
+
+            key (str): The key containing the total number of results
+        """
+        self.key = key
+
+    def count(self, api, endpoint, params=None):
+        data = api.get(endpoint, params=params)
+        value = data.get(self.key) if isinstance(data, dict) else None
+        return None if value is None else int(value)
@@ -14,6 +14,46 @@ from booby.helpers import nullable
 from repose.utilities import LazyList
 
 
+class IdListLoader(object):
+    """ Loads ranges of a :class:`LazyList` of resources from their IDs
+
+    Attributes:
+
+        resource (Resource): The Resource class
+        ids (list): The IDs of every resource in the list
+    """
+
+    def __init__(self, resource, ids):
+        self.resource = resource
+        self.ids = list(ids)
+
+    def __call__(self, start, stop):
+        return self.load(self.ids[start:stop])
+
+    @property
+    def bulk_size(self):
+        """ The number of IDs requested at once from a bulk endpoint (``Meta.bulk_size``)
+        """
+        return getattr(self.resource.Meta, 'bulk_size', 100)
+
+    def load(self, ids):
+        """ Fetch the resources with the given IDs
+
+        Uses :meth:`Manager.get_many() <repose.managers.Manager.get_many>`.
+
+        Returns:
+
+            list[Resource]: The resources in the same order as ``ids``.
+                Resources which the API did not return are ``None``.
+        """
+        resources = self.resource.objects.get_many(ids)
+        if len(resources) == len(ids):
+            return resources
+        # Some were not found, so match the resources to their IDs
+        by_id = dict((resource.id, resource) for resource in resources)
+        return [by_id.get(id) for id in ids]
+
+
 class IdToLazyModelListDecoder(Decoder):
     """ Decode a list of resource IDs into a lazily loaded list of
     :class:`~repose.resources.Resource` objects
@@ -33,13 +73,12 @@ class IdToLazyModelListDecoder(Decoder):
     def decode(self, value):
         """ Decode the value into a :class:`LazyList`.
 
-        .. note:: This assumes the destination
-            :class:`~repose.resources.Resource` has an ID field
-            and that the endpoint is in the form ``/myresource/{myresource_id}``
-
-        .. todo:: Consider refactoring out these assumptions
+        The resources are fetched in bulk using
+        :meth:`Manager.get_many() <repose.managers.Manager.get_many>`
+        as they are accessed, one window of the list at a time (see
+        :attr:`LazyList.window <repose.utilities.LazyList.window>`).
+        Each window is a single batch of ``Meta.bulk_size`` IDs.
+        Resources which the API does not return are ``None``.
         """
-        url_key = '{}_id'.format(self._resource.__name__.lower())
-        gen = (self._resource.objects.get(**{url_key: id}) for id in value)
-        return LazyList(generator=gen, size=len(value))
-
+        loader = IdListLoader(self._resource, value)
+        return LazyList(loader=loader, size=len(value), window=loader.bulk_size)
@@ -13,7 +13,8 @@ class ManagedCollection(Collection):
 
     def _resolve(self, value):
         value = super(ManagedCollection, self)._resolve(value)
-        return self._initialise_manager(value)
+        # Use a LazyList in order to track changes to the collection
+        return self._initialise_manager(LazyList(value, size=len(value)))
 
     def _initialise_manager(self, value):
         manager = self.manager_class()
@@ -45,9 +46,7 @@ class ManagedIdListCollection(ManagedCollection):
         return super(ManagedIdListCollection, self).decode(value)
 
     def encode(self, value):
-        if isinstance(value.results, list):
-            import pdb; pdb.set_trace()
-        if not value.results.has_changed():
+        if isinstance(value.results, LazyList) and not value.results.has_changed():
             # Avoid loading the results if nothing has changed
             return self._initial_encoded_value
         else:
@@ -52,12 +52,78 @@ Resources::
                 light.on = True
                 light.save()
 
+Querying
+--------
 
-.. todo:: Implement support for pagination of resources
+Results may be filtered, ordered and sliced. Each of these returns a new
+manager, and no request is made until the results are used::
+
+    class User(Resource):
+        ... define fields...
+
+        class Meta:
+            endpoint = '/user/{user_id}'
+            endpoint_list = '/user'
+            filters = {'active': 'is_active'}
+            order_param = 'ordering'
+            limit_param = 'limit'
+            offset_param = 'offset'
+
+    # GET /user?is_active=True&ordering=-created&limit=20
+    users = User.objects.filter(active=True).order_by('-created')[:20]
+
+Where the ``Meta`` does not declare how to send a filter, ordering or
+slice to the API, it is applied once the results have been fetched.
+
+Pagination
+----------
+
+If the API splits list results into pages, provide a
+:mod:`paginator <repose.pagination>` either on the resource's ``Meta``
+or when creating the manager::
+
+    class User(Resource):
+        ... define fields...
+
+        objects = Manager(paginator=PagePaginator(per_page=50))
+
+Iterating over the manager will then fetch the results one page at
+a time. For example, the following only ever holds a single page of
+users in memory::
+
+    for user in User.objects:
+        print(user.name)
 
 """
 
-from repose.utilities import get_values_from_endpoint
+import copy
+from collections import namedtuple, OrderedDict
+from operator import attrgetter
+
+from booby.errors import FieldError
+from booby.fields import Embedded
+
+from repose.decoders import IdListLoader
+from repose.fields import ManagedCollection, ManagedIdListCollection
+from repose.utilities import get_values_from_endpoint, concurrent_map, make_endpoint, \
+    LazyList, weak_proxy, Endpoint, EndpointTemplate, make_params_key
+
+
+class UpdateResult(namedtuple('UpdateResult', ['resource', 'updated', 'error'])):
+    """ The outcome of updating a single resource using :meth:`Manager.bulk_update`
+
+    Attributes:
+
+        resource (Resource): The resource
+        updated (bool): Was an update sent for the resource? ``False`` if
+            the resource had no changes to send
+        error (Exception): The error raised when sending the update, or ``None``
+    """
+    __slots__ = ()
+
+    @property
+    def success(self):
+        return self.error is None
 
 
 class Manager(object):
@@ -68,15 +134,51 @@ class Manager(object):
         api (Api): The Api instance
         decoders (list[Decoder]): The decoders used to decode list data
         model (:class:`~repose.resources.Resource`): The Resource class to be managed
-        results (list): The results as loaded from the API
         results_endpoint (list): The results to be used to fetch results
+        paginator (:class:`~repose.pagination.Paginator`): The paginator to
+            use when fetching results. Defaults to ``Meta.paginator``, if set.
+        stream (bool): Parse the results incrementally as they are
+            received (see :mod:`repose.streaming`). Defaults to ``Meta.stream``.
+        max_workers (int): The maximum number of requests to make
+            concurrently when fetching many resources (see :meth:`get_many`)
+        compact (bool): Load results as read-only
+            :class:`~repose.resources.CompactResource` instances.
+            Defaults to ``Meta.compact``.
+        deferred_fields (frozenset): The names of the fields which will not be
+            requested (see :meth:`only` and :meth:`defer`)
+        query_filters (dict): Filters added using :meth:`filter`
+        query_ordering (tuple[str]): Ordering set using :meth:`order_by`
+        query_slice (tuple[int]): The ``(start, stop)`` of the results to
+            fetch, set by slicing the manager
+        count_source (:class:`~repose.counting.CountSource`): Where to obtain
+            the number of results from. Defaults to ``Meta.count_source``, if set.
+        parent_resource (Resource): The resource upon which this manager is a
+            managed collection (as a :func:`weakref.proxy`), or ``None``
+        prefetch_fields (tuple[str]): The related fields to load for all the
+            results at once (see :meth:`prefetch_related`)
 
     """
     _model = None
-    results = None
+    parent_resource = None
     results_endpoint = None
+    paginator = None
+    stream = None
+    max_workers = 10
+    compact = None
+    deferred_fields = frozenset()
+    query_filters = {}
+    query_ordering = ()
+    query_slice = None
+    count_source = None
+    prefetch_fields = ()
+    _client_only = False
+    _count = None
+    _results = None
+    _cache_key = None
+    _prefetched = False
 
-    def __init__(self, decoders=None, results_endpoint=None, filter=None):
+    def __init__(self, decoders=None, results_endpoint=None, filter=None, paginator=None,
+                 stream=None, compact=None, count_source=None):
         """ Initialise the Manager
 
         Args:
@@ -88,10 +190,24 @@ class Manager(object):
                 Will be passed a single result and must return True/False
                 if the result should be included/excluded in the results
                 respectively.
+            paginator (:class:`~repose.pagination.Paginator`): The paginator to
+                use when fetching results. Defaults to ``Meta.paginator``.
+            stream (bool): Parse the results incrementally as they are
+                received. The decoders will be passed an iterator of items
+                rather than a list. Defaults to ``Meta.stream``.
+            compact (bool): Load results as read-only, memory efficient
+                :class:`~repose.resources.CompactResource` instances.
+                Defaults to ``Meta.compact``.
+            count_source (:class:`~repose.counting.CountSource`): Where to obtain
+                the number of results from. Defaults to ``Meta.count_source``.
         """
         self.decoders = decoders or []
         self.results_endpoint = results_endpoint
         self.filter_fn = filter
+        self.paginator = paginator
+        self.stream = stream
+        self.compact = compact
+        self.count_source = count_source
 
     def get(self, **endpoint_params):
         """Get a single resource
@@ -105,11 +221,468 @@ class Manager(object):
 
             Resource:
         """
-        endpoint = self.model.Meta.endpoint.format(**endpoint_params)
-        data = self.api.get(endpoint)
-        decoded = self.model.decode(data)
-        decoded.update(**get_values_from_endpoint(self.model, endpoint_params))
-        return self.model(**decoded)
+        endpoint = self.get_endpoint(**endpoint_params)
+        resource = self._get_identity(endpoint)
+        if resource is None:
+            data = self.api.get(endpoint)
+            resource = self._build_resource(data, endpoint_params)
+            self._set_identity(endpoint, resource)
+        return resource
+
+    def aget(self, **endpoint_params):
+        """Asynchronous version of :meth:`get`
+
+        Must be awaited, and requires the Api to be using the
+        :class:`~repose.aio.AsyncApiBackend`::
+
+            user = await User.objects.aget(user_id=1)
+
+        Returns:
+
+            Resource:
+        """
+        from repose import aio
+        return aio.manager_get(self, endpoint_params)
+
+    def get_many(self, ids):
+        """Get several resources by their IDs
+
+        If the resource's ``Meta`` declares an ``endpoint_bulk`` then the
+        resources will be fetched from it in batches of ``Meta.bulk_size``
+        (default 100), passing the comma-separated IDs in the
+        ``Meta.bulk_param`` URL parameter (default ``ids``). For example::
+
+            class Meta:
+                endpoint = '/user/{user_id}'
+                endpoint_list = '/user'
+                endpoint_bulk = '/user'  # Eg. /user?ids=1,2,3
+
+        Otherwise each resource is fetched individually
+        using :meth:`get`, with up to :attr:`max_workers` requests
+        being made concurrently.
+
+        Args:
+
+            ids (list): The IDs of the resources to get
+
+        Returns:
+
+            list[Resource]: The resources in the same order as ``ids``. When using
+                a bulk endpoint, IDs not returned by the API are omitted.
+        """
+        ids = list(ids)
+        if not ids:
+            return []
+        if getattr(self.model.Meta, 'endpoint_bulk', None):
+            return self._get_bulk(ids)
+
+        id_param = self.get_id_param()
+        return concurrent_map(lambda id: self.get(**{id_param: id}), ids,
+                              max_workers=self.max_workers)
+
+    def only(self, *fields):
+        """Only request the given fields when fetching results
+
+        The fields are sent in the ``Meta.fields_param`` URL parameter
+        (default ``fields``) as a comma-separated list of their API names.
+        For example::
+
+            # GET /user?fields=id,name
+            for user in User.objects.only('id', 'name'):
+                print(user.name)
+
+        The other fields are deferred. Accessing a deferred field upon
+        a result fetches all its deferred fields in a single request.
+
+        Args:
+
+            *fields (str): The names of the fields to request
+
+        Returns:
+
+            Manager: A new manager for the projected results
+        """
+        self._check_fields(fields)
+        return self._clone(deferred_fields=frozenset(
+            name for name in self.model._fields if name not in fields))
+
+    def defer(self, *fields):
+        """Do not request the given fields when fetching results
+
+        The inverse of :meth:`only`.
+
+        Args:
+
+            *fields (str): The names of the fields which should not be requested
+
+        Returns:
+
+            Manager: A new manager for the projected results
+        """
+        self._check_fields(fields)
+        return self._clone(deferred_fields=self.deferred_fields.union(fields))
+
+    def prefetch_related(self, *fields):
+        """Load the given related fields of all the results at once
+
+        Rather than the related resources of each result being fetched
+        one after another as they are used, the requests for all the
+        results are made together once the results are loaded. Each
+        endpoint is only requested once, and up to :attr:`max_workers`
+        requests are made concurrently. For example::
+
+            # GET /user, then GET /user/1/post, /user/2/post, ... concurrently
+            for user in User.objects.prefetch_related('posts', 'profile'):
+                print(user.name, user.posts.count(), user.profile.email)
+
+        The related fields may be:
+
+        * Managed collections, fetched from the related resource's
+          ``Meta.endpoint_list`` (Eg: ``/user/{user_id}/post``). Collections
+          which were included in a result's data are not fetched.
+        * Managed ID list collections. The resources for all the results
+          are fetched using a single :meth:`get_many`.
+        * Embedded resources, fetched from the related resource's
+          ``Meta.endpoint`` (Eg: ``/user/{user_id}/profile``) unless they
+          were included in a result's data.
+
+        .. note:: Related fields are not prefetched by :meth:`aall`.
+
+        Args:
+
+            *fields (str): The names of the related fields
+
+        Returns:
+
+            Manager: A new manager which prefetches the related fields
+        """
+        self._check_fields(fields)
+        for name in fields:
+            field = self.model._fields[name]
+            if not isinstance(field, (Embedded, ManagedCollection)):
+                raise FieldError('{} is not a related field'.format(name))
+            if isinstance(field, Embedded) and not getattr(field.model.Meta, 'endpoint', None):
+                raise FieldError('{} cannot be fetched as {} has no endpoint'.format(
+                    name, field.model.__name__))
+        return self._clone(prefetch_fields=self.prefetch_fields + fields, _prefetched=False)
+
+    def _prefetch_related(self, resources):
+        """Fetch the related fields (see :meth:`prefetch_related`) of the resources
+
+        Returns:
+
+            None
+        """
+        requests = []
+        for name in self.prefetch_fields:
+            field = self.model._fields[name]
+            if isinstance(field, ManagedIdListCollection):
+                requests.extend(self._prefetch_id_lists(resources, name))
+            elif isinstance(field, ManagedCollection):
+                requests.extend(self._prefetch_collections(resources, name))
+            else:
+                requests.extend(self._prefetch_embedded(resources, name, field))
+        responses = concurrent_map(lambda request: request[0](), requests,
+                                   max_workers=self.max_workers)
+        # Attach the responses once all have been received, rather than
+        # modifying the resources from several threads
+        for (_, attach), response in zip(requests, responses):
+            attach(response)
+
+    def _prefetch_id_lists(self, resources, name):
+        lists = []
+        for resource in resources:
+            results = getattr(resource, name).results
+            if (isinstance(results, LazyList) and not results.is_loaded()
+                    and isinstance(results.loader, IdListLoader)):
+                lists.append(results)
+        if not lists:
+            return []
+        # Fetch each resource once, even if it is listed by several results
+        ids = list(OrderedDict((id, None) for lst in lists for id in lst.loader.ids))
+
+        def attach(loaded):
+            by_id = dict(zip(ids, loaded))
+            for lst in lists:
+                lst.set_loaded([by_id.get(id) for id in lst.loader.ids])
+
+        return [(lambda: lists[0].loader.load(ids), attach)]
+
+    def _prefetch_collections(self, resources, name):
+        managers = OrderedDict()
+        for resource in resources:
+            manager = getattr(resource, name)
+            if manager.results is None or not len(manager.results):
+                managers.setdefault(manager.get_results_endpoint(), []).append(manager)
+
+        def make_request(group):
+            def attach(loaded):
+                for manager in group:
+                    manager.results = LazyList(loaded, size=len(loaded))
+                    if manager.parent_resource is not None:
+                        manager.results.set_parent_lazy(manager.parent_resource)
+            return lambda: list(group[0]._fetch_results()), attach
+
+        return [make_request(group) for group in managers.values()]
+
+    def _prefetch_embedded(self, resources, name, field):
+        template = field.model.get_endpoint_template()
+        parents = OrderedDict()
+        for resource in resources:
+            if getattr(resource, name) is None:
+                parents.setdefault(template.render_for_parent(resource), []).append(resource)
+
+        def make_request(endpoint, group):
+            def attach(data):
+                for parent in group:
+                    value = field.model.from_data(data)
+                    # Set directly, as this is not a change to the parent
+                    if hasattr(parent, '_data'):
+                        field.__set__(parent, value)
+                    else:
+                        object.__setattr__(parent, name, value)
+                    value.contribute_parents(parent)
+            return lambda: self.api.get(endpoint), attach
+
+        return [make_request(endpoint, group) for endpoint, group in parents.items()]
+
+    def _check_fields(self, fields):
+        for name in fields:
+            if name not in self.model._fields:
+                raise FieldError(name)
+
+    def _clone(self, **attrs):
+        """Copy this manager
+
+        If this manager's results have been loaded (or were provided, as
+        for managed collections) then the copy will filter, order and slice
+        those results itself rather than sending a new request.
+
+        Args:
+
+            **attrs: Attributes to set upon the copy
+
+        Returns:
+
+            Manager:
+        """
+        clone = copy.copy(self)
+        clone._count = None
+        clone._results = self.results
+        if self.results is not None:
+            # Apply any further querying to the results we already have
+            clone._client_only = True
+        for k, v in attrs.items():
+            setattr(clone, k, v)
+        return clone
+
+    def _get_bulk(self, ids):
+        meta = self.model.Meta
+        param = getattr(meta, 'bulk_param', 'ids')
+        size = getattr(meta, 'bulk_size', 100)
+        id_param = self.get_id_param()
+
+        by_id = {}
+        missing = []
+        for id in ids:
+            resource = self._get_identity(self.get_endpoint(**{id_param: id}))
+            if resource is None:
+                missing.append(id)
+            else:
+                by_id[str(id)] = resource
+
+        def fetch(batch):
+            params = {param: ','.join(str(id) for id in batch)}
+            data = self.api.get(Endpoint(meta.endpoint_bulk, resource=self.model), params=params)
+            return self._decode_results(data, model=self.model)
+
+        batches = [missing[i:i + size] for i in range(0, len(missing), size)]
+        for resources in concurrent_map(fetch, batches, max_workers=self.max_workers):
+            for resource in resources:
+                by_id[str(resource.id)] = resource
+                self._set_identity(self.get_endpoint(**{id_param: resource.id}), resource)
+        return [by_id[str(id)] for id in ids if str(id) in by_id]
+
+    def bulk_update(self, resources, fields=None):
+        """Save the changes made to many resources
+
+        Only resources which have changed are sent. If the resource's
+        ``Meta`` declares an ``endpoint_bulk_update`` then the changes are
+        sent to it in batches of ``Meta.bulk_size`` (default 100) as a list
+        of objects, each including the resource's ``id``. For example::
+
+            class Meta:
+                endpoint = '/user/{user_id}'
+                endpoint_bulk_update = '/user/bulk'
+
+        Otherwise each resource is saved individually, with up to
+        :attr:`max_workers` requests being made concurrently.
+
+        A failure to update one resource does not prevent the others from
+        being updated. The outcome for each resource is returned instead.
+
+        Args:
+
+            resources (list[Resource]): The resources to save
+            fields (list[str]): Only save changes to these fields.
+                Defaults to all fields
+
+        Returns:
+
+            list[UpdateResult]: The outcome for each resource, in the same
+                order as ``resources``
+        """
+        resources = list(resources)
+        pending = []
+        for resource in resources:
+            prepared = resource.prepare_save(resource.get_changes(fields))
+            if prepared:
+                pending.append((resource, prepared))
+
+        endpoint = getattr(self.model.Meta, 'endpoint_bulk_update', None)
+        if endpoint:
+            errors = self._put_bulk(Endpoint(endpoint, resource=self.model), pending)
+        else:
+            errors = concurrent_map(self._put_one, pending, max_workers=self.max_workers)
+
+        outcomes = {}
+        for (resource, _), error in zip(pending, errors):
+            if error is None:
+                resource._mark_saved(fields)
+            outcomes[id(resource)] = UpdateResult(resource, True, error)
+        if pending:
+            self.model.invalidate_results()
+        return [outcomes.get(id(r), UpdateResult(r, False, None)) for r in resources]
+
+    def _put_one(self, item):
+        resource, prepared = item
+        try:
+            self.api.put(make_endpoint(resource), prepared)
+        except Exception as e:
+            return e
+
+    def _put_bulk(self, endpoint, pending):
+        size = getattr(self.model.Meta, 'bulk_size', 100)
+
+        def put(batch):
+            data = [dict(prepared, id=resource.id) for resource, prepared in batch]
+            try:
+                self.api.put(endpoint, data)
+            except Exception as e:
+                return [e] * len(batch)
+            return [None] * len(batch)
+
+        batches = [pending[i:i + size] for i in range(0, len(pending), size)]
+        errors = []
+        for batch_errors in concurrent_map(put, batches, max_workers=self.max_workers):
+            errors.extend(batch_errors)
+        return errors
+
+    def get_id_param(self):
+        """ Get the :attr:`Meta.endpoint` parameter which identifies a single resource
+
+        Used by :meth:`get_many`.
+
+        .. note:: This assumes the endpoint is in the form
+            ``/myresource/{myresource_id}``, and that the resource
+            has an ``id`` field.
+
+        Returns:
+
+            str: Parameter name in the form ``{resourcename}_id``
+        """
+        return '{}_id'.format(self.model.__name__.lower())
+
+    def get_endpoint(self, **endpoint_params):
+        """ Get the endpoint for a single resource
+
+        Args:
+
+            endpoint_params (dict): Parameters which should be used to format the
+                 :attr:`Meta.endpoint` string.
+
+        Returns:
+
+            str:
+        """
+        return self.model.get_endpoint_template().format(**endpoint_params)
+
+    def _get_identity(self, endpoint):
+        """Get the shared instance for the endpoint from the Api's identity map
+
+        Returns:
+
+            Resource: The instance, or ``None`` if not found or no
+                :class:`~repose.cache.IdentityMap` is in use
+        """
+        identity_map = getattr(self.api, 'identity_map', None)
+        if identity_map is not None:
+            return identity_map.get_resource(self.model, endpoint)
+
+    def _set_identity(self, endpoint, resource):
+        """Add the resource to the Api's identity map, if one is in use
+        """
+        identity_map = getattr(self.api, 'identity_map', None)
+        if identity_map is not None:
+            identity_map.add(self.model, endpoint, resource)
+
+    def _build_resource(self, data, endpoint_params):
+        """Decode the API data for a single resource and instantiate it
+
+        Returns:
+
+            Resource:
+        """
+        return self.model.from_data(data, **get_values_from_endpoint(self.model, endpoint_params))
+
+    @property
+    def results(self):
+        """ The results as loaded from the API, or ``None`` if not loaded
+
+        If the Api has a :class:`~repose.cache.ResultCache` then results
+        which have since expired or been invalidated are no longer returned.
+        """
+        if self._cache_key is not None and self._results is not None:
+            cache = self._get_result_cache()
+            if cache is not None and cache.get(self._cache_key) is not self._results:
+                self._results = None
+                self._cache_key = None
+        return self._results
+
+    @results.setter
+    def results(self, results):
+        self._results = results
+        self._cache_key = None
+
+    def _get_result_cache(self):
+        return getattr(self.api, 'result_cache', None)
+
+    def get_cache_key(self):
+        """ Get the key identifying this manager's query in the result cache
+
+        Returns:
+
+            tuple:
+        """
+        params = make_params_key(self.get_params())
+        return self.model, self.get_results_endpoint(), params, self.get_compact()
+
+    def invalidate(self):
+        """ Discard any loaded results and counts
+
+        If the Api has a :class:`~repose.cache.ResultCache` then all
+        cached results for the resource are also discarded. This happens
+        automatically when a resource is saved.
+        """
+        if self._cache_key is not None:
+            # Only discard results which were loaded by this manager. Those
+            # provided to it (Eg: for managed collections) are kept.
+            self._results = None
+            self._cache_key = None
+        self._count = None
+        cache = self._get_result_cache()
+        if cache is not None:
+            cache.invalidate(self.model)
 
     def _load_results(self):
         """Load all the results for this manager
@@ -120,10 +693,85 @@ class Manager(object):
         """
         if self.results is not None:
             return
-        data = self.api.get(self.get_results_endpoint())
+        key = self.get_cache_key()
+        cache = self._get_result_cache()
+        if cache is None:
+            results = list(self._fetch_results())
+        else:
+            results = cache.get(key)
+            if results is None:
+                generation = cache.generation(self.model)
+                results = list(self._fetch_results())
+                cache.set(key, results, generation)
+        self._store_results(key, results)
+
+    def _store_results(self, key, results):
+        """Keep results which have been loaded from the API
+
+        Args:
+
+            key (tuple): The query's key in the result cache (see :meth:`get_cache_key`)
+            results (list[Resource]):
+        """
+        self._results = results
+        self._cache_key = key
+        self._prefetched = False
+        if self.parent_resource is not None:
+            # Results from the result cache may have been linked to another
+            # instance of the parent
+            for resource in results:
+                resource.contribute_parents(self.parent_resource)
+
+    def _fetch_results(self):
+        """Fetch the results from the API, one page at a time
+
+        Returns:
+
+            generator: Yielding each :class:`~repose.resources.Resource` in turn
+        """
+        endpoint = self.get_results_endpoint()
+        params = self.get_params()
+        paginator = self.get_paginator()
+        if paginator is not None and not self._slice_on_server():
+            pages = paginator.paginate(self.api, endpoint, params)
+        elif self.get_stream():
+            pages = [self.api.stream(endpoint, params)]
+        else:
+            pages = [self.api.get(endpoint, params)]
+
+        for data in pages:
+            for resource in self._iter_results(data):
+                yield resource
+
+    def _decode_results(self, data, model=None):
+        """Decode the API data for a list of resources
+
+        Args:
+
+            data (list): The API data
+            model (type): The class to instantiate.
+                Defaults to :meth:`get_result_class`
+
+        Returns:
+
+            list[Resource]:
+        """
+        return list(self._iter_results(data, model))
+
+    def _iter_results(self, data, model=None):
+        model = model or self.get_result_class()
+        deferred = self.deferred_fields
+        parent = self.parent_resource
         for decoder in self.get_decoders():
             data = decoder(data)
-        self.results = [self.model(**self.model.decode(d)) for d in data]
+        for d in data:
+            if deferred:
+                resource = model.from_projection(d, deferred)
+            else:
+                resource = model.from_data(d)
+            if parent is not None:
+                resource.contribute_parents(parent)
+            yield resource
 
     def get_decoders(self):
         """ Return the decoders to be used for decoding list data
@@ -134,14 +782,165 @@ class Manager(object):
         """
         return self.decoders
 
+    def get_paginator(self):
+        """ Get the paginator to use when fetching results
+
+        Returns:
+
+            :class:`~repose.pagination.Paginator`: The ``paginator`` passed to
+                :func:`__init__`, otherwise ``Meta.paginator``, otherwise ``None``
+        """
+        return self.paginator or getattr(self.model.Meta, 'paginator', None)
+
+    def get_stream(self):
+        """ Should the results be parsed incrementally as they are received?
+
+        Returns:
+
+            bool: The ``stream`` value passed to :func:`__init__`,
+                otherwise ``Meta.stream``, otherwise ``False``
+        """
+        if self.stream is not None:
+            return self.stream
+        return getattr(self.model.Meta, 'stream', False)
+
+    def get_compact(self):
+        """ Should results be loaded as read-only compact resources?
+
+        Returns:
+
+            bool: The ``compact`` value passed to :func:`__init__`,
+                otherwise ``Meta.compact``, otherwise ``False``
+        """
+        if self.compact is not None:
+            return self.compact
+        return getattr(self.model.Meta, 'compact', False)
+
+    def get_result_class(self):
+        """ Get the class used for each result
+
+        Returns:
+
+            type: The model, or its :meth:`~repose.resources.Resource.compact_class`
+        """
+        if self.get_compact():
+            return self.model.compact_class()
+        return self.model
+
+    def get_params(self):
+        """ Get the URL parameters to send when fetching results
+
+        Returns:
+
+            dict: Including the projection parameter if
+                :meth:`only` or :meth:`defer` have been used
+        """
+        meta = self.model.Meta
+        params = {}
+        if self.deferred_fields:
+            fields = self.model._fields
+            param = getattr(meta, 'fields_param', 'fields')
+            params[param] = ','.join(sorted(
+                fields[name].options.get('name', name)
+                for name in fields if name not in self.deferred_fields
+            ))
+
+        if self._client_only:
+            return params
+
+        params.update(self._get_server_filters())
+        if self.query_ordering and self._order_on_server():
+            params[meta.order_param] = ','.join(self.query_ordering)
+        if self._slice_on_server():
+            start, stop = self.query_slice
+            if start:
+                params[meta.offset_param] = start
+            if stop is not None:
+                params[meta.limit_param] = stop - start
+        return params
+
+    def get_filter_params(self):
+        """ Get the URL parameter used for each filter supported by the API
+
+        Defined by ``Meta.filters``. For example::
+
+            class Meta:
+                endpoint_list = '/user'
+                # Eg. User.objects.filter(active=True, search='bob')
+                #     will request /user?is_active=True&q=bob
+                filters = {'active': 'is_active', 'search': 'q'}
+
+        A list of filter names may also be given, if each name
+        matches its URL parameter.
+
+        Returns:
+
+            dict: URL parameter names, keyed by filter name
+        """
+        filters = getattr(self.model.Meta, 'filters', None) or {}
+        if not isinstance(filters, dict):
+            filters = dict((name, name) for name in filters)
+        return filters
+
+    def _get_server_filters(self):
+        mapping = self.get_filter_params()
+        return dict((mapping[name], value) for name, value in self.query_filters.items()
+                    if name in mapping and not self._client_only)
+
+    def _get_client_filters(self):
+        mapping = {} if self._client_only else self.get_filter_params()
+        return dict((name, value) for name, value in self.query_filters.items()
+                    if name not in mapping)
+
+    def _order_on_server(self):
+        return bool(getattr(self.model.Meta, 'order_param', None)) and not self._client_only
+
+    def _slice_on_server(self):
+        """Can the slice be fetched from the API using limit/offset parameters?
+        """
+        if self.query_slice is None or self._client_only:
+            return False
+        meta = self.model.Meta
+        start, stop = self.query_slice
+        if self.filter_fn or self._get_client_filters():
+            return False
+        if self.query_ordering and not self._order_on_server():
+            return False
+        if start and not getattr(meta, 'offset_param', None):
+            return False
+        if stop is not None and not getattr(meta, 'limit_param', None):
+            return False
+        return True
+
+    def _matches(self, resource):
+        """Does the resource pass the client-side filters?
+        """
+        if self.filter_fn is not None and not self.filter_fn(resource):
+            return False
+        for name, value in self._get_client_filters().items():
+            if getattr(resource, name, None) != value:
+                return False
+        return True
+
     def get_results_endpoint(self):
         """ Get the results endpoint
 
+        For a managed collection the endpoint is rendered using the values
+        of the parent resource (Eg: ``/user/{user_id}/post`` becomes
+        ``/user/1/post``).
+
         Returns:
 
             str: ``results_endpoint`` as passed to :func:`__init__` or :attr:`Meta.endpoint_list`.
         """
-        return self.results_endpoint or self.model.Meta.endpoint_list
+        if self.parent_resource is None:
+            return Endpoint(self.results_endpoint or self.model.Meta.endpoint_list,
+                            resource=self.model)
+        if self.results_endpoint:
+            template = EndpointTemplate(self.results_endpoint, self.model)
+        else:
+            template = self.model.get_endpoint_template('endpoint_list')
+        return template.render_for_parent(self.parent_resource)
 
     def contribute_to_class(self, model):
         self._model = model
@@ -169,38 +968,323 @@ class Manager(object):
         else:
             return self._model
 
-    def filter(self, results):
-        if self.filter_fn:
-            return list(filter(self.filter_fn, results))
+    def filter(self, **filters):
+        """ Filter the results
+
+        Filters declared in ``Meta.filters`` are sent to the API as URL
+        parameters (see :meth:`get_filter_params`). Any other filters are
+        applied once the results have been fetched, by comparing them
+        with the resource's attribute of the same name.
+
+        Args:
+
+            **filters: Filter names and values
+
+        Returns:
+
+            Manager: A new manager for the filtered results
+        """
+        self._check_unsliced()
+        query_filters = dict(self.query_filters)
+        query_filters.update(filters)
+        return self._clone(query_filters=query_filters)
+
+    def order_by(self, *fields):
+        """ Order the results
+
+        If ``Meta.order_param`` is set then the ordering is sent to the API
+        as a comma-separated list in that URL parameter. Otherwise the
+        results are sorted once fetched. Prefix a field with ``-`` to sort
+        in descending order::
+
+            User.objects.order_by('-created', 'name')
+
+        Args:
+
+            *fields (str): The fields to order by
+
+        Returns:
+
+            Manager: A new manager for the ordered results
+        """
+        self._check_unsliced()
+        return self._clone(query_ordering=fields)
+
+    def _check_unsliced(self):
+        if self.query_slice is not None:
+            raise TypeError('Cannot filter or order results once a slice has been taken')
+
+    def __getitem__(self, key):
+        """ Slice the results
+
+        If ``Meta.limit_param`` and ``Meta.offset_param`` are set then
+        only the requested results will be fetched from the API::
+
+            # GET /user?offset=100&limit=100
+            users = User.objects[100:200]
+
+        Otherwise all the results are loaded by this manager, and then
+        sliced, so that indexing it repeatedly makes only a single request.
+
+        Returns:
+
+            Manager: A new manager for the sliced results when given a slice, or
+                a single resource when given an index
+        """
+        if isinstance(key, slice):
+            negative = (key.start or 0) < 0 or (key.stop or 0) < 0
         else:
-            return results
+            negative = key < 0
+        if negative:
+            # Resolve negative indices using the count
+            count = self.count()
+        if self.results is not None and not self._client_only:
+            return self.all()[key]
+
+        if isinstance(key, slice):
+            if key.step not in (None, 1):
+                return self.all()[key]
+            if negative:
+                start, stop, _ = key.indices(count)
+            else:
+                start, stop = key.start or 0, key.stop
+            sliced = self._slice(start, stop)
+            if sliced._slice_on_server():
+                return sliced
+            # Keep the results, so that further slices need not fetch them again
+            self._load_results()
+            return self._slice(start, stop)
+
+        if negative:
+            key += count
+            if key < 0:
+                raise IndexError('Index out of range')
+        sliced = self._slice(key, key + 1)
+        if not sliced._slice_on_server():
+            sliced = self.all()[key:key + 1]
+        for resource in sliced:
+            return resource
+        raise IndexError('Index out of range')
+
+    def _slice(self, start, stop):
+        """Copy this manager, further slicing its results
+        """
+        return self._clone(query_slice=_combine_slices(self.query_slice, start, stop))
+
+    def filter_results(self, results):
+        """ Apply the client-side filtering, ordering and slicing to the results
+
+        Args:
+
+            results (list[Resource]): The results fetched from the API
+
+        Returns:
+
+            list[Resource]:
+        """
+        if self.filter_fn or self._get_client_filters():
+            results = [r for r in results if self._matches(r)]
+        if self.query_ordering and not self._order_on_server():
+            for field in reversed(self.query_ordering):
+                results = sorted(results, key=attrgetter(field.lstrip('-')),
+                                 reverse=field.startswith('-'))
+        if self.query_slice is not None and not self._slice_on_server():
+            start, stop = self.query_slice
+            results = results[start:stop]
+        return results
 
     def all(self):
         """ Return all results
         """
         self._load_results()
-        return self.filter(self.results)
+        results = self.filter_results(self.results)
+        if self.prefetch_fields and not self._prefetched:
+            self._prefetched = True
+            self._prefetch_related(results)
+        return results
+
+    def aall(self):
+        """ Asynchronous version of :meth:`all`
+
+        Must be awaited, and requires the Api to be using the
+        :class:`~repose.aio.AsyncApiBackend`.
+        """
+        from repose import aio
+        return aio.manager_all(self)
 
     def __iter__(self):
+        if self.results is None and self._can_stream():
+            # Stream the results rather than loading them all
+            return (r for r in self._fetch_results() if self._matches(r))
         return iter(self.all())
 
+    def _can_stream(self):
+        """ Can the results be iterated over as they are fetched, rather than loaded first?
+        """
+        if self.get_paginator() is None and not self.get_stream():
+            return False
+        if self.prefetch_fields:
+            # The related fields are fetched for all the results together
+            return False
+        client_ordering = self.query_ordering and not self._order_on_server()
+        client_slicing = self.query_slice is not None and not self._slice_on_server()
+        return not (client_ordering or client_slicing)
+
+    def __aiter__(self):
+        """ Iterate over the results using ``async for``
+
+        Requires the Api to be using the
+        :class:`~repose.aio.AsyncApiBackend`.
+        """
+        from repose import aio
+        return aio.ManagerIterator(self)
+
     def count(self):
         """ Return the total number of results
 
+        If a :mod:`count source <repose.counting>` is available then the
+        count is requested from the API. Otherwise all the results are
+        retrieved and counted. The count is cached by the manager.
+
         Returns:
 
             int
+        """
+        cache = self._get_result_cache()
+        if cache is None or not self._can_count():
+            if self._count is None:
+                self._count = self._fetch_count()
+            return self._count
+
+        key = self.get_cache_key() + ('count',)
+        count = cache.get(key)
+        if count is None:
+            generation = cache.generation(self.model)
+            count = self._fetch_count()
+            cache.set(key, count, generation)
+        return count
 
-        .. note::
+    def exists(self):
+        """ Are there any results?
 
-            This is a naive implementation of ``count()`` which simply
-            retrieves all results and counts them. You should
-            consider overriding this (as demoed above) if dealing
-            with non-trivial numbers of results.
+        Uses the count if available, otherwise fetches at most a single
+        result where possible.
 
+        Returns:
+
+            bool
+        """
+        if self._count is not None or self.results is not None or self._can_count():
+            return self.count() > 0
+        first = self._slice(0, 1)
+        if not first._slice_on_server():
+            first = self
+        for _ in first:
+            return True
+        return False
+
+    def get_count_source(self):
+        """ Get the source from which to obtain the number of results
+
+        Returns:
+
+            :class:`~repose.counting.CountSource`: The ``count_source`` passed to
+                :func:`__init__`, otherwise ``Meta.count_source``, otherwise ``None``
         """
-        return len(self.all())
+        return self.count_source or getattr(self.model.Meta, 'count_source', None)
+
+    def _can_count(self):
+        """ Can the count be requested from the API?
+        """
+        return (self.get_count_source() is not None and self.results is None
+                and not self._client_only and not self.filter_fn
+                and not self._get_client_filters())
+
+    def _fetch_count(self):
+        if not self._can_count():
+            return len(self.all())
+        unsliced = self._clone(query_slice=None, query_ordering=(), deferred_fields=frozenset())
+        params = unsliced.get_params()
+        limit_param = getattr(self.model.Meta, 'limit_param', None)
+        if limit_param:
+            params[limit_param] = 1
+        total = self.get_count_source().count(self.api, self.get_results_endpoint(), params)
+        if total is None:
+            return len(self.all())
+        if self.query_slice is None:
+            return total
+        start, stop = self.query_slice
+        stop = total if stop is None else min(stop, total)
+        return max(0, stop - start)
+
+    def __len__(self):
+        """ The number of results, if already known
+
+        The count is known once :meth:`count` has been called, or once the
+        results have been loaded. Otherwise a ``TypeError`` is raised rather
+        than making a request, as ``list(manager)`` calls ``__len__()``
+        before iterating (and therefore streaming) the results.
+        """
+        count = self._known_count()
+        if count is None:
+            raise TypeError(
+                "The number of {} results is not yet known. Use count() to "
+                "request it.".format(self.model.__name__))
+        return count
+
+    def _known_count(self):
+        """ Get the number of results if it is known without making a request
+
+        Returns:
+
+            int: ``None`` if the count is not known
+        """
+        if self._count is not None:
+            return self._count
+        if self.results is not None:
+            return self.count()
+        cache = self._get_result_cache()
+        if cache is not None and self._can_count():
+            return cache.get(self.get_cache_key() + ('count',))
+        return None
+
+    def __bool__(self):
+        # Always true, as __len__() raises if the count is not yet known
+        return True
+
+    __nonzero__ = __bool__
 
     def contribute_parents(self, parent):
-        for resource in self.all():
-            resource.contribute_parents(parent)
+        """ Set the resource upon which this manager is a managed collection
+
+        The results are not loaded. Each result is linked to the
+        parent once the results have been loaded.
+
+        .. note:: Mainly for internal use
+        """
+        parent = weak_proxy(parent)
+        self.parent_resource = parent
+        if isinstance(self.results, LazyList):
+            self.results.set_parent_lazy(parent)
+        elif self.results is not None:
+            for resource in self.results:
+                resource.contribute_parents(parent)
+
+
+def _combine_slices(current, start, stop):
+    """Apply a slice to results which have already been sliced
+
+    Returns:
+
+        tuple: The combined ``(start, stop)``
+    """
+    if current is None:
+        return start, stop
+    current_start, current_stop = current
+    start = current_start + start
+    stop = None if stop is None else current_start + stop
+    if current_stop is not None:
+        stop = current_stop if stop is None else min(stop, current_stop)
+    if stop is not None:
+        start = min(start, stop)
+    return start, stop
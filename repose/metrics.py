@@ -0,0 +1,204 @@
+"""
+Per-request metrics.
+
+Every request made by the backend can be reported to one or more
+hooks, listed in the backend's ``request_hooks`` option. Each hook is
+called with a :class:`RequestEvent` once the request has completed
+(successfully or otherwise)::
+
+    def log_request(event):
+        print(event.method, event.template, event.status, event.latency)
+
+    my_api = Api(base_url='http://example.com/api/v1',
+                 backend_options={'request_hooks': [log_request]})
+
+Requests are identified by their endpoint template (Eg: ``/user/{user_id}``)
+rather than the rendered endpoint (Eg: ``/user/1``), so that all requests
+for a given kind of resource can be grouped together.
+
+The :class:`MetricsAggregator` hook keeps per-template request counts,
+error rates and latency percentiles, ready to be exported::
+
+    metrics = MetricsAggregator()
+    my_api = Api(base_url='http://example.com/api/v1',
+                 backend_options={'request_hooks': [metrics]})
+
+    ... make requests ...
+
+    for row in metrics.export():
+        statsd.gauge('api.{method}.{template}.p99'.format(**row), row['latency']['p99'])
+
+.. note:: Requests served from the backend's response cache are not
+    reported, as no request is made. Nor are requests made by calling the
+    backend's ``send()`` directly. Use its ``fetch()`` method instead if
+    the response itself is needed.
+"""
+import math
+import threading
+from collections import deque, namedtuple, OrderedDict
+
+
+class RequestEvent(namedtuple('RequestEvent', [
+        'method', 'endpoint', 'template', 'resource', 'status', 'error',
+        'connect', 'transfer', 'parse', 'request_bytes', 'response_bytes', 'retries'])):
+    """ The outcome of a single request
+
+    Attributes:
+
+        method (str): The HTTP method (Eg: ``"GET"``)
+        endpoint (str): The endpoint requested (Eg: ``"/user/1"``)
+        template (str): The endpoint template (Eg: ``"/user/{user_id}"``).
+            The same as ``endpoint`` if the endpoint was not rendered
+            from a resource's ``Meta``.
+        resource (type): The :class:`~repose.resources.Resource` class, if known
+        status (int): The HTTP status code, or ``None`` if no response was received
+        error (Exception): The error raised, or ``None``
+        connect (float): Seconds until the response headers were received
+            (connecting, sending the request and the server's processing time)
+        transfer (float): Seconds spent receiving the response body
+        parse (float): Seconds spent deserializing the response body
+        request_bytes (int): The size of the request body (``0`` if unknown)
+        response_bytes (int): The size of the response body, if known
+        retries (int): The number of times the request was retried (see
+            :mod:`repose.ratelimit`). The times given are those of the final attempt.
+    """
+    __slots__ = ()
+
+    @property
+    def latency(self):
+        """ The total number of seconds taken
+        """
+        return self.connect + self.transfer + self.parse
+
+    @property
+    def failed(self):
+        """ Did the request raise an error, or receive an error status?
+        """
+        return self.error is not None or (self.status or 0) >= 400
+
+
+def get_template(endpoint):
+    """ Get the template from which an endpoint was rendered
+
+    Args:
+
+        endpoint (str): Typically an :class:`~repose.utilities.Endpoint`
+
+    Returns:
+
+        tuple: The ``(template, resource)``
+    """
+    return getattr(endpoint, 'template', endpoint), getattr(endpoint, 'resource', None)
+
+
+def percentile(values, percent):
+    """ Get a percentile of the sorted values, using the nearest-rank method
+
+    Returns:
+
+        float: ``None`` if there are no values
+    """
+    if not values:
+        return None
+    rank = int(math.ceil(percent / 100.0 * len(values)))
+    return values[min(max(rank, 1), len(values)) - 1]
+
+
+class _TemplateStats(object):
+
+    def __init__(self, resource, max_samples):
+        self.resource = resource
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.samples = dict((name, deque(maxlen=max_samples))
+                            for name in ('latency', 'connect', 'transfer', 'parse'))
+
+    def add(self, event):
+        self.count += 1
+        self.errors += event.failed
+        self.retries += event.retries
+        self.request_bytes += event.request_bytes or 0
+        self.response_bytes += event.response_bytes or 0
+        self.samples['latency'].append(event.latency)
+        for name in ('connect', 'transfer', 'parse'):
+            self.samples[name].append(getattr(event, name))
+
+
+class MetricsAggregator(object):
+    """ A request hook which aggregates the requests for each endpoint template
+
+    Percentiles are calculated from the most recent ``max_samples``
+    requests for each template.
+
+    Attributes:
+
+        percentiles (tuple[float]): The latency percentiles to export
+    """
+    percentiles = (50, 90, 99)
+
+    def __init__(self, max_samples=1000):
+        """ Initialise the aggregator
+
+        Args:
+
+            max_samples (int): The number of latencies to keep for each template
+        """
+        self.max_samples = max_samples
+        self._stats = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __call__(self, event):
+        key = (event.method, event.template)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = _TemplateStats(event.resource, self.max_samples)
+            stats.add(event)
+
+    def reset(self):
+        """ Discard all the metrics gathered so far
+        """
+        with self._lock:
+            self._stats.clear()
+
+    def export(self):
+        """ Get the metrics for each method and endpoint template
+
+        Returns:
+
+            list[dict]: One dictionary per method and template, containing
+                ``method``, ``template``, ``resource`` (the class name),
+                ``count``, ``errors``, ``error_rate``, ``retries``,
+                ``request_bytes``, ``response_bytes``, and the ``latency``,
+                ``connect``, ``transfer`` and ``parse`` times. Each time is a
+                dictionary of the ``mean``, ``max`` and each percentile
+                (Eg: ``p99``), in seconds.
+        """
+        with self._lock:
+            items = [(key, stats, dict((name, sorted(samples))
+                                       for name, samples in stats.samples.items()))
+                     for key, stats in self._stats.items()]
+
+        rows = []
+        for (method, template), stats, samples in items:
+            row = dict(
+                method=method,
+                template=template,
+                resource=getattr(stats.resource, '__name__', None),
+                count=stats.count,
+                errors=stats.errors,
+                error_rate=float(stats.errors) / stats.count,
+                retries=stats.retries,
+                request_bytes=stats.request_bytes,
+                response_bytes=stats.response_bytes,
+            )
+            for name, values in samples.items():
+                timing = dict(mean=sum(values) / len(values), max=values[-1])
+                for percent in self.percentiles:
+                    timing['p{}'.format(percent)] = percentile(values, percent)
+                row[name] = timing
+            rows.append(row)
+        return rows
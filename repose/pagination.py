@@ -0,0 +1,233 @@
+"""
+Paginators are used by :class:`~repose.managers.Manager` instances
+to load resources from list endpoints which are split into pages.
+
+A paginator can be declared either on the resource's ``Meta``, or
+upon a specific manager::
+
+    class User(Resource):
+        ... define fields...
+
+        class Meta:
+            endpoint = '/user/{user_id}'
+            endpoint_list = '/user'
+            paginator = PagePaginator(per_page=50)
+
+    class Repository(Resource):
+        ... define fields...
+
+        objects = Manager(paginator=LinkHeaderPaginator(per_page=100))
+
+Iterating over a paginated manager will fetch one page at a time, so
+only a single page of results needs to be held in memory::
+
+    for user in User.objects:
+        print(user.name)
+
+Whereas calling :meth:`~repose.managers.Manager.all` will still load
+every page.
+
+Each paginator describes the request for the first page, and how to
+derive the request for each following page from the previous response
+(see :meth:`Paginator.first_request` and :meth:`Paginator.next_request`).
+This allows the same paginators to be used with the
+:class:`~repose.aio.AsyncApiBackend`.
+"""
+
+
+class Paginator(object):
+    """ Base class for all paginators
+
+    Attributes:
+
+        results_key (str): If the API returns each page wrapped in an
+            envelope (Eg: ``{"results": [...], "next": ...}``), the
+            key in which the page's items can be found. ``None`` if
+            the API returns a plain list.
+    """
+    results_key = None
+
+    def __init__(self, results_key=None):
+        if results_key is not None:
+            self.results_key = results_key
+
+    def paginate(self, api, endpoint, params=None):
+        """ Fetch the pages for the given endpoint
+
+        Args:
+
+            api (Api): The Api (or Api backend) to fetch the pages from
+            endpoint (str): The API endpoint (Eg: ``"/user"``)
+            params (dict): Any additional URL params to send
+
+        Returns:
+
+            generator: Yielding a list of items for each page in turn
+        """
+        request = self.first_request(endpoint, params)
+        while request is not None:
+            response, data = api.fetch('GET', request[0], params=request[1])
+            items = self.get_items(data)
+            if items:
+                yield items
+            request = self.next_request(request, response, data)
+
+    def first_request(self, endpoint, params=None):
+        """ Get the request for the first page
+
+        Args:
+
+            endpoint (str): The API endpoint (Eg: ``"/user"``)
+            params (dict): Any additional URL params to send
+
+        Returns:
+
+            tuple: The ``(endpoint, params)`` to request
+        """
+        raise NotImplementedError()
+
+    def next_request(self, request, response, data):
+        """ Get the request for the page following the one just received
+
+        Args:
+
+            request (tuple): The ``(endpoint, params)`` of the page received
+            response: The response for the page received
+            data (object): The parsed data of the page received
+
+        Returns:
+
+            tuple: The ``(endpoint, params)`` to request, or ``None`` if
+                that was the last page
+        """
+        raise NotImplementedError()
+
+    def get_items(self, data):
+        """ Get the items from the data for a single page
+        """
+        if self.results_key:
+            return data[self.results_key]
+        else:
+            return data
+
+
+class PagePaginator(Paginator):
+    """ Paginate using a page number and page size
+
+    For example: ``/user?page=2&per_page=100``
+
+    Pages are requested until a page contains fewer than ``per_page`` items.
+    """
+
+    def __init__(self, per_page=100, page_param='page', per_page_param='per_page',
+                 first_page=1, results_key=None):
+        super(PagePaginator, self).__init__(results_key=results_key)
+        self.per_page = per_page
+        self.page_param = page_param
+        self.per_page_param = per_page_param
+        self.first_page = first_page
+
+    def first_request(self, endpoint, params=None):
+        page_params = dict(params or {})
+        page_params[self.page_param] = self.first_page
+        page_params[self.per_page_param] = self.per_page
+        return endpoint, page_params
+
+    def next_request(self, request, response, data):
+        if len(self.get_items(data)) < self.per_page:
+            return None
+        endpoint, page_params = request
+        page_params = dict(page_params)
+        page_params[self.page_param] += 1
+        return endpoint, page_params
+
+
+class OffsetPaginator(Paginator):
+    """ Paginate using an offset and limit
+
+    For example: ``/user?offset=200&limit=100``
+
+    Pages are requested until a page contains fewer than ``limit`` items.
+    """
+
+    def __init__(self, limit=100, offset_param='offset', limit_param='limit',
+                 results_key=None):
+        super(OffsetPaginator, self).__init__(results_key=results_key)
+        self.limit = limit
+        self.offset_param = offset_param
+        self.limit_param = limit_param
+
+    def first_request(self, endpoint, params=None):
+        page_params = dict(params or {})
+        page_params[self.offset_param] = 0
+        page_params[self.limit_param] = self.limit
+        return endpoint, page_params
+
+    def next_request(self, request, response, data):
+        items = self.get_items(data)
+        if len(items) < self.limit:
+            return None
+        endpoint, page_params = request
+        page_params = dict(page_params)
+        page_params[self.offset_param] += len(items)
+        return endpoint, page_params
+
+
+class CursorPaginator(Paginator):
+    """ Paginate using a cursor provided by the API in each page
+
+    For example, given the response::
+
+        {"results": [...], "next_cursor": "abc123"}
+
+    The next page will be requested as ``/user?cursor=abc123``. Pages are
+    requested until the API returns an empty cursor.
+    """
+    results_key = 'results'
+
+    def __init__(self, cursor_param='cursor', cursor_key='next_cursor', results_key=None):
+        super(CursorPaginator, self).__init__(results_key=results_key)
+        self.cursor_param = cursor_param
+        self.cursor_key = cursor_key
+
+    def first_request(self, endpoint, params=None):
+        return endpoint, dict(params or {})
+
+    def next_request(self, request, response, data):
+        cursor = data.get(self.cursor_key)
+        if not cursor or not self.get_items(data):
+            return None
+        endpoint, page_params = request
+        page_params = dict(page_params)
+        page_params[self.cursor_param] = cursor
+        return endpoint, page_params
+
+
+class LinkHeaderPaginator(Paginator):
+    """ Paginate by following the ``rel="next"`` URL in the ``Link`` header
+
+    As used by the GitHub API, for example::
+
+        Link: <https://api.github.com/user/repos?page=3>; rel="next"
+
+    Pages are requested until a response has no ``next`` link.
+    """
+
+    def __init__(self, per_page=None, per_page_param='per_page', results_key=None):
+        super(LinkHeaderPaginator, self).__init__(results_key=results_key)
+        self.per_page = per_page
+        self.per_page_param = per_page_param
+
+    def first_request(self, endpoint, params=None):
+        page_params = dict(params or {})
+        if self.per_page:
+            page_params[self.per_page_param] = self.per_page
+        return endpoint, page_params
+
+    def next_request(self, request, response, data):
+        url = response.links.get('next', {}).get('url')
+        if not url:
+            return None
+        # The next URL already includes all the necessary parameters.
+        # (aiohttp provides it as a URL object rather than a string.)
+        return str(url), None
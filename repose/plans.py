@@ -0,0 +1,169 @@
+"""
+Specialised decoding, encoding and validation functions for resources.
+
+Booby decodes, encodes and validates a model by looping over its fields
+and, for each field, looping over the field's decoders, encoders or
+validators. When decoding large lists of wide resources this generic
+machinery accounts for much of the time spent.
+
+When a :class:`~repose.resources.Resource` class is created, a
+:class:`Plan` is built for it. The plan generates a single function
+for each operation in which the fields, their API names and their
+decoders/encoders/validators are fixed. For example, a plan's decode
+function for a ``User`` resource is equivalent to::
+
+    def decode(raw):
+        result = {}
+        value = raw.get('id', MISSING)
+        if value is not MISSING:
+            result['id'] = value
+        value = raw.get('profile', MISSING)
+        if value is not MISSING:
+            result['profile'] = profile_decoder_0(value)
+        return result
+
+Fields which override ``decode()``, ``encode()`` or ``validate()`` are
+still called via those methods.
+
+.. note:: Plans reflect the fields (and their options) at the time the
+    class is created. If you modify a resource's fields after this point
+    call :meth:`Resource.rebuild_plan() <repose.resources.Resource.rebuild_plan>`.
+"""
+import six
+from booby.fields import Field
+
+MISSING = object()
+
+
+class Plan(object):
+    """ The specialised functions for a single resource class
+
+    Attributes:
+
+        decode (callable): Takes the raw API data and returns a dictionary
+            of decoded values, as per :meth:`booby.models.Model.decode`
+        encode (callable): Takes a resource and returns its encoded data,
+            as per :meth:`booby.mixins.Encoder.encode`
+        validate (callable): Takes a resource and raises a
+            :class:`~booby.errors.ValidationError` if it is invalid
+        field_encoders (dict): A function to encode each field's value,
+            keyed by field name
+        field_decoders (dict): The ``(name, api_name, decode)`` of each
+            field, keyed by the field itself
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.decode = build_decode(model)
+        self.encode = build_encode(model)
+        self.validate = build_validate(model)
+        self.field_encoders = dict(
+            (name, _compose(_get_steps(field, 'encode', 'encoders')))
+            for name, field in model._fields.items()
+        )
+        self.field_decoders = dict(
+            (field, (name, field.options.get('name', name),
+                     _compose(_get_steps(field, 'decode', 'decoders'))))
+            for name, field in model._fields.items()
+        )
+
+
+def build_decode(model):
+    """ Generate the decode function for a model class
+    """
+    namespace = {'MISSING': MISSING}
+    lines = ['def decode(raw):',
+             '    result = {}',
+             '    get = raw.get']
+    for i, (name, field) in enumerate(sorted(model._fields.items())):
+        steps = _get_steps(field, 'decode', 'decoders')
+        lines.extend([
+            '    value = get({!r}, MISSING)'.format(field.options.get('name', name)),
+            '    if value is not MISSING:',
+            '        result[{!r}] = {}'.format(name, _call_chain(namespace, i, steps, 'value')),
+        ])
+    lines.append('    return result')
+    return _compile(lines, namespace, 'decode')
+
+
+def build_encode(model):
+    """ Generate the encode function for a model class
+    """
+    namespace = {}
+    items = []
+    for i, (name, field) in enumerate(sorted(model._fields.items())):
+        if field.options.get('read_only', False):
+            continue
+        steps = _get_steps(field, 'encode', 'encoders')
+        value = 'instance.{}'.format(name)
+        items.append('        {!r}: {},'.format(field.options.get('name', name),
+                                                _call_chain(namespace, i, steps, value)))
+    lines = ['def encode(instance):', '    return {'] + items + ['    }']
+    return _compile(lines, namespace, 'encode')
+
+
+def build_validate(model):
+    """ Generate the validate function for a model class
+    """
+    namespace = {}
+    lines = ['def validate(instance):']
+    for i, (name, field) in enumerate(sorted(model._fields.items())):
+        if _overrides(field, 'validate'):
+            validators = [field.validate]
+        else:
+            validators = field.validators
+        if not validators:
+            continue
+        lines.append('    value = instance.{}'.format(name))
+        for j, validator in enumerate(validators):
+            key = 'validate_{}_{}'.format(i, j)
+            namespace[key] = validator
+            lines.append('    {}(value)'.format(key))
+    lines.append('    return None')
+    return _compile(lines, namespace, 'validate')
+
+
+def _overrides(field, method):
+    """ Does the field's class override the given method of :class:`booby.fields.Field`?
+    """
+    return getattr(type(field), method) != getattr(Field, method)
+
+
+def _get_steps(field, method, option):
+    """ Get the functions to be applied in turn when decoding/encoding a field
+    """
+    if _overrides(field, method):
+        return [getattr(field, method)]
+    return list(field.options.get(option, []))
+
+
+def _call_chain(namespace, index, steps, value):
+    """ Get the source code which applies each step in turn to the value
+    """
+    for j, step in enumerate(steps):
+        key = 'step_{}_{}'.format(index, j)
+        namespace[key] = step
+        value = '{}({})'.format(key, value)
+    return value
+
+
+def _compose(steps):
+    if not steps:
+        return _identity
+    if len(steps) == 1:
+        return steps[0]
+
+    def composed(value):
+        for step in steps:
+            value = step(value)
+        return value
+    return composed
+
+
+def _identity(value):
+    return value
+
+
+def _compile(lines, namespace, name):
+    six.exec_('\n'.join(lines), namespace)
+    return namespace[name]
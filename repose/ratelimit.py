@@ -0,0 +1,259 @@
+"""
+Client-side rate limiting and retrying of requests.
+
+Pass a :class:`RequestScheduler` to the backend in order to have
+requests paced according to the remote API's rate limits, and to
+have failed idempotent requests retried::
+
+    github_api = Api(base_url='https://api.github.com/',
+                     backend_options={'scheduler': RequestScheduler()})
+
+The scheduler:
+
+* Reads the ``X-RateLimit-Remaining`` / ``X-RateLimit-Reset`` headers
+  returned by the API and runs a token bucket per host, so that the
+  remaining allowance is never exceeded before the limit resets.
+* Optionally applies a fixed client-side rate (``rate``/``burst``).
+* Waits as instructed by any ``Retry-After`` header.
+* Retries idempotent requests which fail with a connection error or
+  a retryable status (``429``, ``502``, ``503``, ``504`` by default),
+  using exponential backoff with jitter.
+
+This allows a long traversal (such as ``Manager.all()`` on a paginated
+resource) to ride out a temporary throttle rather than failing part way.
+"""
+import random
+import threading
+import time
+from email.utils import parsedate_tz, mktime_tz
+
+import requests
+from six.moves.urllib.parse import urlparse
+
+monotonic = getattr(time, 'monotonic', time.time)
+
+
+class TokenBucket(object):
+    """ A thread-safe token bucket
+
+    Tokens are added at ``rate`` per second, up to a maximum of ``capacity``.
+    Each request consumes one token.
+    """
+
+    def __init__(self, rate, capacity=None):
+        """ Initialise the bucket
+
+        Args:
+
+            rate (float): Tokens added per second
+            capacity (float): The maximum number of tokens held (the burst size).
+                Defaults to ``rate``, and at least 1.
+        """
+        self._lock = threading.Lock()
+        self.rate = rate
+        self.capacity = max(1, rate if capacity is None else capacity)
+        self.tokens = self.capacity
+        self._last = monotonic()
+
+    def _refill(self):
+        now = monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def reserve(self):
+        """ Take a token
+
+        Returns:
+
+            float: The number of seconds the caller must wait before the token
+                may be used (``0`` if a token is available now).
+        """
+        with self._lock:
+            self._refill()
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0
+            elif self.rate <= 0:
+                return float('inf')
+            else:
+                return -self.tokens / self.rate
+
+    def update(self, rate=None, capacity=None, tokens=None):
+        """ Adjust the bucket, Eg: following information from the server
+        """
+        with self._lock:
+            self._refill()
+            if rate is not None:
+                self.rate = rate
+            if capacity is not None:
+                self.capacity = max(1, capacity)
+            if tokens is not None:
+                self.tokens = min(self.tokens, tokens)
+
+
+class _Host(object):
+
+    def __init__(self, bucket=None):
+        self.bucket = bucket
+        self.blocked_until = 0
+
+
+class RequestScheduler(object):
+    """ Paces requests according to rate limits and retries failed requests
+
+    Attributes:
+
+        retries (int): The total number of retries performed
+    """
+
+    def __init__(self, rate=None, burst=None, max_retries=3, backoff_factor=0.5,
+                 max_backoff=60, retry_statuses=(429, 502, 503, 504),
+                 retry_methods=('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'),
+                 sleep=time.sleep):
+        """ Initialise the scheduler
+
+        Args:
+
+            rate (float): Optional client-side limit of requests per second,
+                per host. ``None`` to rely upon the server's headers alone.
+            burst (int): The number of requests which may be sent at once
+                before ``rate`` applies (default: ``rate``).
+            max_retries (int): The maximum number of times to retry a request
+            backoff_factor (float): The base delay (in seconds) between retries.
+                Doubled upon each subsequent retry.
+            max_backoff (float): The maximum delay between retries
+                (unless the server specifies a longer ``Retry-After``)
+            retry_statuses (tuple[int]): HTTP statuses which should be retried
+            retry_methods (tuple[str]): HTTP methods which may be retried
+            sleep (callable): Function used to wait (for testing)
+        """
+        self.rate = rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = retry_statuses
+        self.retry_methods = retry_methods
+        self.sleep = sleep
+        self.retries = 0
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def get_host(self, url):
+        netloc = urlparse(url).netloc
+        with self._lock:
+            if netloc not in self._hosts:
+                bucket = TokenBucket(self.rate, self.burst) if self.rate else None
+                self._hosts[netloc] = _Host(bucket)
+            return self._hosts[netloc]
+
+    def call(self, method, url, fn):
+        """ Call ``fn`` to send a request, waiting and retrying as necessary
+
+        Args:
+
+            method (str): The HTTP method of the request
+            url (str): The URL of the request
+            fn (callable): Sends the request and returns the response
+
+        Returns:
+
+            :class:`requests.Response`: The final response. The number of
+                retries made is available as ``response.retries``.
+        """
+        host = self.get_host(url)
+        retryable = method.upper() in self.retry_methods
+        attempt = 0
+        while True:
+            self.wait(host)
+            try:
+                response = fn()
+            except (requests.ConnectionError, requests.Timeout):
+                if not retryable or attempt >= self.max_retries:
+                    raise
+                delay = self.get_backoff(attempt)
+            else:
+                self.update(host, response)
+                if (not retryable or attempt >= self.max_retries
+                        or response.status_code not in self.retry_statuses):
+                    response.retries = attempt
+                    return response
+                # Release the connection, which is still held if the
+                # response was streamed
+                response.close()
+                if parse_retry_after(response.headers.get('Retry-After')) is not None:
+                    # update() has already blocked the host until the
+                    # given time, so the retry will wait in turn
+                    delay = 0
+                else:
+                    delay = self.get_backoff(attempt)
+
+            attempt += 1
+            with self._lock:
+                self.retries += 1
+            if delay > 0:
+                self.sleep(delay)
+
+    def wait(self, host):
+        """ Wait until a request may be sent to the host
+        """
+        delay = host.blocked_until - monotonic()
+        if host.bucket is not None:
+            delay = max(delay, host.bucket.reserve())
+        if delay > 0:
+            self.sleep(delay)
+
+    def update(self, host, response):
+        """ Update the host's limits using the headers of the response
+        """
+        headers = response.headers
+        retry_after = parse_retry_after(headers.get('Retry-After'))
+        if retry_after is not None:
+            host.blocked_until = max(host.blocked_until, monotonic() + retry_after)
+
+        try:
+            remaining = int(headers['X-RateLimit-Remaining'])
+            reset = float(headers['X-RateLimit-Reset'])
+        except (KeyError, ValueError):
+            return
+
+        # Reset is usually an epoch timestamp, but some APIs send a number of seconds
+        window = reset - time.time() if reset > 1e9 else reset
+        if remaining <= 0:
+            host.blocked_until = max(host.blocked_until, monotonic() + max(window, 0))
+        elif window > 0:
+            # Never hold more tokens than the server will allow, and spread
+            # the remaining allowance over the time until the limit resets
+            rate = remaining / window
+            if self.rate:
+                rate = min(rate, self.rate)
+            if host.bucket is None:
+                host.bucket = TokenBucket(rate, remaining)
+            else:
+                host.bucket.update(rate=rate, capacity=remaining, tokens=remaining)
+
+    def get_backoff(self, attempt):
+        """ Get the number of seconds to wait before retrying
+
+        Uses exponential backoff with full jitter.
+        """
+        backoff = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        return random.uniform(0, backoff)
+
+
+def parse_retry_after(value):
+    """ Parse a ``Retry-After`` header (in seconds or as a HTTP date)
+
+    Returns:
+
+        float: Seconds to wait, or ``None``
+    """
+    if not value:
+        return None
+    try:
+        return max(0, float(value))
+    except ValueError:
+        parsed = parsedate_tz(value)
+        if parsed is None:
+            return None
+        return max(0, mktime_tz(parsed) - time.time())
@@ -1,9 +1,14 @@
+import copy
 import weakref
 import booby._utils
+import booby.errors
+import booby.fields
 from booby.models import ModelMeta, Model
 import six
 from repose.managers import Manager
-from repose.utilities import make_endpoint, get_values_from_endpoint
+from repose.plans import Plan
+from repose.utilities import make_endpoint, get_values_from_endpoint, LazyList, \
+    EndpointTemplate, weak_proxy
 
 
 class ResourceMetaclass(ModelMeta):
@@ -13,8 +18,38 @@ class ResourceMetaclass(ModelMeta):
     def __new__(cls, clsname, bases, dct):
         resource = super(ResourceMetaclass, cls).__new__(cls, clsname, bases, dct)
         cls.setup_managers(resource, dct)
+        cls.setup_endpoints(resource, clsname)
+        cls.setup_children(resource)
+        resource._plan = Plan(resource)
         return resource
 
+    @classmethod
+    def setup_endpoints(cls, resource, clsname):
+        """Compile the resource's endpoint templates
+
+        Also determine which fields are populated from endpoint
+        parameters (see :func:`~repose.utilities.get_values_from_endpoint`)
+        """
+        resource._endpoint_name = clsname.lower()
+        resource._from_endpoint_params = tuple(
+            field.options['from_endpoint'] for field in resource._fields.values()
+            if field.options.get('from_endpoint')
+        )
+        for name in ('endpoint', 'endpoint_list'):
+            resource.get_endpoint_template(name)
+
+    @classmethod
+    def setup_children(cls, resource):
+        """Determine which fields may contain child resources
+
+        These are the fields which convert their values when set
+        (Eg: embedded resources and managed collections)
+        """
+        resource._child_fields = dict(
+            (name, field) for name, field in resource._fields.items()
+            if type(field).__set__ != booby.fields.Field.__set__
+        )
+
     @classmethod
     def setup_managers(cls, resource, dct):
         """Setup the managers on a resource
@@ -44,11 +79,23 @@ class ResourceMetaclass(ModelMeta):
 class Resource(six.with_metaclass(ResourceMetaclass, Model)):
     """ Representation of an API resource
 
+    Changes to the resource's fields are tracked as they are made, so
+    that :meth:`save` need only encode and send the fields which have
+    changed. Assigning to a field records its original value the first
+    time it is modified. Changes within :class:`~repose.utilities.LazyList`
+    values, managed collections and embedded resources are tracked by
+    those values themselves. Plain ``list`` and ``dict`` values are
+    replaced by (shallow) copies which record the field's original value
+    just before they are first changed. Note that changes within
+    nested lists and dictionaries are not detected.
+
     Attributes:
 
-        parent_resource (list): A list of all parent resources to this one.
-            Often useful in generating endpoints for child resources.
-            Parent resources are stored as :func:`weakref.ref`
+        parent_resource (Resource): The resource to which this one belongs
+            (as a :func:`weakref.proxy`), or ``None``. Used in generating
+            endpoints for child resources. Embedded resources are linked to
+            their parent when assigned, while the results of managed
+            collections are linked as they are loaded.
 
         api (Api): The API instance
     """
@@ -81,6 +128,36 @@ class Resource(six.with_metaclass(ResourceMetaclass, Model)):
                 endpoint_list (str): Endpoint URL for listing resources
                     (will be appended to the
                     API's :attr:`~repose.api.Api.base_url`)
+                endpoint_bulk (str): Optional endpoint URL for fetching many
+                    resources by ID in a single request.
+                    See :meth:`Manager.get_many() <repose.managers.Manager.get_many>`
+                bulk_param (str): URL parameter in which to pass the
+                    comma-separated IDs to ``endpoint_bulk`` (default ``ids``)
+                bulk_size (int): The maximum number of IDs to request from
+                    ``endpoint_bulk`` at once (default 100)
+                compact (bool): Load list results as read-only
+                    :class:`CompactResource` instances (default ``False``).
+                    See :meth:`Resource.compact_class`
+                endpoint_bulk_update (str): Optional endpoint URL to which
+                    changes to many resources may be sent in a single
+                    ``PUT`` request. See
+                    :meth:`Manager.bulk_update() <repose.managers.Manager.bulk_update>`
+                filters (dict): URL parameter names for the filters supported
+                    by ``endpoint_list``, keyed by filter name. See
+                    :meth:`Manager.filter() <repose.managers.Manager.filter>`
+                order_param (str): URL parameter in which to send the ordering.
+                    See :meth:`Manager.order_by() <repose.managers.Manager.order_by>`
+                limit_param (str): URL parameter limiting the number of results
+                offset_param (str): URL parameter giving the offset of the first result
+                count_source (:class:`~repose.counting.CountSource`): Where
+                    to obtain the number of results from. See
+                    :meth:`Manager.count() <repose.managers.Manager.count>`
+                fields_param (str): URL parameter in which to request
+                    specific fields (default ``fields``). See
+                    :meth:`Manager.only() <repose.managers.Manager.only>`
+                lazy_decode (bool): Keep the raw API data and only decode
+                    each field when it is first accessed (default ``False``).
+                    See :meth:`Resource.from_data`
         """
         pass
 
@@ -92,7 +169,8 @@ class Resource(six.with_metaclass(ResourceMetaclass, Model)):
             **kwargs: Fields and their (decoded) values
 
         """
-        self.parent_resource = []
+        self._tracking = False
+        self.parent_resource = None
         # Only use fields which have been specified on the resource
         data = {}
         for f in self._fields.keys():
@@ -101,8 +179,98 @@ class Resource(six.with_metaclass(ResourceMetaclass, Model)):
             data[f] = kwargs.get(f) or getattr(self, f)
 
         super(Resource, self).__init__(**data)
-        self.contribute_parents()
-        self._persisted_data = self.encode()
+        self._reset_changes()
+
+    def __setattr__(self, name, value):
+        if name not in self._fields:
+            super(Resource, self).__setattr__(name, value)
+            return
+        if self.__dict__.get('_tracking'):
+            self._record_original(name)
+        super(Resource, self).__setattr__(name, value)
+        if name in self._child_fields:
+            # Only the child itself is linked, see contribute_parents()
+            value = self._data[self._child_fields[name]]
+            if hasattr(value, 'contribute_parents'):
+                value.contribute_parents(parent=self)
+
+    @classmethod
+    def from_data(cls, raw, **values):
+        """Create a resource from the raw data returned by the API
+
+        If ``Meta.lazy_decode`` is set then the raw data is kept, and each
+        field is only decoded when it is first accessed. Embedded resources
+        and collections are therefore only constructed if they are used.
+        This can save a great deal of work for resources with many fields,
+        of which only a few are read.
+
+        .. note:: Lazily decoded resources are not created using
+            ``__init__()``.
+
+        Args:
+
+            raw (dict): The API data for a single resource
+            **values: Decoded field values which take precedence over ``raw``
+
+        Returns:
+
+            Resource:
+        """
+        if not getattr(cls.Meta, 'lazy_decode', False):
+            decoded = cls.decode(raw)
+            decoded.update(values)
+            return cls(**decoded)
+        return cls._from_raw(raw, values)
+
+    @classmethod
+    def from_projection(cls, raw, deferred, **values):
+        """Create a resource from API data which omits some of its fields
+
+        The data is decoded lazily, as per :meth:`from_data`. Accessing
+        any of the ``deferred`` fields fetches all of them in a single
+        request.
+
+        Args:
+
+            raw (dict): The API data for a single resource
+            deferred (set[str]): The names of the fields which were not requested
+            **values: Decoded field values which take precedence over ``raw``
+
+        Returns:
+
+            Resource:
+        """
+        return cls._from_raw(raw, values, deferred)
+
+    @classmethod
+    def _from_raw(cls, raw, values, deferred=()):
+        resource = cls.__new__(cls)
+        resource._tracking = False
+        resource.parent_resource = None
+        resource._data = _LazyData(resource, raw, deferred)
+        for name, value in values.items():
+            if name in cls._fields:
+                setattr(resource, name, value)
+        resource._reset_changes()
+        return resource
+
+    def _decode_field(self, field):
+        """Decode a field's value from the raw data. Used by :meth:`from_data`
+        """
+        name, key, decode = self._plan.field_decoders[field]
+        raw = self._data.raw
+        if key not in raw and name in self._data.deferred:
+            raw = self._load_deferred()
+        if key not in raw:
+            raise KeyError(field)
+        # Set using the field in order to apply any conversion (Eg: dict -> Model)
+        field.__set__(self, decode(raw[key]))
+        value = self._data[field]
+        if hasattr(value, 'contribute_parents'):
+            value.contribute_parents(parent=self)
+        if self._tracking:
+            value = self._track(name, field, value)
+        return value
 
     def __repr__(self):
         cls = type(self)
@@ -110,6 +278,47 @@ class Resource(six.with_metaclass(ResourceMetaclass, Model)):
         return '<{}({})>'.format(cls.__name__,
                                     booby._utils.repr_options(dict(self)))
 
+    @classmethod
+    def decode(cls, raw):
+        """Decode the raw API data for a single resource
+
+        Uses the resource's :class:`~repose.plans.Plan`.
+
+        Returns:
+
+            dict: The decoded field values
+        """
+        return cls._plan.decode(raw)
+
+    def encode(self):
+        """Encode the resource into data for the API
+
+        Uses the resource's :class:`~repose.plans.Plan`.
+
+        Returns:
+
+            dict:
+        """
+        return self._plan.encode(self)
+
+    def validate(self):
+        """Validate all the resource's fields
+
+        Raises:
+
+            booby.errors.ValidationError: If any field is invalid
+        """
+        self._plan.validate(self)
+
+    @classmethod
+    def rebuild_plan(cls):
+        """Rebuild the resource's :class:`~repose.plans.Plan`
+
+        Only needed if the resource's fields are modified after the
+        class has been created.
+        """
+        cls._plan = Plan(cls)
+
     @classmethod
     def contribute_api(cls, api):
         """Contribute the API backend to this resource and its managers.
@@ -120,21 +329,34 @@ class Resource(six.with_metaclass(ResourceMetaclass, Model)):
         for manager in cls._managers:
             manager.contribute_api(api)
 
+    def _load_deferred(self):
+        """Fetch the values of all deferred fields (see :meth:`from_projection`)
+
+        Returns:
+
+            dict: The raw data, now including the deferred fields
+        """
+        data = self._data
+        keys = [self._fields[name].options.get('name', name) for name in data.deferred]
+        param = getattr(self.Meta, 'fields_param', 'fields')
+        loaded = self.api.get(make_endpoint(self), params={param: ','.join(sorted(keys))})
+        # Copy rather than modify, as the raw data may be shared (Eg: cached)
+        raw = dict(data.raw)
+        raw.update((key, loaded[key]) for key in keys if key in loaded)
+        data.raw = raw
+        data.deferred = frozenset()
+        return raw
+
     def contribute_parents(self, parent=None):
-        """Furnish this class with it's parent resources
+        """Furnish this resource with its parent resource
+
+        Only this resource is updated. Child resources are linked to
+        their parent when they are assigned to one of its fields, so
+        creating a resource never walks (or fetches) its descendants.
 
         .. note:: Mainly for internal use
         """
-        if parent:
-            parent = weakref.proxy(parent)
-        self.parent_resource = parent
-
-        for k, v in self._fields.items():
-            if hasattr(getattr(self, k), 'contribute_parents'):
-                # This is an Embedded/Collection field of some sort. The
-                # value attached to the resource will be another
-                # resource, so directly contribute to its parents
-                getattr(self, k).contribute_parents(parent=self)
+        self.parent_resource = None if parent is None else weak_proxy(parent)
 
     @property
     def api(self):
@@ -146,11 +368,125 @@ class Resource(six.with_metaclass(ResourceMetaclass, Model)):
                 "an Api instance, or you haven't registered your resource "
                 "with your Api instance.".format(self))
 
+    def _record_original(self, name):
+        """Keep the encoded original value of a field which is about to be modified
+        """
+        if name not in self._original:
+            self._original[name] = self._plan.field_encoders[name](getattr(self, name))
+
+    def _record_before_change(self, name, value):
+        """Keep the encoded original value of a field which is about to be changed in place
+
+        Called by the :class:`_TrackedList` or :class:`_TrackedDict` value of the field
+        """
+        if name not in self._original and self._data.get(self._fields[name]) is value:
+            encoded = self._plan.field_encoders[name](value)
+            if isinstance(encoded, (_TrackedList, _TrackedDict)):
+                encoded = type(encoded).__base__(encoded)
+            # Copied, as the encoded value may share the value's contents
+            self._original[name] = copy.deepcopy(encoded)
+
+    def _track(self, name, field, value):
+        """Replace a plain list or dict value with one which tracks its own changes
+        """
+        tracked_class = _TRACKED_TYPES.get(type(value))
+        if tracked_class is None and isinstance(value, (_TrackedList, _TrackedDict)):
+            owner = value._owner
+            if owner[0]() is self and owner[1] == name:
+                # Already copied, so need only record the next change
+                value._armed = True
+                return value
+            # Taken from another resource, so copy it to track changes separately
+            tracked_class = type(value)
+        if tracked_class is None:
+            return value
+        value = self._data[field] = tracked_class(value, self, name)
+        return value
+
+    def _reset_changes(self, names=None):
+        """Treat the resource's current values as those persisted by the API
+
+        Args:
+
+            names (list[str]): Only reset these fields. Defaults to all fields
+        """
+        if names is None:
+            self._original = {}
+        else:
+            for name in names:
+                self._original.pop(name, None)
+        for name, field in self._fields.items():
+            if names is not None and name not in names:
+                continue
+            if field not in self._data:
+                continue
+            self._track(name, field, self._data[field])
+        self._tracking = True
+
+    def _mark_saved(self, names=None):
+        """Clear all changes, including those of embedded resources & collections
+
+        Args:
+
+            names (list[str]): Only clear changes to these fields. Defaults to all fields
+        """
+        for name, field in self._fields.items():
+            if field in self._data and (names is None or name in names):
+                _mark_saved(getattr(self, name))
+        self._reset_changes(names)
+
+    def _update_saved(self, values):
+        """Update the field values with those just loaded from the API
+        """
+        self._tracking = False
+        self._update(values)
+        self._mark_saved()
+
+    def get_changes(self, fields=None):
+        """Get the encoded values of all fields which have changed
+
+        Fields which have been assigned their original value are not
+        considered to have changed.
+
+        Args:
+
+            fields (list[str]): Only consider these fields. Defaults to all fields
+
+        Returns:
+
+            dict: The encoded values, keyed by their API names
+        """
+        changes = {}
+        for name, field in self._fields.items():
+            if field.options.get('read_only', False) or field not in self._data:
+                continue
+            if fields is not None and name not in fields:
+                continue
+            value = getattr(self, name)
+            encode = self._plan.field_encoders[name]
+            if name in self._original:
+                encoded = encode(value)
+                if encoded == self._original[name]:
+                    continue
+            elif _has_changed(value):
+                encoded = encode(value)
+            else:
+                continue
+            changes[field.options.get('name', name)] = encoded
+        return changes
+
+    def has_changed(self):
+        """Have any of the resource's fields changed since it was loaded or saved?
+
+        Returns:
+
+            bool:
+        """
+        return bool(self.get_changes())
+
     def prepare_save(self, encoded):
         """Prepare the resource to be saved
 
-        Will only return values which have changed
-
         Can be used as a hook with which to tweak data before
         sending back to the server. For example::
 
@@ -161,35 +497,329 @@ class Resource(six.with_metaclass(ResourceMetaclass, Model)):
 
         Args:
 
-            encoded (dict): The encoded resource data
+            encoded (dict): The encoded values of the fields which have changed
+                (see :meth:`get_changes`)
 
         """
-        prepared = {}
-        for k, v in encoded.items():
-            if k not in self._persisted_data or v != self._persisted_data[k]:
-                prepared[k] = v
-        return prepared
+        return dict(encoded)
 
     def save(self):
         """Persist pending changes
         """
-        endpoint = make_endpoint(self)
-        encoded = self.encode()
-        prepared_data = self.prepare_save(encoded)
-
+        endpoint, prepared_data = self._prepare_request()
         self.api.put(endpoint, prepared_data)
-        self._persisted_data = encoded
+        self._mark_saved()
+        self.invalidate_results()
+
+    @classmethod
+    def invalidate_results(cls):
+        """Discard the list results loaded by this resource's managers
+
+        Called when a resource is saved. See
+        :meth:`Manager.invalidate() <repose.managers.Manager.invalidate>`
+        """
+        for manager in cls._managers:
+            manager.invalidate()
+
+    def asave(self):
+        """Asynchronous version of :meth:`save`
+
+        Must be awaited, and requires the Api to be using the
+        :class:`~repose.aio.AsyncApiBackend`.
+        """
+        from repose import aio
+        return aio.resource_save(self)
+
+    def _prepare_request(self):
+        """Determine the endpoint and data needed to save this resource
+
+        Returns:
+
+            tuple: ``(endpoint, prepared_data)``
+        """
+        return make_endpoint(self), self.prepare_save(self.get_changes())
 
     def get_endpoint_values(self):
+        """Get any additional values with which to format the endpoint
+
+        Returns:
+
+            dict: Values which take precedence over those of the
+                resource's fields
+        """
         return {}
 
+    @classmethod
+    def get_endpoint_template(cls, name='endpoint'):
+        """Get the compiled template for one of the ``Meta`` endpoints
+
+        Templates are compiled when the class is created, and again
+        only if the ``Meta`` endpoint is changed.
+
+        Args:
+
+            name (str): ``endpoint`` or ``endpoint_list``
+
+        Returns:
+
+            :class:`~repose.utilities.EndpointTemplate`:
+        """
+        attr = '_{}_template'.format(name)
+        source = getattr(cls.Meta, name, None)
+        template = cls.__dict__.get(attr)
+        if template is None or template.source is not source:
+            template = EndpointTemplate(source, cls)
+            setattr(cls, attr, template)
+        return template
+
     def refresh(self):
         data = self.api.get(make_endpoint(self))
         decoded = self.__class__.decode(data)
-        self._update(decoded)
+        self._update_saved(decoded)
+
+    def arefresh(self):
+        """Asynchronous version of :meth:`refresh`
+
+        Must be awaited, and requires the Api to be using the
+        :class:`~repose.aio.AsyncApiBackend`.
+        """
+        from repose import aio
+        return aio.resource_refresh(self)
 
     def as_dict(self):
         d = {}
         for field_name in self._fields.keys():
             d[field_name] = getattr(self, field_name)
         return d
+
+    @classmethod
+    def compact_class(cls):
+        """Get the compact, read-only version of this resource
+
+        The returned class stores its field values in ``__slots__`` and
+        holds no copy of the persisted data, making it far cheaper to
+        hold large numbers of results in memory. It is used for list
+        results when either ``Meta.compact`` or ``Manager(compact=True)``
+        is set. Use :meth:`CompactResource.to_resource` to obtain a full
+        resource which may be modified and saved.
+
+        Returns:
+
+            type: A subclass of :class:`CompactResource`, created once per resource class
+        """
+        if '_compact_class' not in cls.__dict__:
+            cls._compact_class = type(cls.__name__, (CompactResource,), dict(
+                __slots__=tuple(cls._fields),
+                __module__=cls.__module__,
+                _resource_class=cls,
+                _fields=cls._fields,
+                _endpoint_name=cls._endpoint_name,
+                _converting_fields=cls._child_fields,
+                Meta=cls.Meta,
+                decode=cls.decode,
+                get_endpoint_values=six.get_unbound_function(cls.get_endpoint_values),
+                get_endpoint_template=cls.get_endpoint_template,
+            ))
+        return cls._compact_class
+
+
+class CompactResource(object):
+    """ A memory efficient, read-only representation of a resource
+
+    Do not use this class directly, rather use :meth:`Resource.compact_class`.
+
+    Attributes:
+
+        parent_resource (Resource): The parent resource (as a :func:`weakref.proxy`)
+    """
+    __slots__ = ('parent_resource', '__weakref__')
+
+    _resource_class = None
+    _fields = {}
+    _converting_fields = {}
+
+    def __init__(self, **kwargs):
+        set_value = super(CompactResource, self).__setattr__
+        set_value('parent_resource', None)
+        for name, field in self._fields.items():
+            value = kwargs[name] if name in kwargs else field._default(self)
+            if name in self._converting_fields:
+                value = _convert(field, value)
+                if hasattr(value, 'contribute_parents'):
+                    value.contribute_parents(parent=self)
+            set_value(name, value)
+
+    @classmethod
+    def from_data(cls, raw, **values):
+        """Create an instance from the raw data returned by the API
+        """
+        decoded = cls.decode(raw)
+        decoded.update(values)
+        return cls(**decoded)
+
+    @classmethod
+    def from_projection(cls, raw, deferred, **values):
+        """Create an instance from API data which omits some fields
+
+        Deferred fields are not fetched. They will have their default value.
+        """
+        return cls.from_data(raw, **values)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            "{} is read-only. Use to_resource() to obtain a resource "
+            "which can be modified.".format(self))
+
+    def __iter__(self):
+        for name in self._fields:
+            value = getattr(self, name)
+            if isinstance(value, (Model, CompactResource)):
+                value = dict(value)
+            yield name, value
+
+    def __getitem__(self, name):
+        if name not in self._fields:
+            raise booby.errors.FieldError(name)
+        return getattr(self, name)
+
+    def __repr__(self):
+        return '<{}({})>'.format(type(self).__name__,
+                                 booby._utils.repr_options(dict(self)))
+
+    @property
+    def api(self):
+        return self._resource_class._api
+
+    def contribute_parents(self, parent=None):
+        """Furnish this instance with its parent resource
+
+        .. note:: Mainly for internal use
+        """
+        parent = None if parent is None else weak_proxy(parent)
+        super(CompactResource, self).__setattr__('parent_resource', parent)
+
+    def as_dict(self):
+        return dict((name, getattr(self, name)) for name in self._fields)
+
+    def to_resource(self):
+        """Upgrade to a full, mutable resource
+
+        Returns:
+
+            Resource: A new instance of the resource class, which may be saved
+        """
+        resource = self._resource_class(**self.as_dict())
+        resource.parent_resource = self.parent_resource
+        return resource
+
+
+def _has_changed(value):
+    """Does the field value report that it has been changed in place?
+    """
+    if isinstance(value, Manager):
+        value = value.results
+    if isinstance(value, LazyList):
+        # Items which have not been loaded cannot have been changed
+        return value.has_changed() or any(_has_changed(v) for v in value.iter_loaded())
+    if isinstance(value, list):
+        # Eg: the resources of an unmanaged collection
+        return any(_has_changed(v) for v in value)
+    return isinstance(value, Resource) and value.has_changed()
+
+
+def _mark_saved(value):
+    if isinstance(value, Manager):
+        value = value.results
+    if isinstance(value, LazyList):
+        value.set_unchanged()
+        value = list(value.iter_loaded())
+    if isinstance(value, Resource):
+        value._mark_saved()
+    elif isinstance(value, list):
+        for item in value:
+            _mark_saved(item)
+
+
+def _before_change(method):
+    """Wrap a list/dict method so that the field's original value is recorded before it runs
+    """
+    def changed(self, *args, **kwargs):
+        if self._armed:
+            # Only the first change need be recorded
+            self._armed = False
+            resource = self._owner[0]()
+            if resource is not None:
+                resource._record_before_change(self._owner[1], self)
+        return method(self, *args, **kwargs)
+    changed.__name__ = method.__name__
+    return changed
+
+
+class _TrackedList(list):
+    """A list field value which records the field's original value before it is first changed
+    """
+    __slots__ = ('_owner', '_armed')
+
+    def __init__(self, values, resource, name):
+        super(_TrackedList, self).__init__(values)
+        self._owner = (weakref.ref(resource), name)
+        self._armed = True
+
+
+class _TrackedDict(dict):
+    """A dict field value which records the field's original value before it is first changed
+    """
+    __slots__ = ('_owner', '_armed')
+
+    def __init__(self, values, resource, name):
+        super(_TrackedDict, self).__init__(values)
+        self._owner = (weakref.ref(resource), name)
+        self._armed = True
+
+
+def _wrap_methods(cls, names):
+    for name in names:
+        method = getattr(cls.__base__, name, None)
+        if method is not None:
+            setattr(cls, name, _before_change(method))
+
+
+_wrap_methods(_TrackedList, ['__setitem__', '__delitem__', '__iadd__', '__imul__', 'append',
+                             'extend', 'insert', 'pop', 'remove', 'reverse', 'sort', 'clear',
+                             '__setslice__', '__delslice__'])
+_wrap_methods(_TrackedDict, ['__setitem__', '__delitem__', 'clear', 'pop', 'popitem',
+                             'setdefault', 'update'])
+
+_TRACKED_TYPES = {list: _TrackedList, dict: _TrackedDict}
+
+
+class _LazyData(dict):
+    """Field values for a lazily decoded resource
+
+    Values are decoded from the raw data upon first access
+    """
+
+    def __init__(self, resource, raw, deferred=()):
+        super(_LazyData, self).__init__()
+        self.resource = weakref.ref(resource)
+        self.raw = raw
+        self.deferred = frozenset(deferred)
+
+    def __missing__(self, field):
+        return self.resource()._decode_field(field)
+
+
+class _FieldValue(object):
+    __slots__ = ('_data',)
+
+    def __init__(self):
+        self._data = {}
+
+
+def _convert(field, value):
+    """Apply any conversion the field performs when it is set
+    (Eg: embedded dicts into models)
+    """
+    holder = _FieldValue()
+    field.__set__(holder, value)
+    return holder._data[field]
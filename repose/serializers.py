@@ -0,0 +1,248 @@
+"""
+Serializers convert request and response bodies to and from Python data.
+
+By default Repose sends and receives JSON using the standard library's
+:mod:`json` module. Alternative serializers can be selected per
+:class:`~repose.api.Api`. The first serializer listed is used to encode
+request bodies, while responses are decoded according to their
+``Content-Type``. All listed serializers are advertised to the API in the
+``Accept`` header, in order of preference::
+
+    # Use the fastest JSON library available (orjson, ujson, simplejson)
+    my_api = Api(base_url='http://example.com/api/v1',
+                 backend_options={'serializers': [FastJsonSerializer()]})
+
+    # Prefer MessagePack, but still accept JSON
+    my_api = Api(base_url='http://example.com/api/v1',
+                 backend_options={'serializers': [MsgPackSerializer(),
+                                                  FastJsonSerializer()]})
+
+Media types with a structured syntax suffix (Eg: ``application/problem+json``)
+are decoded by the serializer for that suffix. A response with any other
+``Content-Type`` raises an :class:`UnsupportedContentType` error. Responses
+without a ``Content-Type`` are decoded using the first serializer listed.
+
+You can also create your own serializer by extending :class:`Serializer`.
+"""
+import codecs
+import importlib
+import json
+
+
+class UnsupportedContentType(ValueError):
+    """ Raised when a response's ``Content-Type`` has no matching serializer
+    """
+
+
+def parse_content_type(content_type):
+    """ Split a ``Content-Type`` header value into its media type and charset
+
+    For example::
+
+        >>> parse_content_type('application/json; charset=UTF-8')
+        ('application/json', 'utf-8')
+
+    Returns:
+
+        tuple: The ``(media_type, charset)``. The charset is ``None`` if not given.
+    """
+    parts = (content_type or '').split(';')
+    charset = None
+    for part in parts[1:]:
+        name, _, value = part.partition('=')
+        if name.strip().lower() == 'charset':
+            charset = value.strip().strip('"').lower() or None
+    return parts[0].strip().lower(), charset
+
+
+class Serializer(object):
+    """ Base class for all serializers
+
+    Attributes:
+
+        content_types (tuple[str]): The media types handled by this serializer.
+            The first is used when sending data.
+        aliases (tuple[str]): Additional media types which are decoded by this
+            serializer, but not requested in the ``Accept`` header
+        suffix (str): The structured syntax suffix handled by this serializer
+            (Eg: ``+json``), if any
+    """
+    content_types = ()
+    aliases = ()
+    suffix = None
+
+    @property
+    def content_type(self):
+        return self.content_types[0]
+
+    def handles(self, media_type):
+        """ Can this serializer decode responses of the given media type?
+        """
+        return (media_type in self.content_types or media_type in self.aliases
+                or bool(self.suffix and media_type.endswith(self.suffix)))
+
+    def dumps(self, data):
+        """ Serialize the Python data
+
+        Returns:
+
+            bytes:
+        """
+        raise NotImplementedError()
+
+    def loads(self, content, charset=None):
+        """ Deserialize the given bytes into Python data
+
+        Args:
+
+            content (bytes): The response body
+            charset (str): The charset given in the ``Content-Type``, if any
+        """
+        raise NotImplementedError()
+
+
+class JsonSerializer(Serializer):
+    """ JSON serialization using the standard library's :mod:`json` module
+    """
+    content_types = ('application/json',)
+    aliases = ('text/json',)
+    suffix = '+json'
+
+    def dumps(self, data):
+        return json.dumps(data, separators=(',', ':')).encode('utf8')
+
+    def loads(self, content, charset=None):
+        return json.loads(content.decode(charset or 'utf8'))
+
+    def is_utf8(self, charset):
+        """ Is the charset UTF-8 (or unspecified, so assumed to be)?
+        """
+        return charset is None or codecs.lookup(charset).name == 'utf-8'
+
+
+class FastJsonSerializer(JsonSerializer):
+    """ JSON serialization using the fastest JSON library installed
+
+    Uses the first of ``orjson``, ``ujson`` or ``simplejson`` which can be
+    imported, falling back to the standard library.
+
+    Attributes:
+
+        module: The JSON module in use
+    """
+    libraries = ('orjson', 'ujson', 'simplejson')
+
+    def __init__(self):
+        self.module = json
+        for name in self.libraries:
+            try:
+                self.module = importlib.import_module(name)
+                break
+            except ImportError:
+                pass
+
+    def dumps(self, data):
+        if self.module is json:
+            return super(FastJsonSerializer, self).dumps(data)
+        dumped = self.module.dumps(data)
+        return dumped if isinstance(dumped, bytes) else dumped.encode('utf8')
+
+    def loads(self, content, charset=None):
+        if self.module is json or not self.is_utf8(charset):
+            return super(FastJsonSerializer, self).loads(content, charset)
+        return self.module.loads(content)
+
+
+class MsgPackSerializer(Serializer):
+    """ `MessagePack <https://msgpack.org>`_ serialization
+
+    Requires the ``msgpack`` library.
+    """
+    content_types = ('application/msgpack', 'application/x-msgpack')
+    suffix = '+msgpack'
+
+    def __init__(self):
+        try:
+            import msgpack
+        except ImportError:
+            raise ImportError(
+                "msgpack is required in order to use the MsgPackSerializer. "
+                "Install it using: pip install msgpack")
+        self.msgpack = msgpack
+
+    def dumps(self, data):
+        return self.msgpack.packb(data, use_bin_type=True)
+
+    def loads(self, content, charset=None):
+        return self.msgpack.unpackb(content, raw=False)
+
+
+class SerializerRegistry(object):
+    """ The serializers available to a backend, in order of preference
+    """
+
+    def __init__(self, serializers=None):
+        self.serializers = list(serializers or [JsonSerializer()])
+
+    @property
+    def default(self):
+        """ The serializer used for request bodies, and responses with no ``Content-Type``
+        """
+        return self.serializers[0]
+
+    def register(self, serializer, preferred=False):
+        """ Add a serializer to the registry
+        """
+        if preferred:
+            self.serializers.insert(0, serializer)
+        else:
+            self.serializers.append(serializer)
+
+    def get(self, content_type):
+        """ Get the serializer for the given ``Content-Type`` header value
+
+        Returns:
+
+            Serializer: The matching serializer, or :attr:`default` if no
+                content type is given
+
+        Raises:
+
+            UnsupportedContentType: If no serializer handles the content type
+        """
+        media_type = parse_content_type(content_type)[0]
+        if not media_type:
+            return self.default
+        for serializer in self.serializers:
+            if media_type in serializer.content_types or media_type in serializer.aliases:
+                return serializer
+        # Only then match suffixes, so that exact matches take precedence
+        for serializer in self.serializers:
+            if serializer.handles(media_type):
+                return serializer
+        raise UnsupportedContentType(
+            "No serializer is available for the content type '{}'".format(media_type))
+
+    def loads(self, content, content_type):
+        """ Deserialize a response body according to its ``Content-Type``
+
+        Args:
+
+            content (bytes): The response body
+            content_type (str): The ``Content-Type`` header value, if any
+
+        Returns:
+
+            object: Typically a python list or dictionary
+        """
+        return self.get(content_type).loads(content, parse_content_type(content_type)[1])
+
+    def get_accept_header(self):
+        """ Get the ``Accept`` header value, listing each content type in order of preference
+        """
+        values = []
+        for i, serializer in enumerate(self.serializers):
+            quality = max(1.0 - i / 10.0, 0.1)
+            for content_type in serializer.content_types:
+                values.append(content_type if i == 0 else '{};q={:.1f}'.format(content_type, quality))
+        return ', '.join(values)
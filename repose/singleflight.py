@@ -0,0 +1,82 @@
+"""
+Coalescing of concurrent, identical requests.
+
+When many threads request the same resource at the same time, only
+the first request needs to be sent. Pass a :class:`SingleFlight`
+instance to the backend to enable this for GET requests::
+
+    my_api = Api(base_url='http://example.com/api/v1',
+                 backend_options={'single_flight': SingleFlight()})
+
+All callers then receive the same parsed result (or exception).
+The number of requests which have been avoided is available
+as :attr:`SingleFlight.saved`.
+
+For the :class:`~repose.aio.AsyncApiBackend`, use
+:class:`~repose.aio.AsyncSingleFlight` instead.
+"""
+import threading
+
+
+class _Call(object):
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """ Ensure only one call per key is in flight at any one time
+
+    Attributes:
+
+        saved (int): The number of calls which were coalesced into
+            an already in-flight call
+    """
+
+    def __init__(self):
+        self.saved = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn):
+        """ Call ``fn``, unless a call for ``key`` is already in flight
+
+        If a call is already in flight then wait for it to complete
+        and return its result instead.
+
+        Args:
+
+            key (hashable): Identifies the call (Eg: the URL and params)
+            fn (callable): The function to call
+
+        Returns:
+
+            object: The return value of ``fn``
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.saved += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
@@ -0,0 +1,112 @@
+"""
+Incremental decoding of large JSON list responses.
+
+Rather than buffering the entire response and building the complete
+Python list before decoding begins, a streaming manager parses each
+item from the response body as it arrives::
+
+    class Event(Resource):
+        ... define fields...
+
+        objects = Manager(stream=True)
+
+    for event in Event.objects:
+        process(event)
+
+Only the item currently being processed (plus a single chunk of the
+response body) needs to be held in memory.
+
+.. note:: Streaming requires the endpoint to return a top-level JSON
+    array. Streamed requests bypass the backend's response cache, and
+    always ask for JSON, whichever serializer is preferred.
+"""
+import codecs
+import json
+
+
+def iter_json_array(chunks, decoder=None):
+    """ Incrementally parse the items of a JSON array
+
+    For example::
+
+        >>> list(iter_json_array(['[1, {"a":', ' "b"}, 2', '3]']))
+        [1, {'a': 'b'}, 23]
+
+    Args:
+
+        chunks (iterable[str]): The text of the JSON document, in chunks
+        decoder (json.JSONDecoder): The decoder to use for each item
+
+    Returns:
+
+        generator: Yielding each item in the array in turn
+    """
+    decoder = decoder or json.JSONDecoder()
+    buffer = ''
+    started = False
+    finished = False
+    chunks = iter(chunks)
+
+    while True:
+        try:
+            buffer += next(chunks)
+        except StopIteration:
+            finished = True
+
+        pos = 0
+        while True:
+            pos = _skip_whitespace(buffer, pos)
+            if pos >= len(buffer):
+                break
+            if not started:
+                if buffer[pos] != '[':
+                    raise ValueError('Expected a JSON array')
+                started = True
+                pos += 1
+                continue
+            if buffer[pos] == ']':
+                return
+            if buffer[pos] == ',':
+                pos += 1
+                continue
+
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except ValueError:
+                if finished:
+                    raise
+                # The item is incomplete, read more data
+                break
+            # Only accept the item once it is followed by a delimiter, as a
+            # number may continue in the next chunk (Eg: ``1`` then ``.5``)
+            next_pos = _skip_whitespace(buffer, end)
+            if next_pos >= len(buffer) or buffer[next_pos] not in ',]':
+                if finished:
+                    raise ValueError('Expected "," or "]" at position {}'.format(next_pos))
+                break
+            yield item
+            pos = next_pos
+
+        buffer = buffer[pos:]
+        if finished:
+            raise ValueError('Unexpected end of JSON array')
+
+
+def iter_text(response, chunk_size):
+    """ Iterate over the body of a :class:`requests.Response` as text
+    """
+    decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+    for chunk in response.iter_content(chunk_size):
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    text = decoder.decode(b'', final=True)
+    if text:
+        yield text
+
+
+def _skip_whitespace(buffer, pos):
+    length = len(buffer)
+    while pos < length and buffer[pos] in ' \t\n\r':
+        pos += 1
+    return pos
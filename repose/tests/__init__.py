@@ -1,3 +1,4 @@
+import json as jsonlib
 from contextlib import contextmanager
 from unittest import TestCase as BaseTestCase
 from requests import Response
@@ -20,27 +21,36 @@ class TestCase(BaseTestCase):
 
 class DummyResponse(Response):
 
-    def __init__(self, json):
+    def __init__(self, json, headers=None, status_code=200):
         super(DummyResponse, self).__init__()
-        self.status_code = 200
+        self.status_code = status_code
+        self.headers.update(headers or {})
         self._json = json
+        self._content = jsonlib.dumps(json).encode('utf8')
+        self._content_consumed = True
 
     def json(self):
         return self._json
 
 
 class TestApiBackend(ApiBackend):
-    responses = {}
-    requests = []
 
-    def add_response(self, method, endpoint, data):
-        response = DummyResponse(data)
+    def __init__(self, *args, **kwargs):
+        super(TestApiBackend, self).__init__(*args, **kwargs)
+        self.responses = {}
+        self.requests = []
+
+    def add_response(self, method, endpoint, data, headers=None, status_code=200):
+        response = DummyResponse(data, headers=headers, status_code=status_code)
         key = (method.upper(), endpoint.rstrip('/'))
         self.responses[key] =response
 
-    def _request(self, method, endpoint, json=None):
+    def send(self, method, endpoint, params=None, json=None, headers=None, stream=False):
+        self.last_headers = headers
         method = method.upper()
         endpoint = endpoint.rstrip('/')
+        if params:
+            endpoint += '?' + '&'.join('{}={}'.format(k, v) for k, v in sorted(params.items()))
         try:
             response = self.responses[method, endpoint]
             self.requests.append((method, endpoint, json, True))
@@ -48,16 +58,7 @@ class TestApiBackend(ApiBackend):
             self.requests.append((method, endpoint, json, False))
             raise UnexpectedRequest('{} {}'.format(method, endpoint))
 
-        return self.parse_response(response)
-
-    def get(self, endpoint):
-        return self._request('GET', endpoint)
-
-    def put(self, endpoint, json):
-        return self._request('PUT', endpoint, json)
-
-    def post(self, endpoint, json):
-        return self._request('POST', endpoint, json)
+        return response
 
     @contextmanager
     def assert_call(self, method, endpoint, request_data=None, response_data=None):
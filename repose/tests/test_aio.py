@@ -0,0 +1,327 @@
+import json
+import threading
+import time
+from unittest import skipIf
+
+from six.moves import BaseHTTPServer, socketserver
+
+from repose.tests import TestCase, User, USER_DATA
+
+try:
+    import asyncio
+except ImportError:  # pragma: no cover
+    asyncio = None
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+
+@skipIf(asyncio is None, 'asyncio is not available')
+class AsyncTestCase(TestCase):
+
+    def setUp(self):
+        super(AsyncTestCase, self).setUp()
+        from repose.aio import AsyncApiBackend
+
+        sync_api = self.api
+
+        class TestAsyncApiBackend(AsyncApiBackend):
+
+            def fetch(self, method, endpoint, params=None, json=None):
+                # Resolve the request using the synchronous test backend
+                future = asyncio.Future()
+                future.set_result(sync_api.fetch(method, endpoint, params, json))
+                return future
+
+        self.backend = TestAsyncApiBackend(base_url='/test-api/')
+        User.contribute_api(self.backend)
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        asyncio.set_event_loop(None)
+        self.loop.close()
+        User.contribute_api(self.api)
+
+    def run_async(self, awaitable):
+        return self.loop.run_until_complete(awaitable)
+
+    def test_aget(self):
+        self.api.add_response('GET', '/user/1', USER_DATA)
+        user = self.run_async(User.objects.aget(user_id=1))
+        self.assertEqual(user.id, 1)
+        self.assertEqual(user.name, 'Test User')
+
+    def test_aall(self):
+        from repose.managers import Manager
+        manager = Manager()
+        manager.contribute_to_class(User)
+        self.api.add_response('GET', '/user', [USER_DATA])
+        users = self.run_async(manager.aall())
+        self.assertEqual(len(users), 1)
+        self.assertEqual(users[0].id, 1)
+
+    def test_async_iter(self):
+        from repose.managers import Manager
+        manager = Manager()
+        manager.contribute_to_class(User)
+        self.api.add_response('GET', '/user', [USER_DATA])
+        iterator = manager.__aiter__()
+        user = self.run_async(iterator.__anext__())
+        self.assertEqual(user.id, 1)
+        with self.assertRaises(StopAsyncIteration):
+            self.run_async(iterator.__anext__())
+
+    def test_aall_paginated(self):
+        from repose.managers import Manager
+        from repose.pagination import PagePaginator
+        manager = Manager(paginator=PagePaginator(per_page=1))
+        manager.contribute_to_class(User)
+        self.api.add_response('GET', '/user?page=1&per_page=1', [USER_DATA])
+        self.api.add_response('GET', '/user?page=2&per_page=1', [dict(USER_DATA, id=2)])
+        self.api.add_response('GET', '/user?page=3&per_page=1', [])
+        users = self.run_async(manager.aall())
+        self.assertEqual([u.id for u in users], [1, 2])
+        self.assertEqual(len(self.api.requests), 3)
+
+    def test_async_iter_paginated(self):
+        from repose.managers import Manager
+        from repose.pagination import CursorPaginator
+        manager = Manager(paginator=CursorPaginator())
+        manager.contribute_to_class(User)
+        self.api.add_response('GET', '/user', dict(results=[USER_DATA], next_cursor='abc'))
+        self.api.add_response('GET', '/user?cursor=abc',
+                              dict(results=[dict(USER_DATA, id=2)], next_cursor=None))
+
+        # Each page is fetched only once the previous page has been iterated over
+        iterator = manager.__aiter__()
+        self.assertEqual(self.run_async(iterator.__anext__()).id, 1)
+        self.assertEqual(len(self.api.requests), 1)
+        self.assertEqual(self.run_async(iterator.__anext__()).id, 2)
+        self.assertEqual(len(self.api.requests), 2)
+        with self.assertRaises(StopAsyncIteration):
+            self.run_async(iterator.__anext__())
+        self.assertIsNone(manager.results)
+
+    def test_aall_stream(self):
+        from repose.managers import Manager
+        manager = Manager(stream=True)
+        manager.contribute_to_class(User)
+        self.api.add_response('GET', '/user', [USER_DATA, dict(USER_DATA, id=2)])
+        users = self.run_async(manager.aall())
+        self.assertEqual([u.id for u in users], [1, 2])
+
+    def test_asave(self):
+        user = User(**USER_DATA)
+        user.name = 'New Name'
+        with self.api.assert_call('PUT', '/user/1', request_data=dict(name='New Name')):
+            self.run_async(user.asave())
+
+    def test_arefresh(self):
+        user = User(**USER_DATA)
+        data = dict(USER_DATA, name='Refreshed')
+        with self.api.assert_call('GET', '/user/1', response_data=data):
+            self.run_async(user.arefresh())
+        self.assertEqual(user.name, 'Refreshed')
+
+    def test_single_flight(self):
+        from repose.aio import AsyncSingleFlight
+        flight = AsyncSingleFlight()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            future = asyncio.Future()
+            self.loop.call_soon(future.set_result, USER_DATA)
+            return future
+
+        results = self.run_async(asyncio.gather(
+            flight.do('/user/1', fetch), flight.do('/user/1', fetch)))
+        self.assertEqual(results, [USER_DATA, USER_DATA])
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.saved, 1)
+
+
+class _Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Timed out requests are disconnected before they are responded to
+        pass
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """ Responds using the ``(status, data, delay, headers)`` routes of the server
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.respond()
+
+    def do_PUT(self):
+        self.respond()
+
+    def respond(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        self.server.received.append((self.command, self.path, body))
+        status, data, delay, headers = self.server.routes.get(
+            (self.command, self.path), (404, {'error': 'Not found'}, 0, {}))
+        time.sleep(delay)
+        content = json.dumps(data).encode('utf8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@skipIf(asyncio is None or aiohttp is None, 'aiohttp is not available')
+class AsyncBackendTestCase(TestCase):
+    """ Use the AsyncApiBackend to make real requests to a local server
+    """
+
+    def setUp(self):
+        super(AsyncBackendTestCase, self).setUp()
+        self.server = _Server(('127.0.0.1', 0), _Handler)
+        self.server.routes = {}
+        self.server.received = []
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.01,))
+        self.thread.daemon = True
+        self.thread.start()
+        self.base_url = 'http://{}:{}/api'.format(*self.server.server_address[:2])
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        # Cleanups run in reverse, so backends are closed before the loop
+        self.addCleanup(self.stop)
+
+    def stop(self):
+        asyncio.set_event_loop(None)
+        self.loop.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+    def add_route(self, method, path, data, status=200, delay=0, headers=None):
+        self.server.routes[method, '/api' + path] = (status, data, delay, headers or {})
+
+    def make_backend(self, **options):
+        from repose.aio import AsyncApiBackend
+        backend = AsyncApiBackend(self.base_url, **options)
+        self.addCleanup(lambda: self.loop.run_until_complete(backend.close()))
+        return backend
+
+    def run_async(self, awaitable):
+        return self.loop.run_until_complete(awaitable)
+
+    def test_get(self):
+        self.add_route('GET', '/user/1', USER_DATA)
+        backend = self.make_backend()
+        self.assertEqual(self.run_async(backend.get('/user/1')), USER_DATA)
+
+    def test_params(self):
+        self.add_route('GET', '/user?name=a', [USER_DATA])
+        backend = self.make_backend()
+        self.assertEqual(self.run_async(backend.get('/user', params={'name': 'a'})), [USER_DATA])
+
+    def test_put(self):
+        self.add_route('PUT', '/user/1', USER_DATA)
+        backend = self.make_backend()
+        self.run_async(backend.put('/user/1', {'name': 'New Name'}))
+        method, path, body = self.server.received[0]
+        self.assertEqual(json.loads(body.decode('utf8')), {'name': 'New Name'})
+
+    def test_error(self):
+        backend = self.make_backend()
+        with self.assertRaises(aiohttp.ClientResponseError) as context:
+            self.run_async(backend.get('/user/2'))
+        self.assertEqual(context.exception.status, 404)
+
+    def test_timeout(self):
+        self.add_route('GET', '/slow', {}, delay=0.5)
+        backend = self.make_backend(timeout=0.05)
+        with self.assertRaises(asyncio.TimeoutError):
+            self.run_async(backend.get('/slow'))
+
+    def test_read_timeout(self):
+        self.add_route('GET', '/slow', {}, delay=0.5)
+        backend = self.make_backend(timeout=(5, 0.05))
+        with self.assertRaises(asyncio.TimeoutError):
+            self.run_async(backend.get('/slow'))
+
+    def test_single_flight(self):
+        from repose.aio import AsyncSingleFlight
+        self.add_route('GET', '/user/1', USER_DATA, delay=0.1)
+        backend = self.make_backend(single_flight=AsyncSingleFlight())
+        results = self.run_async(asyncio.gather(backend.get('/user/1'), backend.get('/user/1')))
+        self.assertEqual(results, [USER_DATA, USER_DATA])
+        self.assertEqual(len(self.server.received), 1)
+        self.assertEqual(backend.single_flight.saved, 1)
+
+    def test_single_flight_list_params(self):
+        from repose.aio import AsyncSingleFlight
+        self.add_route('GET', '/user?id=1&id=2', [USER_DATA])
+        backend = self.make_backend(single_flight=AsyncSingleFlight())
+        data = self.run_async(backend.get('/user', params={'id': [1, 2]}))
+        self.assertEqual(data, [USER_DATA])
+
+    def test_request_hooks(self):
+        self.add_route('GET', '/user/1', USER_DATA)
+        events = []
+        backend = self.make_backend(request_hooks=[events.append])
+        self.run_async(backend.get('/user/1'))
+        event, = events
+        self.assertEqual(event.status, 200)
+        self.assertEqual(event.response_bytes, len(json.dumps(USER_DATA)))
+        self.assertGreater(event.latency, 0)
+
+    def test_link_header_pages(self):
+        from repose.managers import Manager
+        from repose.pagination import LinkHeaderPaginator
+        self.add_route('GET', '/user?per_page=1', [USER_DATA],
+                       headers={'Link': '<{}/user?page=2>; rel="next"'.format(self.base_url)})
+        self.add_route('GET', '/user?page=2', [dict(USER_DATA, id=2)])
+        manager = Manager(paginator=LinkHeaderPaginator(per_page=1))
+        manager.contribute_to_class(User)
+        User.contribute_api(self.make_backend())
+        self.addCleanup(User.contribute_api, self.api)
+        iterator = manager.__aiter__()
+        self.assertEqual(self.run_async(iterator.__anext__()).id, 1)
+        self.assertEqual(self.run_async(iterator.__anext__()).id, 2)
+        with self.assertRaises(StopAsyncIteration):
+            self.run_async(iterator.__anext__())
+        self.assertEqual(len(self.server.received), 2)
+
+    def test_unsupported_options(self):
+        from repose.aio import AsyncApiBackend
+        from repose.cache import ResponseCache
+        from repose.ratelimit import RequestScheduler
+        self.assertRaises(ValueError, AsyncApiBackend, self.base_url, cache=ResponseCache())
+        self.assertRaises(ValueError, AsyncApiBackend, self.base_url,
+                          scheduler=RequestScheduler())
+
+    def test_api_async_with(self):
+        from repose.api import Api
+        from repose.aio import AsyncApiBackend
+        self.add_route('GET', '/user/1', USER_DATA)
+        api = Api(base_url=self.base_url, backend_class=AsyncApiBackend)
+
+        def use_api():
+            with api:
+                pass
+        self.assertRaises(TypeError, use_api)
+
+        context = api.__aenter__()
+        self.assertIs(self.run_async(context), api)
+        self.assertEqual(self.run_async(api.get('/user/1')), USER_DATA)
+        session = api.backend.session
+        self.run_async(api.__aexit__(None, None, None))
+        self.assertTrue(session.closed)
+        self.assertIsNone(api.backend._session)
@@ -0,0 +1,38 @@
+from repose.apibackend import ApiBackend
+from repose.tests import TestCase
+
+
+class ApiBackendSessionTestCase(TestCase):
+
+    def setUp(self):
+        super(ApiBackendSessionTestCase, self).setUp()
+        self.backend = ApiBackend('http://example.com/api',
+                                  pool_maxsize=20,
+                                  headers={'X-Token': 'abc'},
+                                  timeout=5)
+
+    def test_session_reused(self):
+        self.assertIs(self.backend.session, self.backend.session)
+
+    def test_session_options(self):
+        session = self.backend.session
+        self.assertEqual(session.headers['X-Token'], 'abc')
+        adapter = session.get_adapter('http://example.com/api/user')
+        self.assertEqual(adapter._pool_maxsize, 20)
+        self.assertEqual(self.backend.timeout, 5)
+
+    def test_close(self):
+        session = self.backend.session
+        self.backend.close()
+        self.assertIsNot(self.backend.session, session)
+
+    def test_context_manager(self):
+        with self.backend as backend:
+            session = backend.session
+        self.assertIsNone(self.backend._session)
+        self.assertIsNot(self.backend.session, session)
+
+    def test_api_backend_options(self):
+        from repose.tests import TestApi
+        api = TestApi(backend_options={'timeout': 3})
+        self.assertEqual(api.backend.timeout, 3)
@@ -0,0 +1,217 @@
+from requests import HTTPError
+from repose.tests import TestCase, USER_DATA
+
+
+class ResponseCacheTestCase(TestCase):
+
+    def setUp(self):
+        super(ResponseCacheTestCase, self).setUp()
+        from repose.cache import ResponseCache
+        self.cache = ResponseCache(maxsize=10, negative_ttl=60)
+        self.api.backend.cache = self.cache
+
+    def test_fresh_hit(self):
+        self.api.add_response('GET', '/user/1', USER_DATA,
+                              headers={'Cache-Control': 'max-age=60'})
+        self.assertEqual(self.api.get('/user/1'), USER_DATA)
+        self.assertEqual(self.api.get('/user/1'), USER_DATA)
+        self.assertEqual(len(self.api.requests), 1)
+        self.assertEqual(self.cache.stats.as_dict(),
+                         dict(hits=1, misses=1, revalidations=0, negative_hits=0))
+
+    def test_revalidate(self):
+        self.api.add_response('GET', '/user/1', USER_DATA,
+                              headers={'Cache-Control': 'no-cache', 'ETag': '"abc"'})
+        data = self.api.get('/user/1')
+        self.api.add_response('GET', '/user/1', None, status_code=304)
+
+        self.assertIs(self.api.get('/user/1'), data)
+        self.assertEqual(self.api.last_headers, {'If-None-Match': '"abc"'})
+        self.assertEqual(self.cache.stats.revalidations, 1)
+        self.assertEqual(len(self.api.requests), 2)
+
+    def test_no_store(self):
+        self.api.add_response('GET', '/user/1', USER_DATA,
+                              headers={'Cache-Control': 'no-store', 'ETag': '"abc"'})
+        self.api.get('/user/1')
+        self.api.get('/user/1')
+        self.assertIsNone(self.api.last_headers)
+        self.assertEqual(self.cache.stats.misses, 2)
+
+    def test_negative(self):
+        self.api.add_response('GET', '/user/2', None, status_code=404)
+        self.assertRaises(HTTPError, self.api.get, '/user/2')
+        self.assertRaises(HTTPError, self.api.get, '/user/2')
+        self.assertEqual(len(self.api.requests), 1)
+        self.assertEqual(self.cache.stats.negative_hits, 1)
+
+    def test_list_params(self):
+        self.api.add_response('GET', '/user?id=[1, 2]', [USER_DATA],
+                              headers={'Cache-Control': 'max-age=60'})
+        self.assertEqual(self.api.get('/user', params={'id': [1, 2]}), [USER_DATA])
+        self.assertEqual(self.api.get('/user', params={'id': [1, 2]}), [USER_DATA])
+        self.assertEqual(len(self.api.requests), 1)
+        self.assertNotEqual(self.cache.make_key('/user', {'id': [1, 2]}),
+                            self.cache.make_key('/user', {'id': [2, 1]}))
+
+    def test_put_invalidates(self):
+        self.api.add_response('GET', '/user/1', USER_DATA,
+                              headers={'Cache-Control': 'max-age=60'})
+        self.api.add_response('PUT', '/user/1', None)
+        self.api.get('/user/1')
+        self.api.put('/user/1', dict(name='New Name'))
+        self.api.get('/user/1')
+        self.assertEqual(self.cache.stats.misses, 2)
+
+
+class LRUCacheTestCase(TestCase):
+
+    def test_eviction(self):
+        from repose.cache import LRUCache
+        cache = LRUCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+
+    def test_ttl(self):
+        from repose.cache import LRUCache
+        cache = LRUCache(maxsize=2, ttl=-1)
+        cache.set('a', 1)
+        self.assertIsNone(cache.get('a'))
+
+
+class IdentityMapTestCase(TestCase):
+
+    def setUp(self):
+        super(IdentityMapTestCase, self).setUp()
+        from repose.cache import IdentityMap
+        self.api.backend.identity_map = IdentityMap(maxsize=10)
+
+    def test_get(self):
+        from repose.tests import User
+        self.api.add_response('GET', '/user/1', USER_DATA)
+        user = User.objects.get(user_id=1)
+        self.assertIs(User.objects.get(user_id=1), user)
+        self.assertEqual(len(self.api.requests), 1)
+
+    def test_get_many(self):
+        from repose.tests import User
+        self.api.add_response('GET', '/user/1', USER_DATA)
+        self.api.add_response('GET', '/user/2', dict(USER_DATA, id=2))
+        user = User.objects.get(user_id=1)
+        users = User.objects.get_many([1, 2])
+        self.assertIs(users[0], user)
+        self.assertEqual(users[1].id, 2)
+        self.assertEqual(len(self.api.requests), 2)
+
+    def test_invalidate(self):
+        from repose.tests import User
+        self.api.add_response('GET', '/user/1', USER_DATA)
+        user = User.objects.get(user_id=1)
+        self.api.identity_map.invalidate(User)
+        self.assertIsNot(User.objects.get(user_id=1), user)
+
+
+class ResultCacheTestCase(TestCase):
+
+    def setUp(self):
+        super(ResultCacheTestCase, self).setUp()
+        from repose.cache import ResultCache
+        from repose.managers import Manager
+        from repose.tests import User
+        self.cache = ResultCache(ttl=60, max_results=3)
+        self.api.backend.result_cache = self.cache
+        self.manager = Manager()
+        self.manager.contribute_to_class(User)
+        self.api.add_response('GET', '/user', [USER_DATA])
+
+    def tearDown(self):
+        self.api.backend.result_cache = None
+
+    def test_shared_between_managers(self):
+        self.manager.all()
+        self.manager._clone().all()
+        self.assertEqual(len(self.api.requests), 1)
+
+    def test_ttl(self):
+        self.manager.all()
+        self.cache.ttl = 0
+        self.cache.set(self.manager.get_cache_key(), self.manager.results)
+        self.assertIsNone(self.manager.results)
+        self.manager.all()
+        self.assertEqual(len(self.api.requests), 2)
+
+    def test_invalidate(self):
+        self.manager.all()
+        self.manager.invalidate()
+        self.manager.all()
+        self.assertEqual(len(self.api.requests), 2)
+
+    def test_save_invalidates(self):
+        from repose.tests import User
+        user = self.manager.all()[0]
+        user.name = 'New Name'
+        with self.api.assert_call('PUT', '/user/1'):
+            user.save()
+        self.assertIsNone(self.manager.results)
+
+    def test_bulk_update_invalidates(self):
+        from repose.tests import User
+        users = self.manager.all()
+        users[0].name = 'New Name'
+        self.api.add_response('PUT', '/user/1', {})
+        generation = self.cache.generation(User)
+        User.objects.bulk_update(users)
+        self.assertIsNone(self.manager.results)
+        # Invalidated once by each of the resource's managers, as when saving
+        self.assertEqual(self.cache.generation(User), generation + len(User._managers))
+
+    def test_list_params(self):
+        self.manager.get_params = lambda: {'tag': ['a', 'b']}
+        key = self.manager.get_cache_key()
+        self.assertEqual(hash(key), hash(self.manager.get_cache_key()))
+        self.assertIn(('tag', ('a', 'b')), key[2])
+
+    def test_stale_generation(self):
+        from repose.tests import User
+        generation = self.cache.generation(User)
+        self.cache.invalidate(User)
+        self.cache.set((User, '/user'), [1], generation)
+        self.assertIsNone(self.cache.get((User, '/user')))
+
+    def test_budget(self):
+        from repose.tests import User
+        self.cache.set((User, 'a'), [1, 2])
+        self.cache.set((User, 'b'), [1])
+        self.assertEqual(self.cache.size, 3)
+        self.cache.get((User, 'a'))
+        self.cache.set((User, 'c'), [1])
+        self.assertIsNone(self.cache.get((User, 'b')))
+        self.assertEqual(self.cache.get((User, 'a')), [1, 2])
+        self.cache.set((User, 'd'), [1, 2, 3, 4])
+        self.assertIsNone(self.cache.get((User, 'd')))
+        self.cache.set((User, 'e'), 100)
+        self.assertEqual(self.cache.size, 3)
+
+
+class ManagerInvalidateTestCase(TestCase):
+
+    def test_invalidate(self):
+        from repose.managers import Manager
+        from repose.tests import User
+        manager = Manager()
+        manager.contribute_to_class(User)
+        self.api.add_response('GET', '/user', [USER_DATA])
+        manager.all()
+        manager.invalidate()
+        self.assertIsNone(manager.results)
+
+    def test_provided_results_kept(self):
+        from repose.tests import User
+        user = User(**USER_DATA)
+        user.posts.invalidate()
+        self.assertEqual(len(user.posts.results), 2)
@@ -50,6 +50,16 @@ class ManagedIdListCollectionTestCase(TestCase):
         list(self.resource.users.all())
         self.assertEqual(len(self.api.requests), 3)
 
+    def test_decode_window(self):
+        data = [1,2,3]
+        self.resource._update(self.resource.decode(raw=dict(users=data)))
+        self.resource.users.results.window = 1
+        self.api.add_response('GET', '/user/2', USER_DATA)
+
+        self.assertEqual(self.resource.users.all()[1].name, 'Test User')
+        self.assertEqual(len(self.resource.users.all()), 3)
+        self.assertEqual(len(self.api.requests), 1)
+
     def test_encode_no_change(self):
         data = [1,2,3]
         self.resource._update(self.resource.decode(raw=dict(users=data)))
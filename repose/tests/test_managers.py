@@ -44,3 +44,249 @@ class ManagerTestCase(TestCase):
         self.api.add_response('GET', '/user', [USER_DATA, user2])
         self.assertEqual(self.manager.count(), 1)
         self.assertEqual(len(self.manager.all()), 1)
+
+    def test_get_many(self):
+        self.api.add_response('GET', '/user/1', USER_DATA)
+        self.api.add_response('GET', '/user/2', dict(USER_DATA, id=2))
+        users = self.manager.get_many([2, 1])
+        self.assertEqual([u.id for u in users], [2, 1])
+        self.assertEqual(len(self.api.requests), 2)
+
+    def test_get_many_bulk(self):
+        from repose import Resource, fields
+
+        class Tag(Resource):
+            id = fields.Integer()
+
+            class Meta:
+                endpoint = '/tag/{tag_id}'
+                endpoint_bulk = '/tag'
+                bulk_size = 2
+
+        Tag.contribute_api(self.api)
+        self.api.add_response('GET', '/tag?ids=3,1', [dict(id=1), dict(id=3)])
+        self.api.add_response('GET', '/tag?ids=2', [dict(id=2)])
+        tags = Tag.objects.get_many([3, 1, 2])
+        self.assertEqual([t.id for t in tags], [3, 1, 2])
+        self.assertEqual(len(self.api.requests), 2)
+
+    def test_id_list_bulk_size(self):
+        from repose import Resource, fields
+        from repose.decoders import IdToLazyModelListDecoder
+
+        class Tag(Resource):
+            id = fields.Integer()
+
+            class Meta:
+                endpoint = '/tag/{tag_id}'
+                endpoint_bulk = '/tag'
+                bulk_size = 2
+
+        Tag.contribute_api(self.api)
+        self.api.add_response('GET', '/tag?ids=3,1', [dict(id=1), dict(id=3)])
+        self.api.add_response('GET', '/tag?ids=2', [dict(id=2)])
+        tags = IdToLazyModelListDecoder(Tag).decode([3, 1, 2])
+        self.assertEqual(tags.window, 2)
+        self.assertEqual([t.id for t in tags], [3, 1, 2])
+        self.assertEqual(len(self.api.requests), 2)
+
+    def test_compact(self):
+        from repose.managers import Manager
+        from repose.resources import CompactResource
+        manager = Manager(compact=True)
+        manager.contribute_api(self.api)
+        manager.contribute_to_class(User)
+        self.api.add_response('GET', '/user', [USER_DATA])
+        user = manager.all()[0]
+        self.assertIsInstance(user, CompactResource)
+        self.assertFalse(hasattr(user, '__dict__'))
+        self.assertEqual(user.name, 'Test User')
+        self.assertEqual(user.profile.age, 42)
+        self.assertEqual(user.posts.count(), 2)
+        self.assertEqual(dict(user)['profile'], {'email': 'test@example.com', 'age': 42})
+        with self.assertRaises(AttributeError):
+            user.name = 'New Name'
+
+    def test_compact_to_resource(self):
+        from repose.managers import Manager
+        manager = Manager(compact=True)
+        manager.contribute_api(self.api)
+        manager.contribute_to_class(User)
+        self.api.add_response('GET', '/user', [USER_DATA])
+        user = manager.all()[0].to_resource()
+        self.assertIsInstance(user, User)
+        user.name = 'New Name'
+        with self.api.assert_call('PUT', '/user/1', {'name': 'New Name'}):
+            user.save()
+
+    def test_bulk_update(self):
+        users = [User(**dict(USER_DATA, id=i)) for i in (1, 2, 3)]
+        users[0].name = 'One'
+        users[2].name = 'Three'
+        self.api.add_response('PUT', '/user/1', {})
+        results = User.objects.bulk_update(users)
+        self.assertEqual([r.updated for r in results], [True, False, True])
+        self.assertTrue(results[0].success)
+        self.assertFalse(results[2].success)
+        self.assertFalse(users[0].has_changed())
+        self.assertTrue(users[2].has_changed())
+
+    def test_bulk_update_fields(self):
+        user = User(**USER_DATA)
+        user.name = 'New Name'
+        user.id = 1
+        user.profile.age = 43
+        with self.api.assert_call('PUT', '/user/1', {'name': 'New Name'}):
+            User.objects.bulk_update([user], fields=['name'])
+        self.assertEqual(list(user.get_changes()), ['profile'])
+
+    def test_bulk_update_endpoint(self):
+        from repose import Resource, fields
+
+        class Tag(Resource):
+            id = fields.Integer()
+            name = fields.String()
+
+            class Meta:
+                endpoint = '/tag/{tag_id}'
+                endpoint_bulk_update = '/tag'
+
+        Tag.contribute_api(self.api)
+        tags = [Tag(id=1, name='a'), Tag(id=2, name='b')]
+        for tag in tags:
+            tag.name += '!'
+        with self.api.assert_call('PUT', '/tag', [{'id': 1, 'name': 'a!'}, {'id': 2, 'name': 'b!'}]):
+            results = Tag.objects.bulk_update(tags)
+        self.assertTrue(all(r.success for r in results))
+
+    def test_only(self):
+        self.api.add_response('GET', '/user?fields=id,name', [{'id': 1, 'name': 'Test User'}])
+        users = User.objects.only('id', 'name').all()
+        self.assertEqual(users[0].name, 'Test User')
+        self.assertEqual(len(self.api.requests), 1)
+        # The shared manager is unaffected
+        self.assertIsNone(User.objects.results)
+
+    def test_defer(self):
+        self.api.add_response('GET', '/user?fields=id,name', [{'id': 1, 'name': 'Test User'}])
+        self.api.add_response('GET', '/user/1?fields=posts,profile', USER_DATA)
+        user = User.objects.defer('profile').defer('posts').all()[0]
+        self.assertEqual(user.profile.age, 42)
+        self.assertEqual(user.posts.count(), 2)
+        self.assertEqual(len(self.api.requests), 2)
+
+    def test_only_unknown_field(self):
+        from booby.errors import FieldError
+        with self.assertRaises(FieldError):
+            User.objects.only('foo')
+
+
+class PrefetchRelatedTestCase(TestCase):
+
+    def setUp(self):
+        super(PrefetchRelatedTestCase, self).setUp()
+        from repose import Resource, fields
+
+        class Member(Resource):
+            id = fields.Integer()
+            name = fields.String()
+
+            class Meta:
+                endpoint = '/member/{member_id}'
+                endpoint_list = '/member'
+
+        class Note(Resource):
+            id = fields.Integer()
+            text = fields.String()
+
+            class Meta:
+                endpoint = '/team/{team_id}/note/{note_id}'
+                endpoint_list = '/team/{team_id}/note'
+
+        class Settings(Resource):
+            colour = fields.String()
+
+            class Meta:
+                endpoint = '/team/{team_id}/settings'
+
+        class Team(Resource):
+            id = fields.Integer()
+            name = fields.String()
+            notes = fields.ManagedCollection(Note)
+            settings = fields.Embedded(Settings)
+            members = fields.ManagedIdListCollection(Member)
+
+            class Meta:
+                endpoint = '/team/{team_id}'
+                endpoint_list = '/team'
+
+        Team.contribute_api(self.api)
+        Note.contribute_api(self.api)
+        self.Team = Team
+        self.api.add_response('GET', '/team', [
+            {'id': 1, 'name': 'Red Team', 'members': [1, 2]},
+            {'id': 2, 'name': 'Blue Team', 'members': [2]},
+        ])
+
+    def test_results_endpoint(self):
+        team = self.Team(id=1)
+        self.assertEqual(team.notes.get_results_endpoint(), '/team/1/note')
+
+    def test_prefetch(self):
+        self.api.add_response('GET', '/team/1/note', [{'id': 1, 'text': 'Hello'}])
+        self.api.add_response('GET', '/team/2/note', [])
+        self.api.add_response('GET', '/team/1/settings', {'colour': 'red'})
+        self.api.add_response('GET', '/team/2/settings', {'colour': 'blue'})
+        self.api.add_response('GET', '/member/1', {'id': 1, 'name': 'Alice'})
+        self.api.add_response('GET', '/member/2', {'id': 2, 'name': 'Bob'})
+
+        teams = self.Team.objects.prefetch_related('notes', 'settings', 'members').all()
+        self.assertEqual(len(self.api.requests), 7)
+        # Each member is fetched once
+        self.assertEqual(len([r for r in self.api.requests if r[1] == '/member/2']), 1)
+
+        red, blue = teams
+        self.assertEqual(red.notes.all()[0].text, 'Hello')
+        self.assertEqual(red.notes.all()[0].parent_resource.name, 'Red Team')
+        self.assertEqual(blue.notes.count(), 0)
+        self.assertEqual(blue.settings.colour, 'blue')
+        self.assertEqual(blue.settings.parent_resource.name, 'Blue Team')
+        self.assertEqual([m.name for m in red.members.all()], ['Alice', 'Bob'])
+        self.assertEqual(blue.members.all()[0].name, 'Bob')
+        self.assertFalse(red.has_changed())
+        self.assertEqual(len(self.api.requests), 7)
+
+    def test_loaded_results_linked(self):
+        self.api.add_response('GET', '/team/1/note', [{'id': 1, 'text': 'Hello'}])
+        team = self.Team.objects.all()[0]
+        # Not included, so load the notes from the API
+        team.notes.results = None
+        note = team.notes.all()[0]
+        self.assertEqual(note.parent_resource.name, 'Red Team')
+
+        note.text = 'Goodbye'
+        with self.api.assert_call('PUT', '/team/1/note/1', {'text': 'Goodbye'},
+                                  {'id': 1, 'text': 'Goodbye'}):
+            note.save()
+
+        # Also linked when reloaded, and when streamed
+        team.notes.invalidate()
+        self.assertEqual(team.notes.all()[0].parent_resource.name, 'Red Team')
+        team.notes.invalidate()
+        team.notes.stream = True
+        self.assertEqual(next(iter(team.notes)).parent_resource.name, 'Red Team')
+
+    def test_included_not_fetched(self):
+        self.api.add_response('GET', '/team', [
+            {'id': 1, 'name': 'Red Team', 'notes': [{'id': 1}], 'settings': {'colour': 'red'}},
+        ])
+        teams = self.Team.objects.prefetch_related('notes', 'settings').all()
+        self.assertEqual(len(self.api.requests), 1)
+        self.assertEqual(teams[0].settings.colour, 'red')
+
+    def test_not_related(self):
+        from booby.errors import FieldError
+        with self.assertRaises(FieldError):
+            self.Team.objects.prefetch_related('name')
+        with self.assertRaises(FieldError):
+            self.Team.objects.prefetch_related('missing')
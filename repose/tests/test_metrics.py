@@ -0,0 +1,146 @@
+import requests
+
+from repose.apibackend import ApiBackend
+from repose.metrics import MetricsAggregator, RequestEvent, percentile
+from repose.tests import TestCase, User, USER_DATA
+
+
+def make_event(template='/user/{user_id}', status=200, connect=0.1, error=None, retries=0):
+    return RequestEvent(method='GET', endpoint=template, template=template, resource=User,
+                        status=status, error=error, connect=connect, transfer=0.0, parse=0.0,
+                        request_bytes=0, response_bytes=10, retries=retries)
+
+
+class FakeSession(object):
+
+    def request(self, method, url, **kwargs):
+        self.last_request = dict(kwargs, method=method, url=url)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"id": 1}'
+        response.headers['Content-Type'] = 'application/json'
+        return response
+
+
+class RequestHooksTestCase(TestCase):
+
+    def setUp(self):
+        super(RequestHooksTestCase, self).setUp()
+        self.events = []
+        self.api.backend.request_hooks.append(self.events.append)
+
+    def test_template(self):
+        self.api.add_response('GET', '/user/1', USER_DATA)
+        User.objects.get(user_id=1)
+        event, = self.events
+        self.assertEqual(event.method, 'GET')
+        self.assertEqual(event.endpoint, '/user/1')
+        self.assertEqual(event.template, '/user/{user_id}')
+        self.assertIs(event.resource, User)
+        self.assertEqual(event.status, 200)
+        self.assertFalse(event.failed)
+
+    def test_list_template(self):
+        self.api.add_response('GET', '/user', [USER_DATA])
+        User.objects.all()
+        self.assertEqual(self.events[0].template, '/user')
+
+    def test_error(self):
+        self.api.add_response('GET', '/user/2', {}, status_code=404)
+        with self.assertRaises(requests.HTTPError):
+            User.objects.get(user_id=2)
+        event, = self.events
+        self.assertEqual(event.status, 404)
+        self.assertIsInstance(event.error, requests.HTTPError)
+        self.assertTrue(event.failed)
+
+    def make_manager(self, **kwargs):
+        from repose.managers import Manager
+        manager = Manager(**kwargs)
+        manager.contribute_api(self.api)
+        manager.contribute_to_class(User)
+        return manager
+
+    def test_link_header_pages(self):
+        from repose.pagination import LinkHeaderPaginator
+        manager = self.make_manager(paginator=LinkHeaderPaginator())
+        self.api.add_response('GET', '/user', [USER_DATA],
+                              headers={'Link': '</user?page=2>; rel="next"'})
+        self.api.add_response('GET', '/user?page=2', [dict(USER_DATA, id=2)])
+        self.assertEqual(len(manager.all()), 2)
+        self.assertEqual([(e.method, e.endpoint) for e in self.events],
+                         [('GET', '/user'), ('GET', '/user?page=2')])
+        self.assertEqual(self.events[0].template, '/user')
+
+    def test_header_count(self):
+        from repose.counting import HeaderCount
+        manager = self.make_manager(count_source=HeaderCount())
+        self.api.add_response('HEAD', '/user', None, headers={'X-Total-Count': '5'})
+        self.assertEqual(manager.count(), 5)
+        event, = self.events
+        self.assertEqual(event.method, 'HEAD')
+        self.assertEqual(event.template, '/user')
+        self.assertEqual(event.status, 200)
+
+    def test_timings(self):
+        events = []
+        backend = ApiBackend('http://example.com/api', request_hooks=[events.append])
+        backend._session = FakeSession()
+        self.assertEqual(backend.get('/user/1'), {'id': 1})
+        self.assertTrue(backend._session.last_request['stream'])
+        event, = events
+        self.assertEqual(event.response_bytes, 9)
+        self.assertGreaterEqual(event.connect, 0)
+        self.assertGreaterEqual(event.transfer, 0)
+        self.assertGreaterEqual(event.parse, 0)
+        self.assertEqual(event.latency, event.connect + event.transfer + event.parse)
+
+    def test_no_hooks(self):
+        backend = ApiBackend('http://example.com/api')
+        backend._session = FakeSession()
+        backend.get('/user/1')
+        self.assertFalse(backend._session.last_request['stream'])
+
+
+class MetricsAggregatorTestCase(TestCase):
+
+    def test_export(self):
+        metrics = MetricsAggregator()
+        for i in range(1, 11):
+            metrics(make_event(connect=i / 10.0))
+        metrics(make_event(status=500, connect=2.0, retries=2))
+        metrics(make_event(template='/user'))
+
+        row, other = metrics.export()
+        self.assertEqual(row['method'], 'GET')
+        self.assertEqual(row['template'], '/user/{user_id}')
+        self.assertEqual(row['resource'], 'User')
+        self.assertEqual(row['count'], 11)
+        self.assertEqual(row['errors'], 1)
+        self.assertAlmostEqual(row['error_rate'], 1 / 11.0)
+        self.assertEqual(row['retries'], 2)
+        self.assertEqual(row['response_bytes'], 110)
+        self.assertEqual(row['latency']['p50'], 0.6)
+        self.assertEqual(row['latency']['max'], 2.0)
+        self.assertEqual(other['count'], 1)
+
+    def test_max_samples(self):
+        metrics = MetricsAggregator(max_samples=2)
+        for connect in (5.0, 1.0, 2.0):
+            metrics(make_event(connect=connect))
+        row, = metrics.export()
+        self.assertEqual(row['count'], 3)
+        self.assertEqual(row['latency']['max'], 2.0)
+
+    def test_reset(self):
+        metrics = MetricsAggregator()
+        metrics(make_event())
+        metrics.reset()
+        self.assertEqual(metrics.export(), [])
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([3], 90), 3)
+        self.assertIsNone(percentile([], 50))
@@ -0,0 +1,57 @@
+from repose.tests import TestCase, User, USER_DATA
+
+
+def user(id):
+    return dict(USER_DATA, id=id)
+
+
+class PaginationTestCase(TestCase):
+
+    def make_manager(self, paginator):
+        from repose.managers import Manager
+        manager = Manager(paginator=paginator)
+        manager.contribute_api(self.api)
+        manager.contribute_to_class(User)
+        return manager
+
+    def test_page(self):
+        from repose.pagination import PagePaginator
+        manager = self.make_manager(PagePaginator(per_page=2))
+        self.api.add_response('GET', '/user?page=1&per_page=2', [user(1), user(2)])
+        self.api.add_response('GET', '/user?page=2&per_page=2', [user(3)])
+        self.assertEqual([u.id for u in manager.all()], [1, 2, 3])
+
+    def test_offset(self):
+        from repose.pagination import OffsetPaginator
+        manager = self.make_manager(OffsetPaginator(limit=2))
+        self.api.add_response('GET', '/user?limit=2&offset=0', [user(1), user(2)])
+        self.api.add_response('GET', '/user?limit=2&offset=2', [])
+        self.assertEqual([u.id for u in manager.all()], [1, 2])
+
+    def test_cursor(self):
+        from repose.pagination import CursorPaginator
+        manager = self.make_manager(CursorPaginator())
+        self.api.add_response('GET', '/user', dict(results=[user(1)], next_cursor='abc'))
+        self.api.add_response('GET', '/user?cursor=abc', dict(results=[user(2)], next_cursor=None))
+        self.assertEqual([u.id for u in manager.all()], [1, 2])
+
+    def test_link_header(self):
+        from repose.pagination import LinkHeaderPaginator
+        manager = self.make_manager(LinkHeaderPaginator())
+        self.api.add_response('GET', '/user', [user(1)],
+                              headers={'Link': '</user?page=2>; rel="next"'})
+        self.api.add_response('GET', '/user?page=2', [user(2)])
+        self.assertEqual([u.id for u in manager.all()], [1, 2])
+
+    def test_iter_streams_pages(self):
+        from repose.pagination import PagePaginator
+        manager = self.make_manager(PagePaginator(per_page=1))
+        self.api.add_response('GET', '/user?page=1&per_page=1', [user(1)])
+        self.api.add_response('GET', '/user?page=2&per_page=1', [])
+
+        iterator = iter(manager)
+        self.assertEqual(next(iterator).id, 1)
+        self.assertEqual(len(self.api.requests), 1)
+        self.assertEqual(list(iterator), [])
+        self.assertEqual(len(self.api.requests), 2)
+        self.assertIsNone(manager.results)
@@ -0,0 +1,49 @@
+from booby import errors
+from booby.mixins import Encoder
+from booby.models import Model
+
+from repose import Resource, fields
+from repose.tests import TestCase, User, USER_DATA
+
+
+class Renamed(Resource):
+    id = fields.Integer()
+    full_name = fields.String(name='fullName')
+    secret = fields.String(read_only=True)
+    level = fields.Integer(choices=[1, 2])
+
+
+class PlanTestCase(TestCase):
+
+    def test_decode(self):
+        self.assertEqual(User.decode(USER_DATA), Model.decode.__func__(User, USER_DATA))
+
+    def test_decode_missing(self):
+        self.assertEqual(User.decode({'id': 1}), {'id': 1})
+
+    def test_decode_name(self):
+        decoded = Renamed.decode({'id': 1, 'fullName': 'Test', 'secret': 'x'})
+        self.assertEqual(decoded, {'id': 1, 'full_name': 'Test', 'secret': 'x'})
+
+    def test_encode(self):
+        user = User(**User.decode(USER_DATA))
+        self.assertEqual(user.encode(), Encoder.encode(user))
+
+    def test_encode_name(self):
+        renamed = Renamed(id=1, full_name='Test', secret='x', level=1)
+        self.assertEqual(renamed.encode(), {'id': 1, 'fullName': 'Test', 'level': 1})
+
+    def test_validate(self):
+        Renamed(id=1, level=1).validate()
+        with self.assertRaises(errors.ValidationError):
+            Renamed(id=1, level=3).validate()
+        self.assertFalse(Renamed(id='x').is_valid)
+
+    def test_rebuild_plan(self):
+        class Tag(Resource):
+            id = fields.Integer()
+
+        Tag.label = fields.String()
+        Tag._fields['label'] = Tag.label
+        Tag.rebuild_plan()
+        self.assertEqual(Tag.decode({'id': 1, 'label': 'x'}), {'id': 1, 'label': 'x'})
@@ -0,0 +1,158 @@
+from repose import Resource, fields
+from repose.tests import TestCase
+
+
+class Item(Resource):
+    id = fields.Integer()
+    name = fields.String()
+    active = fields.Boolean()
+
+    class Meta:
+        endpoint = '/item/{item_id}'
+        endpoint_list = '/item'
+        filters = {'active': 'is_active'}
+        order_param = 'ordering'
+        limit_param = 'limit'
+        offset_param = 'offset'
+
+
+class LocalItem(Resource):
+    id = fields.Integer()
+    name = fields.String()
+    active = fields.Boolean()
+
+    class Meta:
+        endpoint = '/local/{localitem_id}'
+        endpoint_list = '/local'
+
+
+ITEMS = [
+    {'id': 1, 'name': 'b', 'active': True},
+    {'id': 2, 'name': 'a', 'active': False},
+    {'id': 3, 'name': 'c', 'active': True},
+]
+
+
+class ServerQueryTestCase(TestCase):
+
+    def setUp(self):
+        super(ServerQueryTestCase, self).setUp()
+        Item.contribute_api(self.api)
+
+    def test_filter(self):
+        self.api.add_response('GET', '/item?is_active=True', ITEMS[:1])
+        self.assertEqual([i.id for i in Item.objects.filter(active=True)], [1])
+
+    def test_order_by(self):
+        self.api.add_response('GET', '/item?ordering=-name,id', ITEMS)
+        self.assertEqual(len(Item.objects.order_by('-name', 'id').all()), 3)
+
+    def test_slice(self):
+        self.api.add_response('GET', '/item?limit=10&offset=20', ITEMS)
+        items = Item.objects.filter(active=True)[10:30][10:]
+        self.assertEqual(items.get_params(), {'is_active': True, 'limit': 10, 'offset': 20})
+
+    def test_index(self):
+        self.api.add_response('GET', '/item?limit=1&offset=2', ITEMS[2:])
+        self.assertEqual(Item.objects[2].id, 3)
+
+    def test_client_filter_fallback(self):
+        self.api.add_response('GET', '/item', ITEMS)
+        items = Item.objects.filter(name='c')[:1]
+        self.assertEqual(items.get_params(), {})
+        self.assertEqual([i.id for i in items], [3])
+
+    def test_filter_after_slice(self):
+        with self.assertRaises(TypeError):
+            Item.objects[:10].filter(active=True)
+
+
+class ClientQueryTestCase(TestCase):
+
+    def setUp(self):
+        super(ClientQueryTestCase, self).setUp()
+        LocalItem.contribute_api(self.api)
+        self.api.add_response('GET', '/local', ITEMS)
+
+    def test_filter(self):
+        self.assertEqual([i.id for i in LocalItem.objects.filter(active=True)], [1, 3])
+
+    def test_order_by(self):
+        items = LocalItem.objects.order_by('-name')
+        self.assertEqual([i.id for i in items], [3, 1, 2])
+
+    def test_slice(self):
+        self.assertEqual([i.id for i in LocalItem.objects.order_by('name')[1:]], [1, 3])
+
+    def test_index(self):
+        manager = LocalItem.objects.filter()
+        self.assertEqual([manager[i].id for i in range(3)], [1, 2, 3])
+        self.assertEqual([i.id for i in manager[1:]], [2, 3])
+        self.assertEqual(manager.count(), 3)
+        self.assertRaises(IndexError, lambda: manager[3])
+        self.assertEqual(len(self.api.requests), 1)
+
+    def test_loaded_results(self):
+        manager = LocalItem.objects.filter()
+        manager.all()
+        self.assertEqual([i.id for i in manager.filter(name='a')], [2])
+        self.assertEqual(len(self.api.requests), 1)
+
+
+class CountTestCase(TestCase):
+
+    def setUp(self):
+        super(CountTestCase, self).setUp()
+        from repose.counting import HeaderCount
+        from repose.managers import Manager
+        self.manager = Manager(count_source=HeaderCount())
+        self.manager.contribute_to_class(Item)
+        Item.contribute_api(self.api)
+
+    def test_header_count(self):
+        self.api.add_response('HEAD', '/item?is_active=True&limit=1', [],
+                              headers={'X-Total-Count': '250'})
+        items = self.manager.filter(active=True)
+        self.assertEqual(items.count(), 250)
+        self.assertEqual(len(items), 250)
+        self.assertEqual(len(self.api.requests), 1)
+
+    def test_slice_count(self):
+        self.api.add_response('HEAD', '/item?limit=1', [], headers={'X-Total-Count': '250'})
+        self.assertEqual(self.manager[200:300].count(), 50)
+        self.assertEqual(self.manager[300:].count(), 0)
+
+    def test_len_unknown(self):
+        self.api.add_response('GET', '/item', ITEMS)
+        self.assertRaises(TypeError, len, self.manager)
+        # list() does not request the count before the results
+        self.assertEqual(len(list(self.manager)), len(ITEMS))
+        self.assertEqual([r[0] for r in self.api.requests], ['GET'])
+        self.assertEqual(len(self.manager), len(ITEMS))
+
+    def test_negative_index(self):
+        self.api.add_response('HEAD', '/item?limit=1', [], headers={'X-Total-Count': '250'})
+        self.api.add_response('GET', '/item?limit=10&offset=240', ITEMS)
+        self.assertEqual(self.manager[-10:].query_slice, (240, 250))
+        self.assertEqual(self.manager[-10:].count(), 10)
+
+    def test_envelope_count(self):
+        from repose.counting import EnvelopeCount
+        self.manager.count_source = EnvelopeCount('total')
+        self.api.add_response('GET', '/item?limit=1', {'total': 3, 'results': ITEMS[:1]})
+        self.assertTrue(self.manager.exists())
+        self.assertEqual(self.manager.count(), 3)
+
+    def test_exists_without_count_source(self):
+        self.manager.count_source = None
+        self.api.add_response('GET', '/item?limit=1', ITEMS[:1])
+        self.assertTrue(self.manager.exists())
+        self.assertEqual(len(self.api.requests), 1)
+
+    def test_count_fallback(self):
+        self.api.add_response('GET', '/item', ITEMS)
+        self.assertEqual(self.manager.filter(name='a').count(), 1)
+
+    def test_bool(self):
+        self.assertTrue(self.manager)
+        self.assertEqual(len(self.api.requests), 0)
@@ -0,0 +1,75 @@
+import requests
+from repose.tests import TestCase, DummyResponse
+
+
+class RequestSchedulerTestCase(TestCase):
+
+    def setUp(self):
+        super(RequestSchedulerTestCase, self).setUp()
+        from repose.ratelimit import RequestScheduler
+        self.sleeps = []
+        self.scheduler = RequestScheduler(max_retries=2, sleep=self.sleeps.append)
+
+    def sender(self, *responses):
+        responses = list(responses)
+
+        def send():
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+        return send
+
+    def test_retry_after(self):
+        send = self.sender(DummyResponse(None, status_code=429, headers={'Retry-After': '2'}),
+                           DummyResponse('ok'))
+        response = self.scheduler.call('GET', 'http://example.com/user', send)
+        self.assertEqual(response.json(), 'ok')
+        self.assertEqual(response.retries, 1)
+        self.assertEqual(len(self.sleeps), 1)
+        self.assertAlmostEqual(self.sleeps[0], 2, places=1)
+
+    def test_retried_response_closed(self):
+        closed = []
+        retried = DummyResponse(None, status_code=503)
+        retried.close = lambda: closed.append(retried)
+        final = DummyResponse('ok')
+        final.close = lambda: closed.append(final)
+        response = self.scheduler.call('GET', 'http://example.com/user',
+                                       self.sender(retried, final))
+        self.assertIs(response, final)
+        self.assertEqual(closed, [retried])
+
+    def test_max_retries(self):
+        send = self.sender(*[DummyResponse(None, status_code=503) for _ in range(3)])
+        response = self.scheduler.call('GET', 'http://example.com/user', send)
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(self.scheduler.retries, 2)
+        self.assertTrue(all(0 <= s <= 1 for s in self.sleeps))
+
+    def test_connection_error(self):
+        send = self.sender(requests.ConnectionError(), DummyResponse('ok'))
+        response = self.scheduler.call('GET', 'http://example.com/user', send)
+        self.assertEqual(response.json(), 'ok')
+
+    def test_non_idempotent_not_retried(self):
+        send = self.sender(DummyResponse(None, status_code=503))
+        response = self.scheduler.call('POST', 'http://example.com/user', send)
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(self.scheduler.retries, 0)
+
+    def test_rate_limit_exhausted(self):
+        send = self.sender(DummyResponse('ok', headers={'X-RateLimit-Remaining': '0',
+                                                        'X-RateLimit-Reset': '30'}),
+                           DummyResponse('ok'))
+        self.scheduler.call('GET', 'http://example.com/user', send)
+        self.scheduler.call('GET', 'http://example.com/user', send)
+        self.assertEqual(len(self.sleeps), 1)
+        self.assertTrue(29 < self.sleeps[0] <= 30)
+
+    def test_token_bucket(self):
+        from repose.ratelimit import TokenBucket
+        bucket = TokenBucket(rate=10, capacity=2)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertAlmostEqual(bucket.reserve(), 0.1, places=2)
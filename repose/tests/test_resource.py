@@ -11,3 +11,195 @@ class ResourceTestCase(TestCase):
                                      request_data=dict(name='New Name')):
             user.save()
 
+
+    def test_save_unchanged(self):
+        user = User(**USER_DATA)
+        user.name = 'Test User'
+        self.assertFalse(user.has_changed())
+        with self.api.assert_call('PUT', '/user/1', request_data={}):
+            user.save()
+
+    def test_save_clears_changes(self):
+        user = User(**USER_DATA)
+        user.name = 'New Name'
+        self.assertEqual(user.get_changes(), {'name': 'New Name'})
+        with self.api.assert_call('PUT', '/user/1'):
+            user.save()
+        self.assertFalse(user.has_changed())
+
+    def test_embedded_change(self):
+        user = User(**USER_DATA)
+        user.profile.age = 43
+        self.assertEqual(user.get_changes(),
+                         {'profile': {'email': 'test@example.com', 'age': 43}})
+
+    def test_collection_change(self):
+        from repose.tests import Post
+        user = User(**USER_DATA)
+        self.assertFalse(user.has_changed())
+        user.posts.all().append(Post(id=12, content='Third Comment'))
+        self.assertEqual([p['id'] for p in user.get_changes()['posts']], [10, 11, 12])
+
+    def test_list_change(self):
+        from repose import Resource, fields
+
+        class Tagged(Resource):
+            id = fields.Integer()
+            tags = fields.List()
+
+            class Meta:
+                endpoint = '/tagged/{id}'
+
+        Tagged.contribute_api(self.api)
+        tagged = Tagged(id=1, tags=['a'])
+        tagged.tags.append('b')
+        with self.api.assert_call('PUT', '/tagged/1', request_data={'tags': ['a', 'b']}):
+            tagged.save()
+        self.assertFalse(tagged.has_changed())
+
+    def test_original_recorded_on_change(self):
+        from repose import Resource, fields
+
+        class Tagged(Resource):
+            id = fields.Integer()
+            tags = fields.List()
+            options = fields.Dictionary()
+
+        tagged = Tagged(id=1, tags=['a'], options={'x': 1})
+        # Nothing is copied until a value is changed
+        self.assertEqual(tagged._original, {})
+        self.assertFalse(tagged.has_changed())
+
+        tagged.tags.sort()
+        self.assertEqual(tagged._original, {'tags': ['a']})
+        self.assertFalse(tagged.has_changed())
+        tagged.options['y'] = 2
+        self.assertEqual(tagged._original['options'], {'x': 1})
+        self.assertEqual(tagged.get_changes(), {'options': {'x': 1, 'y': 2}})
+
+        tagged._mark_saved()
+        tagged.options.pop('x')
+        self.assertEqual(tagged.get_changes(), {'options': {'y': 2}})
+
+    def test_shared_value_change(self):
+        from repose import Resource, fields
+
+        class Tagged(Resource):
+            id = fields.Integer()
+            tags = fields.List()
+
+        first = Tagged(id=1, tags=['a'])
+        second = Tagged(id=2, tags=['b'])
+        second.tags = first.tags
+        second._mark_saved()
+        first.tags.append('c')
+        self.assertEqual(first.get_changes(), {'tags': ['a', 'c']})
+        self.assertFalse(second.has_changed())
+
+    def test_unmanaged_collection_change(self):
+        from repose import Resource, fields
+        from repose.tests import Profile
+
+        class Team(Resource):
+            id = fields.Integer()
+            profiles = fields.Collection(Profile)
+
+        team = Team(id=1, profiles=[USER_DATA['profile']])
+        self.assertFalse(team.has_changed())
+        team.profiles[0].age = 43
+        self.assertEqual(team.get_changes()['profiles'][0]['age'], 43)
+
+
+class ParentTestCase(TestCase):
+
+    def test_embedded(self):
+        user = User(**USER_DATA)
+        self.assertEqual(user.profile.parent_resource.name, 'Test User')
+
+    def test_assigned(self):
+        from repose.tests import Profile
+        user = User(**USER_DATA)
+        user.profile = Profile(email='new@example.com')
+        self.assertEqual(user.profile.parent_resource.name, 'Test User')
+
+    def test_collection_linked_on_load(self):
+        from repose.utilities import make_endpoint
+        user = User(**USER_DATA)
+        self.assertFalse(user.posts.results.is_loaded())
+        post = user.posts.all()[0]
+        self.assertEqual(post.parent_resource.name, 'Test User')
+        self.assertEqual(make_endpoint(post), '/user/1/post/10')
+
+    def test_id_collection_not_fetched(self):
+        from repose import Resource, fields
+
+        class Group(Resource):
+            id = fields.Integer()
+            members = fields.ManagedIdListCollection(User)
+
+            class Meta:
+                endpoint = '/group/{group_id}'
+
+        Group.contribute_api(self.api)
+        group = Group(**Group.decode({'id': 1, 'members': [1]}))
+        self.assertEqual(self.api.requests, [])
+        self.api.add_response('GET', '/user/1', USER_DATA)
+        self.assertEqual(group.members.all()[0].parent_resource.id, 1)
+
+
+class LazyResourceTestCase(TestCase):
+
+    def setUp(self):
+        super(LazyResourceTestCase, self).setUp()
+        from repose import tests
+        from repose.tests import Profile
+
+        # Named User so that the '{user_id}' endpoint placeholder is resolved
+        class User(tests.User):
+            class Meta(tests.User.Meta):
+                lazy_decode = True
+
+        self.LazyUser = User
+        self.Profile = Profile
+
+    def test_decode_on_access(self):
+        user = self.LazyUser.from_data(USER_DATA)
+        self.assertEqual(len(user._data), 0)
+        self.assertEqual(user.name, 'Test User')
+        self.assertEqual(len(user._data), 1)
+
+    def test_embedded(self):
+        user = self.LazyUser.from_data(USER_DATA)
+        self.assertIsInstance(user.profile, self.Profile)
+        self.assertEqual(user.profile.age, 42)
+        self.assertEqual(user.profile.parent_resource.name, 'Test User')
+
+    def test_missing_field(self):
+        user = self.LazyUser.from_data({'id': 1})
+        self.assertIsNone(user.name)
+
+    def test_values(self):
+        user = self.LazyUser.from_data(USER_DATA, id=2)
+        self.assertEqual(user.id, 2)
+
+    def test_save(self):
+        self.LazyUser.contribute_api(self.api)
+        user = self.LazyUser.from_data(USER_DATA)
+        user.name = 'New Name'
+        with self.api.assert_call('PUT', '/user/1', request_data={'name': 'New Name'}):
+            user.save()
+        self.assertEqual(len(user._data), 2)
+
+    def test_list_change(self):
+        from repose import fields
+
+        class Tagged(self.LazyUser):
+            tags = fields.List()
+
+        tagged = Tagged.from_data(dict(USER_DATA, tags=['a']))
+        tagged.tags.append('b')
+        self.assertEqual(tagged.get_changes(), {'tags': ['a', 'b']})
+
+    def test_dict(self):
+        user = self.LazyUser.from_data(USER_DATA)
+        self.assertEqual(dict(user)['profile'], USER_DATA['profile'])
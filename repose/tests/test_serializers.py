@@ -0,0 +1,126 @@
+import json
+from unittest import skipIf
+
+import requests
+
+from repose.apibackend import ApiBackend
+from repose.serializers import JsonSerializer, FastJsonSerializer, MsgPackSerializer, \
+    SerializerRegistry, UnsupportedContentType, parse_content_type
+from repose.tests import TestCase
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+def make_response(content, content_type):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = content
+    response.headers['Content-Type'] = content_type
+    return response
+
+
+class FakeSession(object):
+
+    def request(self, method, url, **kwargs):
+        self.last_request = dict(kwargs, method=method, url=url)
+        return make_response(b'{}', 'application/json')
+
+
+class SerializerRegistryTestCase(TestCase):
+
+    def test_get(self):
+        fast = FastJsonSerializer()
+        registry = SerializerRegistry([fast])
+        self.assertIs(registry.get('application/json; charset=utf-8'), fast)
+        self.assertIs(registry.get('text/json'), fast)
+        self.assertIs(registry.get('application/problem+json'), fast)
+        self.assertIs(registry.get(None), fast)
+        self.assertRaises(UnsupportedContentType, registry.get, 'text/html')
+
+    def test_json_suffix_not_default(self):
+        from repose.serializers import Serializer
+
+        class OtherSerializer(Serializer):
+            content_types = ('application/x-other',)
+
+        json_serializer = JsonSerializer()
+        registry = SerializerRegistry([OtherSerializer(), json_serializer])
+        self.assertIs(registry.get('application/problem+json'), json_serializer)
+        self.assertRaises(UnsupportedContentType, registry.get, 'application/xml')
+
+    def test_parse_content_type(self):
+        self.assertEqual(parse_content_type('Application/JSON; Charset="ISO-8859-1"'),
+                         ('application/json', 'iso-8859-1'))
+        self.assertEqual(parse_content_type('application/json'), ('application/json', None))
+        self.assertEqual(parse_content_type(None), ('', None))
+
+    def test_charset(self):
+        content = u'{"name": "caf\xe9"}'.encode('latin-1')
+        for serializer in (JsonSerializer(), FastJsonSerializer()):
+            registry = SerializerRegistry([serializer])
+            self.assertEqual(registry.loads(content, 'application/json; charset=ISO-8859-1'),
+                             {'name': u'caf\xe9'})
+
+    def test_default(self):
+        registry = SerializerRegistry()
+        self.assertIsInstance(registry.default, JsonSerializer)
+
+    def test_accept_header(self):
+        registry = SerializerRegistry([JsonSerializer()])
+        registry.register(FastJsonSerializer())
+        self.assertEqual(registry.get_accept_header(),
+                         'application/json, application/json;q=0.9')
+
+    def test_fast_json_round_trip(self):
+        serializer = FastJsonSerializer()
+        data = {'a': [1, 2.5, None, True], 'b': u'é'}
+        self.assertEqual(serializer.loads(serializer.dumps(data)), data)
+
+
+class BackendSerializationTestCase(TestCase):
+
+    def test_parse_response(self):
+        backend = ApiBackend('http://example.com/api')
+        data = backend.parse_response(make_response(b'{"a": 1}', 'application/json'))
+        self.assertEqual(data, {'a': 1})
+
+    def test_parse_empty_response(self):
+        backend = ApiBackend('http://example.com/api')
+        self.assertIsNone(backend.parse_response(make_response(b'', 'application/json')))
+
+    def test_send_encodes_body(self):
+        backend = ApiBackend('http://example.com/api')
+        backend._session = FakeSession()
+        backend.send('PUT', '/user/1', json={'name': 'Test'})
+        sent = backend._session.last_request
+        self.assertEqual(json.loads(sent['data'].decode('utf8')), {'name': 'Test'})
+        self.assertEqual(sent['headers']['Content-Type'], 'application/json')
+        self.assertEqual(sent['headers']['Accept'], 'application/json')
+
+    def test_send_without_body(self):
+        backend = ApiBackend('http://example.com/api')
+        backend._session = FakeSession()
+        backend.send('GET', '/user/1')
+        sent = backend._session.last_request
+        self.assertIsNone(sent['data'])
+        self.assertNotIn('Content-Type', sent['headers'])
+
+    @skipIf(msgpack is None, 'msgpack is not installed')
+    def test_msgpack(self):
+        backend = ApiBackend('http://example.com/api',
+                             serializers=[MsgPackSerializer(), JsonSerializer()])
+        self.assertEqual(backend.serializers.get_accept_header(),
+                         'application/msgpack, application/x-msgpack, application/json;q=0.9')
+        content = msgpack.packb({'a': 1}, use_bin_type=True)
+        self.assertEqual(backend.parse_response(make_response(content, 'application/msgpack')),
+                         {'a': 1})
+        # JSON responses are still understood
+        self.assertEqual(backend.parse_response(make_response(b'{"a": 1}', 'application/json')),
+                         {'a': 1})
+        problem = make_response(b'{"title": "Bad"}', 'application/problem+json')
+        self.assertEqual(backend.parse_response(problem), {'title': 'Bad'})
+        self.assertRaises(UnsupportedContentType, backend.parse_response,
+                          make_response(b'<html></html>', 'text/html'))
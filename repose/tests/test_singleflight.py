@@ -0,0 +1,59 @@
+import threading
+import time
+from repose.tests import TestCase, USER_DATA
+
+
+class SingleFlightTestCase(TestCase):
+
+    def wait_for(self, condition):
+        for _ in range(500):
+            if condition():
+                return
+            time.sleep(0.01)
+        self.fail('Timed out')
+
+    def test_coalesce(self):
+        from repose.singleflight import SingleFlight
+        flight = SingleFlight()
+        self.api.backend.single_flight = flight
+        self.api.add_response('GET', '/user/1', USER_DATA)
+
+        release = threading.Event()
+        send = self.api.backend.send
+
+        def blocking_send(*args, **kwargs):
+            release.wait()
+            return send(*args, **kwargs)
+        self.api.backend.send = blocking_send
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.api.get('/user/1')))
+                   for _ in range(5)]
+        threads[0].start()
+        self.wait_for(lambda: flight._calls)
+        for thread in threads[1:]:
+            thread.start()
+        self.wait_for(lambda: flight.saved == 4)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(self.api.requests), 1)
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(r is results[0] for r in results))
+
+    def test_list_params(self):
+        from repose.singleflight import SingleFlight
+        self.api.backend.single_flight = SingleFlight()
+        self.api.add_response('GET', '/user?id=[1, 2]', [USER_DATA])
+        self.assertEqual(self.api.get('/user', params={'id': [1, 2]}), [USER_DATA])
+        self.assertEqual(self.api.backend.single_flight._calls, {})
+
+    def test_error(self):
+        from repose.singleflight import SingleFlight
+        flight = SingleFlight()
+
+        def fail():
+            raise ValueError()
+        self.assertRaises(ValueError, flight.do, 'key', fail)
+        self.assertEqual(flight.do('key', lambda: 1), 1)
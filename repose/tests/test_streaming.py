@@ -0,0 +1,83 @@
+import json
+
+from repose.tests import TestCase, User, USER_DATA
+
+
+class IterJsonArrayTestCase(TestCase):
+
+    def parse(self, *chunks):
+        from repose.streaming import iter_json_array
+        return list(iter_json_array(chunks))
+
+    def test_chunks(self):
+        self.assertEqual(self.parse('[1, {"a":', ' "b"}, 2', '3]'), [1, {'a': 'b'}, 23])
+
+    def test_single_characters(self):
+        text = '[{"x": [1, 2]}, "a,]", null]'
+        self.assertEqual(self.parse(*text), [{'x': [1, 2]}, 'a,]', None])
+
+    def test_split_numbers(self):
+        self.assertEqual(self.parse('[1.', '5]'), [1.5])
+        self.assertEqual(self.parse('[1e', '3]'), [1000.0])
+        self.assertEqual(self.parse('[2E', '-1, 7]'), [0.2, 7])
+        self.assertEqual(self.parse('[1, -', '4]'), [1, -4])
+        self.assertEqual(self.parse('[12', '3 ', ' ]'), [123])
+
+    def test_split_numbers_single_characters(self):
+        text = '[-1.5e2, 0.25, -7 ,3E1]'
+        self.assertEqual(self.parse(*text), [-150.0, 0.25, -7, 30.0])
+
+    def test_empty(self):
+        self.assertEqual(self.parse(' [ ] '), [])
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, self.parse, '{"a": 1}')
+        self.assertRaises(ValueError, self.parse, '[1, 2')
+
+
+class StreamingManagerTestCase(TestCase):
+
+    def test_iter(self):
+        from repose.managers import Manager
+        manager = Manager(stream=True)
+        manager.contribute_api(self.api)
+        manager.contribute_to_class(User)
+        self.api.backend.stream_chunk_size = 16
+        self.api.add_response('GET', '/user', [USER_DATA, dict(USER_DATA, id=2)])
+
+        users = iter(manager)
+        self.assertEqual(next(users).id, 1)
+        self.assertEqual(next(users).id, 2)
+        self.assertEqual(list(users), [])
+        self.assertIsNone(manager.results)
+        self.assertEqual(len(manager.all()), 2)
+
+    def test_iter_non_json_serializer(self):
+        from repose.managers import Manager
+        from repose.serializers import Serializer
+
+        class LinesSerializer(Serializer):
+            content_types = ('application/x-ndjson',)
+
+            def loads(self, content, charset=None):
+                return [json.loads(line) for line in content.decode('utf8').splitlines()]
+
+        class StreamedUser(User):
+            class Meta:
+                endpoint = '/user/{user_id}'
+                endpoint_list = '/user'
+                stream = True
+
+        self.api.backend.serializers.register(LinesSerializer(), preferred=True)
+        self.api.register_resource(StreamedUser)
+        self.api.add_response('GET', '/user', [USER_DATA, dict(USER_DATA, id=2)])
+        self.assertEqual([user.id for user in StreamedUser.objects], [1, 2])
+        self.assertEqual(self.api.backend.last_headers, {'Accept': 'application/json'})
+
+        # Parsed in full should the API not return JSON regardless
+        self.api.add_response('GET', '/user', None,
+                              headers={'Content-Type': 'application/x-ndjson'})
+        self.api.backend.responses['GET', '/user']._content = \
+            (json.dumps(USER_DATA) + '\n' + json.dumps(dict(USER_DATA, id=3))).encode('utf8')
+        StreamedUser.objects.invalidate()
+        self.assertEqual([user.id for user in StreamedUser.objects], [1, 3])
@@ -15,6 +15,33 @@ class MakeEndpointTestCase(TestCase):
         post.parent_resource = user
         self.assertEqual(make_endpoint(post), '/user/1/post/10')
 
+    def test_endpoint_template(self):
+        template = Post.get_endpoint_template()
+        self.assertEqual(template.placeholders, ('user_id', 'post_id'))
+        self.assertIs(template, Post.get_endpoint_template())
+        self.assertEqual(Post.get_endpoint_template('endpoint_list').placeholders, ('user_id',))
+
+    def test_make_endpoint_values(self):
+        from repose.utilities import make_endpoint
+
+        class CustomUser(User):
+            def get_endpoint_values(self):
+                return {'user_id': 'me'}
+
+        user = CustomUser(**USER_DATA)
+        self.assertEqual(make_endpoint(user), '/user/me')
+
+    def test_get_values_from_endpoint(self):
+        from repose import Resource, fields
+        from repose.utilities import get_values_from_endpoint
+
+        class Setting(Resource):
+            id = fields.String(from_endpoint='setting_id')
+            value = fields.String()
+
+        values = get_values_from_endpoint(Setting, {'setting_id': 'theme', 'user_id': 1})
+        self.assertEqual(values, {'setting_id': 'theme'})
+
 
 class LazyListTestCase(TestCase):
 
@@ -83,3 +110,80 @@ class LazyListTestCase(TestCase):
         post1, post2 = resources
         self.assertEqual(post1.parent_resource.name, parent.name)
         self.assertEqual(post2.parent_resource.name, parent.name)
+
+
+class WindowedLazyListTestCase(TestCase):
+
+    def setUp(self):
+        super(WindowedLazyListTestCase, self).setUp()
+        from repose.utilities import LazyList
+        self.calls = []
+
+        def loader(start, stop):
+            self.calls.append((start, stop))
+            return list(range(start, stop))
+
+        self.list = LazyList(loader=loader, size=10, window=3, prefetch=False)
+
+    def test_len(self):
+        self.assertEqual(len(self.list), 10)
+        self.assertEqual(self.calls, [])
+
+    def test_get_item(self):
+        self.assertEqual(self.list[1], 1)
+        self.assertEqual(self.list[2], 2)
+        self.assertEqual(self.calls, [(1, 4)])
+        self.assertFalse(self.list.is_loaded())
+
+    def test_negative_index(self):
+        self.assertEqual(self.list[-1], 9)
+        self.assertEqual(self.calls, [(9, 10)])
+
+    def test_index_error(self):
+        with self.assertRaises(IndexError):
+            self.list[10]
+
+    def test_slice(self):
+        self.list[4]
+        self.assertEqual(self.list[2:8], [2, 3, 4, 5, 6, 7])
+        self.assertEqual(self.calls, [(4, 7), (2, 4), (7, 8)])
+
+    def test_iterate(self):
+        self.assertEqual(list(self.list), list(range(10)))
+        self.assertEqual(self.calls, [(0, 3), (3, 6), (6, 9), (9, 10)])
+        self.assertTrue(self.list.is_loaded())
+
+    def test_iterate_prefetch(self):
+        self.list.prefetch = True
+        self.assertEqual(list(self.list), list(range(10)))
+        self.assertEqual(self.calls, [(0, 3), (3, 6), (6, 9), (9, 10)])
+
+    def test_prefetch_not_reloaded(self):
+        self.list.prefetch = True
+        iterator = iter(self.list)
+        self.assertEqual(next(iterator), 0)
+        # Items 3 to 5 are being loaded in the background
+        self.assertEqual(self.list[4], 4)
+        self.assertEqual(list(iter(self.list)), list(range(10)))
+        self.assertEqual(list(iterator), list(range(1, 10)))
+        # Each item is requested only once
+        self.assertEqual(sum(stop - start for start, stop in self.calls), 10)
+        self.assertIn((3, 6), self.calls)
+
+    def test_modify(self):
+        self.list[0]
+        self.list.append(10)
+        self.assertEqual(self.calls, [(0, 3), (3, 10)])
+        self.assertEqual(len(self.list), 11)
+        self.assertTrue(self.list.has_changed())
+
+    def test_short_result(self):
+        from repose.utilities import LazyList
+        lazy_list = LazyList(loader=lambda start, stop: [1], size=3)
+        self.assertEqual(list(lazy_list), [1, None, None])
+
+    def test_generator(self):
+        from repose.utilities import LazyList
+        lazy_list = LazyList((x for x in range(10)), size=10, window=2)
+        self.assertEqual(lazy_list[1], 1)
+        self.assertEqual(list(lazy_list.iter_loaded()), [0, 1])
@@ -4,7 +4,11 @@
 mainly for internal purposes.*
 """
 
+import re
+import weakref
 from collections import MutableSequence
+from concurrent.futures import ThreadPoolExecutor
+from string import Formatter
 
 
 def make_endpoint(model):
@@ -13,21 +17,7 @@ def make_endpoint(model):
     See the :class:`repose.resources.Resource.Meta` for a description
     of endpoint URL formatting.
     """
-    parent = model.parent_resource
-    models = [model]
-    while parent:
-        models.append(parent)
-        parent = parent.parent_resource
-
-    values = {}
-    for inst in models:
-        for k in inst._fields:
-            values['{}_{}'.format(inst.__class__.__name__.lower(), k)] = getattr(inst, k)
-            if inst is model:
-                values[k] = getattr(inst, k)
-
-    values.update(**model.get_endpoint_values())
-    return model.Meta.endpoint.format(**values)
+    return model.get_endpoint_template().render(model)
 
 
 def get_values_from_endpoint(resource, endpoint_params):
@@ -49,55 +39,439 @@ def get_values_from_endpoint(resource, endpoint_params):
             to the endpoint strings.
 
     """
-    values = {}
-    for k, v in resource._fields.items():
-        field = v.options.get('from_endpoint')
-        if field:
-            values[field] = endpoint_params[field]
-    return values
+    return dict((param, endpoint_params[param]) for param in resource._from_endpoint_params)
+
+
+def make_params_key(params):
+    """Get a hashable key for a dictionary of URL params
+
+    List values (sent as a repeated param, Eg: ``?id=1&id=2``)
+    are converted to tuples.
+
+    Returns:
+
+        tuple: The ``(name, value)`` of each param, sorted by name
+    """
+    return tuple(sorted(
+        (name, tuple(value) if isinstance(value, (list, tuple)) else value)
+        for name, value in (params or {}).items()
+    ))
+
+
+def weak_proxy(obj):
+    """Get a :func:`weakref.proxy` to the object, unless it is already one
+    """
+    if isinstance(obj, weakref.ProxyTypes):
+        return obj
+    return weakref.proxy(obj)
+
+
+class Endpoint(str):
+    """ A rendered endpoint, which remembers the template it was rendered from
+
+    Used wherever a ``str`` endpoint is expected. This allows requests to
+    be reported by template, see :mod:`repose.metrics`.
+
+    Attributes:
+
+        template (str): The endpoint template (Eg: ``"/user/{user_id}"``)
+        resource (type): The :class:`~repose.resources.Resource` class, or ``None``
+    """
+
+    def __new__(cls, value, template=None, resource=None):
+        endpoint = super(Endpoint, cls).__new__(cls, value)
+        endpoint.template = value if template is None else template
+        endpoint.resource = resource
+        return endpoint
+
+
+class EndpointTemplate(object):
+    """ An endpoint string, parsed once so that it can be rendered quickly
+
+    Each placeholder is resolved to either a field of the resource
+    (``{fieldname}`` or ``{resourcename_fieldname}``), or a field of
+    one of its parent resources (``{parentname_fieldname}``).
+    See :class:`repose.resources.Resource.Meta`.
+
+    Attributes:
+
+        source (str): The endpoint string
+        resource (type): The :class:`~repose.resources.Resource` class
+            to which the endpoint belongs
+        placeholders (tuple[str]): The names of the placeholders used
+    """
+
+    def __init__(self, source, resource=None):
+        self.source = source
+        self.resource = resource
+        placeholders = []
+        for _, name, _, _ in Formatter().parse(source or ''):
+            if name:
+                name = re.split(r'[.\[]', name)[0]
+                if name not in placeholders:
+                    placeholders.append(name)
+        self.placeholders = tuple(placeholders)
+        # Every possible resourcename/fieldname pair for each placeholder
+        self._splits = dict(
+            (name, dict((name[:i], name[i + 1:])
+                        for i, c in enumerate(name) if c == '_'))
+            for name in self.placeholders
+        )
+
+    def format(self, **values):
+        """ Render the endpoint using the given placeholder values
+
+        Returns:
+
+            Endpoint:
+        """
+        return Endpoint(self.source.format(**values), self.source, self.resource)
+
+    def render(self, model):
+        """ Render the endpoint using the values of the model and its parents
+
+        Args:
+
+            model (Resource): The resource instance
+
+        Returns:
+
+            Endpoint:
+        """
+        values = dict(model.get_endpoint_values())
+        return self._render(values, self._get_chain(model), model)
+
+    def render_for_parent(self, parent):
+        """ Render the endpoint of a resource belonging to ``parent``
+
+        Only the values of the parent and its own parents are used.
+        For example, to render the list endpoint of a managed collection.
+
+        Args:
+
+            parent (Resource): The parent resource instance
+
+        Returns:
+
+            Endpoint:
+        """
+        return self._render({}, self._get_chain(parent))
+
+    def _get_chain(self, model):
+        chain = []
+        parent = model.parent_resource
+        while parent:
+            chain.append(parent)
+            parent = parent.parent_resource
+        # The most distant parent takes precedence, followed by nearer
+        # parents and then the model itself
+        chain.reverse()
+        chain.append(model)
+        return chain
+
+    def _render(self, values, chain, model=None):
+        for name in self.placeholders:
+            if name in values:
+                continue
+            splits = self._splits[name]
+            for inst in chain:
+                field = splits.get(inst.__class__._endpoint_name)
+                if field in inst._fields:
+                    values[name] = getattr(inst, field)
+                    break
+            else:
+                if model is not None and name in model._fields:
+                    values[name] = getattr(model, name)
+        return self.format(**values)
+
+
+def concurrent_map(fn, items, max_workers=10):
+    """Call ``fn`` for each item using a bounded pool of threads
+
+    Args:
+
+        fn (callable): The function to call for each item
+        items (list): The items to be passed to ``fn``
+        max_workers (int): The maximum number of concurrent calls
+
+    Returns:
+
+        list: The return values of ``fn``, in the same order as ``items``.
+            The first exception raised by ``fn`` (if any) is re-raised.
+    """
+    items = list(items)
+    if len(items) <= 1 or max_workers <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(fn, items))
+
+
+_MISSING = object()
 
 
 class LazyList(MutableSequence):
-    """ Wraps a generator from which data is only loaded when needed.
+    """ A list whose items are only loaded when needed.
+
+    Items are provided either by a generator, which is read as far as
+    is needed, or by a ``loader`` function which can load any range of
+    items. In either case only the items requested (plus a read-ahead
+    :attr:`window`) are loaded. For example, ``lazy[0]`` with a window of
+    20 loads the first 20 items, and ``lazy[100:110]`` using a loader
+    loads items 100 to 119.
 
-    .. todo:: The :class:`LazyList` loading logic could be more intelligent
+    When iterating over a list with a loader the next window of items
+    is loaded in the background while the current one is being
+    processed. Items already being loaded in the background are never
+    requested again. The list is fully loaded before it is modified.
+
+    Attributes:
+
+        loader (callable): The ``loader`` passed to :func:`__init__`, or ``None``
+        window (int): The minimum number of items to load at once
+        prefetch (bool): Load the next window in the background when
+            iterating (requires a loader)
 
     .. todo:: Make the size parameter optional
     """
+    window = 20
+    prefetch = True
 
-    def __init__(self, generator=None, size=0):
+    def __init__(self, generator=None, size=0, loader=None, window=None, prefetch=None):
         """ Initialise the LazyList
 
         Args:
 
-            generator (generator): The generator to be lazy loaded
+            generator (iterable): The generator to be lazy loaded
             size (int): The size of the list to be loaded
+            loader (callable): Used in place of ``generator``. Called as
+                ``loader(start, stop)`` and must return the items in that
+                range. Any items missing from the end of the returned list
+                will be ``None``.
+            window (int): Overrides :attr:`window`
+            prefetch (bool): Overrides :attr:`prefetch`
         """
-        self._generator = [] if generator is None else generator
+        self._generator = iter([] if generator is None else generator)
+        self.loader = loader
         self._size = size
         self._changed = False
+        self._items = [_MISSING] * size if loader else []
+        self._num_missing = size
+        # The (start, stop, future) of each range being loaded in the background
+        self._pending = []
+        if window is not None:
+            self.window = window
+        if prefetch is not None:
+            self.prefetch = prefetch
+        if loader and not size:
+            self._values = self._items
 
     def set_parent_lazy(self, parent):
         self.parent = parent
-        if self.is_loaded():
-            self._set_parent()
+        self._set_parent(self.iter_loaded())
 
     def is_loaded(self):
+        """ Have all the items been loaded?
+        """
         return hasattr(self, '_values')
 
+    def iter_loaded(self):
+        """ Iterate over the items which have been loaded so far, without loading any more
+        """
+        return (item for item in self._items if item is not _MISSING)
+
+    def set_loaded(self, items):
+        """ Provide all the items which have not yet been loaded,
+        Eg: once they have been fetched in bulk
+
+        Args:
+
+            items (list): Every item in the list. Those already loaded are kept.
+        """
+        if self.is_loaded():
+            return
+        if self.loader is None:
+            self._generator = iter(list(items)[len(self._items):])
+            self._load()
+        else:
+            self._store(0, self._size, items)
+
     def has_changed(self):
         return self._changed
 
-    def _set_parent(self):
-        for v in self._values:
-            if hasattr(v, 'contribute_parents'):
-                v.contribute_parents(self.parent)
+    def set_unchanged(self):
+        """ Clear the changed flag, Eg: once the list has been saved
+        """
+        self._changed = False
+
+    def _set_parent(self, items):
+        if hasattr(self, 'parent'):
+            for v in items:
+                if hasattr(v, 'contribute_parents'):
+                    v.contribute_parents(self.parent)
 
     def _load(self):
-        if not self.is_loaded():
-            self._values = list(self._generator)
-            if hasattr(self, 'parent'):
-                self._set_parent()
+        """ Load all remaining items
+        """
+        if self.is_loaded():
+            return
+        if self.loader is None:
+            items = list(self._generator)
+            self._set_parent(items)
+            self._items.extend(items)
+            self._values = self._items
+        else:
+            self._ensure(0, self._size, window=0)
+
+    def _ensure(self, start, stop, window=None):
+        """ Load any of the items in ``start:stop`` which have not yet been
+        loaded, reading ahead to fill the window
+        """
+        start = max(start, 0)
+        if self.is_loaded() or stop <= start:
+            return
+        window = self.window if window is None else window
+        if self.loader is None:
+            if stop <= len(self._items):
+                return
+            stop = max(stop, len(self._items) + window)
+            while len(self._items) < stop:
+                try:
+                    item = next(self._generator)
+                except StopIteration:
+                    self._values = self._items
+                    return
+                self._set_parent([item])
+                self._items.append(item)
+        else:
+            stop = min(stop, self._size)
+            run = self._next_missing(start, stop)
+            if not run:
+                return
+            start, stop = run[0], min(max(stop, run[0] + window), self._size)
+            while True:
+                run = self._next_missing(start, stop)
+                if run is None:
+                    return
+                pending = self._find_pending(*run)
+                if pending is not None and pending[0] <= run[0]:
+                    # Already being loaded, so wait for it
+                    self._collect(pending)
+                    continue
+                if pending is not None:
+                    run = run[0], pending[0]
+                self._store(run[0], run[1], self.loader(*run))
+                start = run[1]
+
+    def _find_pending(self, start, stop):
+        """ Find the first range being loaded in the background which overlaps ``start:stop``
+
+        Returns:
+
+            tuple: ``(start, stop, future)``, or ``None`` if there is none
+        """
+        overlapping = [p for p in self._pending if p[0] < stop and p[1] > start]
+        return min(overlapping, key=lambda p: p[0]) if overlapping else None
+
+    def _collect(self, pending):
+        """ Wait for a range being loaded in the background, and store its items
+        """
+        self._pending.remove(pending)
+        self._store(pending[0], pending[1], pending[2].result())
+
+    def _next_unclaimed(self, start, stop):
+        """ Find the first range within ``start:stop`` which is neither loaded
+        nor being loaded in the background
+
+        Returns:
+
+            tuple: ``(start, stop)``, or ``None`` if there is none
+        """
+        while True:
+            run = self._next_missing(start, stop)
+            if run is None:
+                return None
+            pending = self._find_pending(*run)
+            if pending is None:
+                return run
+            if pending[0] > run[0]:
+                return run[0], pending[0]
+            start = pending[1]
+
+    def _next_missing(self, start, stop):
+        """ Find the first range of items within ``start:stop`` which are not loaded
+
+        Returns:
+
+            tuple: ``(start, stop)``, or ``None`` if all are loaded
+        """
+        items = self._items
+        while start < stop and items[start] is not _MISSING:
+            start += 1
+        if start >= stop:
+            return None
+        end = start + 1
+        while end < stop and items[end] is _MISSING:
+            end += 1
+        return start, end
+
+    def _store(self, start, stop, items):
+        """ Store the items returned by the loader, unless already loaded
+        """
+        items = list(items)[:stop - start]
+        items.extend([None] * (stop - start - len(items)))
+        stored = []
+        for i, item in enumerate(items, start):
+            if self._items[i] is _MISSING:
+                self._items[i] = item
+                stored.append(item)
+        self._set_parent(stored)
+        self._num_missing -= len(stored)
+        if not self._num_missing:
+            self._values = self._items
+
+    def __iter__(self):
+        if self.loader is None or not self.prefetch or self.is_loaded():
+            i = 0
+            while True:
+                try:
+                    item = self[i]
+                except IndexError:
+                    return
+                yield item
+                i += 1
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        pending = None
+        horizon = 0
+        try:
+            i = 0
+            while i < len(self):
+                if self._items[i] is _MISSING:
+                    # Waits for the items if already being loaded in the background
+                    self._ensure(i, i + 1)
+                if pending is not None and pending not in self._pending:
+                    pending = None
+                horizon = max(horizon, i + 1)
+                if pending is None and horizon - i <= self.window and horizon < self._size:
+                    # Load the next window in the background
+                    run = self._next_unclaimed(horizon, min(i + 1 + self.window, self._size))
+                    if run:
+                        run = self._next_unclaimed(run[0], min(run[0] + self.window, self._size))
+                        pending = run + (executor.submit(self.loader, *run),)
+                        self._pending.append(pending)
+                        horizon = run[1]
+                    else:
+                        horizon = min(i + 1 + self.window, self._size)
+                yield self._items[i]
+                i += 1
+        finally:
+            if pending in self._pending and pending[2].done():
+                if pending[2].exception():
+                    self._pending.remove(pending)
+                else:
+                    self._collect(pending)
+            # Otherwise it is left to be collected once the items are needed
+            executor.shutdown(wait=False)
 
     def __len__(self):
         if self.is_loaded():
@@ -106,8 +480,37 @@ class LazyList(MutableSequence):
             return self._size
 
     def __getitem__(self, index):
-        self._load()
-        return self._values[index]
+        if not self.is_loaded():
+            needed = self._get_range(index)
+            if needed is None:
+                self._load()
+            else:
+                self._ensure(*needed)
+        if self.is_loaded():
+            return self._values[index]
+        return self._items[index]
+
+    def _get_range(self, index):
+        """ Get the ``(start, stop)`` of the items needed for an index or slice
+
+        Returns ``None`` if all the items are needed (Eg: negative
+        indices when the items are read from a generator)
+        """
+        if isinstance(index, slice):
+            if self.loader:
+                start, stop, step = index.indices(self._size)
+                if step < 0:
+                    start, stop = stop + 1, start + 1
+                return start, stop
+            start, stop, step = index.start or 0, index.stop, index.step or 1
+            if start < 0 or stop is None or stop < 0 or step < 0:
+                return None
+            return start, stop
+        if index < 0:
+            if self.loader:
+                return index + self._size, index + self._size + 1
+            return None
+        return index, index + 1
 
     def __setitem__(self, index, value):
         self._load()
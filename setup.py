@@ -29,5 +29,11 @@ setup(
         'booby==0.7.0',
         'requests==2.7.0',
         'six',
+        'futures; python_version < "3.0"',
     ],
+    extras_require={
+        'async': ['aiohttp'],
+        'msgpack': ['msgpack'],
+        'fast': ['orjson; python_version >= "3.6"', 'ujson; python_version < "3.6"'],
+    },
 )